@@ -34,15 +34,24 @@ def gantt_sandbox(
     holding_area: Optional[List[Dict[str, Any]]] = None,
     config: Optional[Dict[str, Any]] = None,
     height: int = 800,
+    resync: int = 0,
     key: str = "gantt_sandbox",
 ) -> Optional[Dict[str, Any]]:
     """Mount the React Gantt sandbox component.
 
-    Returns None until the first user interaction, then a dict with:
+    Returns None until the component first reports back, then a dict with:
+      - seq: push counter, increasing across pushes
+      - kpis: {changeovers, makespan_h, orders_met, orders_total,
+        adherence_pct} for the pushed state, as shown in the KPI bar
+      - lastAction: description of last user action
+    plus either a full snapshot (``full`` set):
       - schedule: updated schedule blocks
       - cipWindows: updated CIP blocks
       - holdingArea: blocks moved to holding
-      - lastAction: description of last user action
+    or the changes since push ``base``:
+      - ops: [{type: "upsert", list, block} | {type: "remove", list, id}]
+
+    Bump *resync* to make the component send a full snapshot next.
     """
     state = _component_func(
         schedule=schedule,
@@ -59,6 +68,7 @@ def gantt_sandbox(
             "horizon_hours": 336,
         },
         height=height,
+        resync=resync,
         key=key,
         default=None,
     )
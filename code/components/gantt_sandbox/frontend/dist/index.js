@@ -41,4 +41,4 @@ Error generating stack: `+i.message+`
     To pick up a draggable item, press the space bar.
     While dragging, use the arrow keys to move the item.
     Press space again to drop the item in its new position, or press escape to cancel.
-  `},hf={onDragStart(l){let{active:s}=l;return"Picked up draggable item "+s.id+"."},onDragOver(l){let{active:s,over:u}=l;return u?"Draggable item "+s.id+" was moved over droppable area "+u.id+".":"Draggable item "+s.id+" is no longer over a droppable area."},onDragEnd(l){let{active:s,over:u}=l;return u?"Draggable item "+s.id+" was dropped over droppable area "+u.id:"Draggable item "+s.id+" was dropped."},onDragCancel(l){let{active:s}=l;return"Dragging was cancelled. Draggable item "+s.id+" was dropped."}};function vf(l){let{announcements:s=hf,container:u,hiddenTextDescribedById:c,screenReaderInstructions:d=pf}=l;const{announce:p,announcement:m}=cf(),v=jl("DndLiveRegion"),[g,_]=x.useState(!1);if(x.useEffect(()=>{_(!0)},[]),df(x.useMemo(()=>({onDragStart(R){let{active:T}=R;p(s.onDragStart({active:T}))},onDragMove(R){let{active:T,over:U}=R;s.onDragMove&&p(s.onDragMove({active:T,over:U}))},onDragOver(R){let{active:T,over:U}=R;p(s.onDragOver({active:T,over:U}))},onDragEnd(R){let{active:T,over:U}=R;p(s.onDragEnd({active:T,over:U}))},onDragCancel(R){let{active:T,over:U}=R;p(s.onDragCancel({active:T,over:U}))}}),[p,s])),!g)return null;const D=Ae.createElement(Ae.Fragment,null,Ae.createElement(sf,{id:c,value:d.draggable}),Ae.createElement(af,{id:v,announcement:m}));return u?Lr.createPortal(D,u):D}var He;(function(l){l.DragStart="dragStart",l.DragMove="dragMove",l.DragEnd="dragEnd",l.DragCancel="dragCancel",l.DragOver="dragOver",l.RegisterDroppable="registerDroppable",l.SetDroppableDisabled="setDroppableDisabled",l.UnregisterDroppable="unregisterDroppable"})(He||(He={}));function Al(){}function mf(l,s){return x.useMemo(()=>({sensor:l,options:s??{}}),[l,s])}function gf(){for(var l=arguments.length,s=new Array(l),u=0;u<l;u++)s[u]=arguments[u];return x.useMemo(()=>[...s].filter(c=>c!=null),[...s])}const It=Object.freeze({x:0,y:0});function yf(l,s){const u=Il(l);if(!u)return"0 0";const c={x:(u.x-s.left)/s.width*100,y:(u.y-s.top)/s.height*100};return c.x+"% "+c.y+"%"}function wf(l,s){let{data:{value:u}}=l,{data:{value:c}}=s;return c-u}function xf(l,s){if(!l||l.length===0)return null;const[u]=l;return u[s]}function Sf(l,s){const u=Math.max(s.top,l.top),c=Math.max(s.left,l.left),d=Math.min(s.left+s.width,l.left+l.width),p=Math.min(s.top+s.height,l.top+l.height),m=d-c,v=p-u;if(c<d&&u<p){const g=s.width*s.height,_=l.width*l.height,D=m*v,R=D/(g+_-D);return Number(R.toFixed(4))}return 0}const kf=l=>{let{collisionRect:s,droppableRects:u,droppableContainers:c}=l;const d=[];for(const p of c){const{id:m}=p,v=u.get(m);if(v){const g=Sf(v,s);g>0&&d.push({id:m,data:{droppableContainer:p,value:g}})}}return d.sort(wf)};function Cf(l,s,u){return{...l,scaleX:s&&u?s.width/u.width:1,scaleY:s&&u?s.height/u.height:1}}function Ts(l,s){return l&&s?{x:l.left-s.left,y:l.top-s.top}:It}function Ef(l){return function(u){for(var c=arguments.length,d=new Array(c>1?c-1:0),p=1;p<c;p++)d[p-1]=arguments[p];return d.reduce((m,v)=>({...m,top:m.top+l*v.y,bottom:m.bottom+l*v.y,left:m.left+l*v.x,right:m.right+l*v.x}),{...u})}}const _f=Ef(1);function Ps(l){if(l.startsWith("matrix3d(")){const s=l.slice(9,-1).split(/, /);return{x:+s[12],y:+s[13],scaleX:+s[0],scaleY:+s[5]}}else if(l.startsWith("matrix(")){const s=l.slice(7,-1).split(/, /);return{x:+s[4],y:+s[5],scaleX:+s[0],scaleY:+s[3]}}return null}function Rf(l,s,u){const c=Ps(s);if(!c)return l;const{scaleX:d,scaleY:p,x:m,y:v}=c,g=l.left-m-(1-d)*parseFloat(u),_=l.top-v-(1-p)*parseFloat(u.slice(u.indexOf(" ")+1)),D=d?l.width/d:l.width,R=p?l.height/p:l.height;return{width:D,height:R,top:_,right:g+D,bottom:_+R,left:g}}const Df={ignoreTransform:!1};function Ar(l,s){s===void 0&&(s=Df);let u=l.getBoundingClientRect();if(s.ignoreTransform){const{transform:_,transformOrigin:D}=ut(l).getComputedStyle(l);_&&(u=Rf(u,_,D))}const{top:c,left:d,width:p,height:m,bottom:v,right:g}=u;return{top:c,left:d,width:p,height:m,bottom:v,right:g}}function zs(l){return Ar(l,{ignoreTransform:!0})}function Nf(l){const s=l.innerWidth,u=l.innerHeight;return{top:0,left:0,right:s,bottom:u,width:s,height:u}}function Tf(l,s){return s===void 0&&(s=ut(l).getComputedStyle(l)),s.position==="fixed"}function Pf(l,s){s===void 0&&(s=ut(l).getComputedStyle(l));const u=/(auto|scroll|overlay)/;return["overflow","overflowX","overflowY"].some(d=>{const p=s[d];return typeof p=="string"?u.test(p):!1})}function gi(l,s){const u=[];function c(d){if(s!=null&&u.length>=s||!d)return u;if(hi(d)&&d.scrollingElement!=null&&!u.includes(d.scrollingElement))return u.push(d.scrollingElement),u;if(!Mr(d)||_s(d)||u.includes(d))return u;const p=ut(l).getComputedStyle(d);return d!==l&&Pf(d,p)&&u.push(d),Tf(d,p)?u:c(d.parentNode)}return l?c(l):u}function Ls(l){const[s]=gi(l,1);return s??null}function yi(l){return!Pl||!l?null:er(l)?l:pi(l)?hi(l)||l===tr(l).scrollingElement?window:Mr(l)?l:null:null}function Ms(l){return er(l)?l.scrollX:l.scrollLeft}function js(l){return er(l)?l.scrollY:l.scrollTop}function wi(l){return{x:Ms(l),y:js(l)}}var Qe;(function(l){l[l.Forward=1]="Forward",l[l.Backward=-1]="Backward"})(Qe||(Qe={}));function Os(l){return!Pl||!l?!1:l===document.scrollingElement}function Is(l){const s={x:0,y:0},u=Os(l)?{height:window.innerHeight,width:window.innerWidth}:{height:l.clientHeight,width:l.clientWidth},c={x:l.scrollWidth-u.width,y:l.scrollHeight-u.height},d=l.scrollTop<=s.y,p=l.scrollLeft<=s.x,m=l.scrollTop>=c.y,v=l.scrollLeft>=c.x;return{isTop:d,isLeft:p,isBottom:m,isRight:v,maxScroll:c,minScroll:s}}const zf={x:.2,y:.2};function Lf(l,s,u,c,d){let{top:p,left:m,right:v,bottom:g}=u;c===void 0&&(c=10),d===void 0&&(d=zf);const{isTop:_,isBottom:D,isLeft:R,isRight:T}=Is(l),U={x:0,y:0},q={x:0,y:0},M={height:s.height*d.y,width:s.width*d.x};return!_&&p<=s.top+M.height?(U.y=Qe.Backward,q.y=c*Math.abs((s.top+M.height-p)/M.height)):!D&&g>=s.bottom-M.height&&(U.y=Qe.Forward,q.y=c*Math.abs((s.bottom-M.height-g)/M.height)),!T&&v>=s.right-M.width?(U.x=Qe.Forward,q.x=c*Math.abs((s.right-M.width-v)/M.width)):!R&&m<=s.left+M.width&&(U.x=Qe.Backward,q.x=c*Math.abs((s.left+M.width-m)/M.width)),{direction:U,speed:q}}function Mf(l){if(l===document.scrollingElement){const{innerWidth:p,innerHeight:m}=window;return{top:0,left:0,right:p,bottom:m,width:p,height:m}}const{top:s,left:u,right:c,bottom:d}=l.getBoundingClientRect();return{top:s,left:u,right:c,bottom:d,width:l.clientWidth,height:l.clientHeight}}function As(l){return l.reduce((s,u)=>nr(s,wi(u)),It)}function jf(l){return l.reduce((s,u)=>s+Ms(u),0)}function Of(l){return l.reduce((s,u)=>s+js(u),0)}function Fs(l,s){if(s===void 0&&(s=Ar),!l)return;const{top:u,left:c,bottom:d,right:p}=s(l);Ls(l)&&(d<=0||p<=0||u>=window.innerHeight||c>=window.innerWidth)&&l.scrollIntoView({block:"center",inline:"center"})}const If=[["x",["left","right"],jf],["y",["top","bottom"],Of]];class xi{constructor(s,u){this.rect=void 0,this.width=void 0,this.height=void 0,this.top=void 0,this.bottom=void 0,this.right=void 0,this.left=void 0;const c=gi(u),d=As(c);this.rect={...s},this.width=s.width,this.height=s.height;for(const[p,m,v]of If)for(const g of m)Object.defineProperty(this,g,{get:()=>{const _=v(c),D=d[p]-_;return this.rect[g]+D},enumerable:!0});Object.defineProperty(this,"rect",{enumerable:!1})}}class Fr{constructor(s){this.target=void 0,this.listeners=[],this.removeAll=()=>{this.listeners.forEach(u=>{var c;return(c=this.target)==null?void 0:c.removeEventListener(...u)})},this.target=s}add(s,u,c){var d;(d=this.target)==null||d.addEventListener(s,u,c),this.listeners.push([s,u,c])}}function Af(l){const{EventTarget:s}=ut(l);return l instanceof s?l:tr(l)}function Si(l,s){const u=Math.abs(l.x),c=Math.abs(l.y);return typeof s=="number"?Math.sqrt(u**2+c**2)>s:"x"in s&&"y"in s?u>s.x&&c>s.y:"x"in s?u>s.x:"y"in s?c>s.y:!1}var Dt;(function(l){l.Click="click",l.DragStart="dragstart",l.Keydown="keydown",l.ContextMenu="contextmenu",l.Resize="resize",l.SelectionChange="selectionchange",l.VisibilityChange="visibilitychange"})(Dt||(Dt={}));function Bs(l){l.preventDefault()}function Ff(l){l.stopPropagation()}var _e;(function(l){l.Space="Space",l.Down="ArrowDown",l.Right="ArrowRight",l.Left="ArrowLeft",l.Up="ArrowUp",l.Esc="Escape",l.Enter="Enter",l.Tab="Tab"})(_e||(_e={}));const Us={start:[_e.Space,_e.Enter],cancel:[_e.Esc],end:[_e.Space,_e.Enter,_e.Tab]},Bf=(l,s)=>{let{currentCoordinates:u}=s;switch(l.code){case _e.Right:return{...u,x:u.x+25};case _e.Left:return{...u,x:u.x-25};case _e.Down:return{...u,y:u.y+25};case _e.Up:return{...u,y:u.y-25}}};class Ws{constructor(s){this.props=void 0,this.autoScrollEnabled=!1,this.referenceCoordinates=void 0,this.listeners=void 0,this.windowListeners=void 0,this.props=s;const{event:{target:u}}=s;this.props=s,this.listeners=new Fr(tr(u)),this.windowListeners=new Fr(ut(u)),this.handleKeyDown=this.handleKeyDown.bind(this),this.handleCancel=this.handleCancel.bind(this),this.attach()}attach(){this.handleStart(),this.windowListeners.add(Dt.Resize,this.handleCancel),this.windowListeners.add(Dt.VisibilityChange,this.handleCancel),setTimeout(()=>this.listeners.add(Dt.Keydown,this.handleKeyDown))}handleStart(){const{activeNode:s,onStart:u}=this.props,c=s.node.current;c&&Fs(c),u(It)}handleKeyDown(s){if(mi(s)){const{active:u,context:c,options:d}=this.props,{keyboardCodes:p=Us,coordinateGetter:m=Bf,scrollBehavior:v="smooth"}=d,{code:g}=s;if(p.end.includes(g)){this.handleEnd(s);return}if(p.cancel.includes(g)){this.handleCancel(s);return}const{collisionRect:_}=c.current,D=_?{x:_.left,y:_.top}:It;this.referenceCoordinates||(this.referenceCoordinates=D);const R=m(s,{active:u,context:c.current,currentCoordinates:D});if(R){const T=Ol(R,D),U={x:0,y:0},{scrollableAncestors:q}=c.current;for(const M of q){const j=s.code,{isTop:ne,isRight:re,isLeft:Q,isBottom:K,maxScroll:le,minScroll:oe}=Is(M),Z=Mf(M),A={x:Math.min(j===_e.Right?Z.right-Z.width/2:Z.right,Math.max(j===_e.Right?Z.left:Z.left+Z.width/2,R.x)),y:Math.min(j===_e.Down?Z.bottom-Z.height/2:Z.bottom,Math.max(j===_e.Down?Z.top:Z.top+Z.height/2,R.y))},F=j===_e.Right&&!re||j===_e.Left&&!Q,b=j===_e.Down&&!K||j===_e.Up&&!ne;if(F&&A.x!==R.x){const $=M.scrollLeft+T.x,te=j===_e.Right&&$<=le.x||j===_e.Left&&$>=oe.x;if(te&&!T.y){M.scrollTo({left:$,behavior:v});return}te?U.x=M.scrollLeft-$:U.x=j===_e.Right?M.scrollLeft-le.x:M.scrollLeft-oe.x,U.x&&M.scrollBy({left:-U.x,behavior:v});break}else if(b&&A.y!==R.y){const $=M.scrollTop+T.y,te=j===_e.Down&&$<=le.y||j===_e.Up&&$>=oe.y;if(te&&!T.x){M.scrollTo({top:$,behavior:v});return}te?U.y=M.scrollTop-$:U.y=j===_e.Down?M.scrollTop-le.y:M.scrollTop-oe.y,U.y&&M.scrollBy({top:-U.y,behavior:v});break}}this.handleMove(s,nr(Ol(R,this.referenceCoordinates),U))}}}handleMove(s,u){const{onMove:c}=this.props;s.preventDefault(),c(u)}handleEnd(s){const{onEnd:u}=this.props;s.preventDefault(),this.detach(),u()}handleCancel(s){const{onCancel:u}=this.props;s.preventDefault(),this.detach(),u()}detach(){this.listeners.removeAll(),this.windowListeners.removeAll()}}Ws.activators=[{eventName:"onKeyDown",handler:(l,s,u)=>{let{keyboardCodes:c=Us,onActivation:d}=s,{active:p}=u;const{code:m}=l.nativeEvent;if(c.start.includes(m)){const v=p.activatorNode.current;return v&&l.target!==v?!1:(l.preventDefault(),d==null||d({event:l.nativeEvent}),!0)}return!1}}];function Hs(l){return!!(l&&"distance"in l)}function $s(l){return!!(l&&"delay"in l)}class ki{constructor(s,u,c){var d;c===void 0&&(c=Af(s.event.target)),this.props=void 0,this.events=void 0,this.autoScrollEnabled=!0,this.document=void 0,this.activated=!1,this.initialCoordinates=void 0,this.timeoutId=null,this.listeners=void 0,this.documentListeners=void 0,this.windowListeners=void 0,this.props=s,this.events=u;const{event:p}=s,{target:m}=p;this.props=s,this.events=u,this.document=tr(m),this.documentListeners=new Fr(this.document),this.listeners=new Fr(c),this.windowListeners=new Fr(ut(m)),this.initialCoordinates=(d=Il(p))!=null?d:It,this.handleStart=this.handleStart.bind(this),this.handleMove=this.handleMove.bind(this),this.handleEnd=this.handleEnd.bind(this),this.handleCancel=this.handleCancel.bind(this),this.handleKeydown=this.handleKeydown.bind(this),this.removeTextSelection=this.removeTextSelection.bind(this),this.attach()}attach(){const{events:s,props:{options:{activationConstraint:u,bypassActivationConstraint:c}}}=this;if(this.listeners.add(s.move.name,this.handleMove,{passive:!1}),this.listeners.add(s.end.name,this.handleEnd),s.cancel&&this.listeners.add(s.cancel.name,this.handleCancel),this.windowListeners.add(Dt.Resize,this.handleCancel),this.windowListeners.add(Dt.DragStart,Bs),this.windowListeners.add(Dt.VisibilityChange,this.handleCancel),this.windowListeners.add(Dt.ContextMenu,Bs),this.documentListeners.add(Dt.Keydown,this.handleKeydown),u){if(c!=null&&c({event:this.props.event,activeNode:this.props.activeNode,options:this.props.options}))return this.handleStart();if($s(u)){this.timeoutId=setTimeout(this.handleStart,u.delay),this.handlePending(u);return}if(Hs(u)){this.handlePending(u);return}}this.handleStart()}detach(){this.listeners.removeAll(),this.windowListeners.removeAll(),setTimeout(this.documentListeners.removeAll,50),this.timeoutId!==null&&(clearTimeout(this.timeoutId),this.timeoutId=null)}handlePending(s,u){const{active:c,onPending:d}=this.props;d(c,s,this.initialCoordinates,u)}handleStart(){const{initialCoordinates:s}=this,{onStart:u}=this.props;s&&(this.activated=!0,this.documentListeners.add(Dt.Click,Ff,{capture:!0}),this.removeTextSelection(),this.documentListeners.add(Dt.SelectionChange,this.removeTextSelection),u(s))}handleMove(s){var u;const{activated:c,initialCoordinates:d,props:p}=this,{onMove:m,options:{activationConstraint:v}}=p;if(!d)return;const g=(u=Il(s))!=null?u:It,_=Ol(d,g);if(!c&&v){if(Hs(v)){if(v.tolerance!=null&&Si(_,v.tolerance))return this.handleCancel();if(Si(_,v.distance))return this.handleStart()}if($s(v)&&Si(_,v.tolerance))return this.handleCancel();this.handlePending(v,_);return}s.cancelable&&s.preventDefault(),m(g)}handleEnd(){const{onAbort:s,onEnd:u}=this.props;this.detach(),this.activated||s(this.props.active),u()}handleCancel(){const{onAbort:s,onCancel:u}=this.props;this.detach(),this.activated||s(this.props.active),u()}handleKeydown(s){s.code===_e.Esc&&this.handleCancel()}removeTextSelection(){var s;(s=this.document.getSelection())==null||s.removeAllRanges()}}const Uf={cancel:{name:"pointercancel"},move:{name:"pointermove"},end:{name:"pointerup"}};class Ci extends ki{constructor(s){const{event:u}=s,c=tr(u.target);super(s,Uf,c)}}Ci.activators=[{eventName:"onPointerDown",handler:(l,s)=>{let{nativeEvent:u}=l,{onActivation:c}=s;return!u.isPrimary||u.button!==0?!1:(c==null||c({event:u}),!0)}}];const Wf={move:{name:"mousemove"},end:{name:"mouseup"}};var Ei;(function(l){l[l.RightClick=2]="RightClick"})(Ei||(Ei={}));class Hf extends ki{constructor(s){super(s,Wf,tr(s.event.target))}}Hf.activators=[{eventName:"onMouseDown",handler:(l,s)=>{let{nativeEvent:u}=l,{onActivation:c}=s;return u.button===Ei.RightClick?!1:(c==null||c({event:u}),!0)}}];const _i={cancel:{name:"touchcancel"},move:{name:"touchmove"},end:{name:"touchend"}};class $f extends ki{constructor(s){super(s,_i)}static setup(){return window.addEventListener(_i.move.name,s,{capture:!1,passive:!1}),function(){window.removeEventListener(_i.move.name,s)};function s(){}}}$f.activators=[{eventName:"onTouchStart",handler:(l,s)=>{let{nativeEvent:u}=l,{onActivation:c}=s;const{touches:d}=u;return d.length>1?!1:(c==null||c({event:u}),!0)}}];var Br;(function(l){l[l.Pointer=0]="Pointer",l[l.DraggableRect=1]="DraggableRect"})(Br||(Br={}));var Fl;(function(l){l[l.TreeOrder=0]="TreeOrder",l[l.ReversedTreeOrder=1]="ReversedTreeOrder"})(Fl||(Fl={}));function Vf(l){let{acceleration:s,activator:u=Br.Pointer,canScroll:c,draggingRect:d,enabled:p,interval:m=5,order:v=Fl.TreeOrder,pointerCoordinates:g,scrollableAncestors:_,scrollableAncestorRects:D,delta:R,threshold:T}=l;const U=Kf({delta:R,disabled:!p}),[q,M]=nf(),j=x.useRef({x:0,y:0}),ne=x.useRef({x:0,y:0}),re=x.useMemo(()=>{switch(u){case Br.Pointer:return g?{top:g.y,bottom:g.y,left:g.x,right:g.x}:null;case Br.DraggableRect:return d}},[u,d,g]),Q=x.useRef(null),K=x.useCallback(()=>{const oe=Q.current;if(!oe)return;const Z=j.current.x*ne.current.x,A=j.current.y*ne.current.y;oe.scrollBy(Z,A)},[]),le=x.useMemo(()=>v===Fl.TreeOrder?[..._].reverse():_,[v,_]);x.useEffect(()=>{if(!p||!_.length||!re){M();return}for(const oe of le){if((c==null?void 0:c(oe))===!1)continue;const Z=_.indexOf(oe),A=D[Z];if(!A)continue;const{direction:F,speed:b}=Lf(oe,A,re,s,T);for(const $ of["x","y"])U[$][F[$]]||(b[$]=0,F[$]=0);if(b.x>0||b.y>0){M(),Q.current=oe,q(K,m),j.current=b,ne.current=F;return}}j.current={x:0,y:0},ne.current={x:0,y:0},M()},[s,K,c,M,p,m,JSON.stringify(re),JSON.stringify(U),q,_,le,D,JSON.stringify(T)])}const Qf={x:{[Qe.Backward]:!1,[Qe.Forward]:!1},y:{[Qe.Backward]:!1,[Qe.Forward]:!1}};function Kf(l){let{delta:s,disabled:u}=l;const c=Ml(s);return Or(d=>{if(u||!c||!d)return Qf;const p={x:Math.sign(s.x-c.x),y:Math.sign(s.y-c.y)};return{x:{[Qe.Backward]:d.x[Qe.Backward]||p.x===-1,[Qe.Forward]:d.x[Qe.Forward]||p.x===1},y:{[Qe.Backward]:d.y[Qe.Backward]||p.y===-1,[Qe.Forward]:d.y[Qe.Forward]||p.y===1}}},[u,s,c])}function Xf(l,s){const u=s!=null?l.get(s):void 0,c=u?u.node.current:null;return Or(d=>{var p;return s==null?null:(p=c??d)!=null?p:null},[c,s])}function Yf(l,s){return x.useMemo(()=>l.reduce((u,c)=>{const{sensor:d}=c,p=d.activators.map(m=>({eventName:m.eventName,handler:s(m.handler,c)}));return[...u,...p]},[]),[l,s])}var Ur;(function(l){l[l.Always=0]="Always",l[l.BeforeDragging=1]="BeforeDragging",l[l.WhileDragging=2]="WhileDragging"})(Ur||(Ur={}));var Ri;(function(l){l.Optimized="optimized"})(Ri||(Ri={}));const Vs=new Map;function Gf(l,s){let{dragging:u,dependencies:c,config:d}=s;const[p,m]=x.useState(null),{frequency:v,measure:g,strategy:_}=d,D=x.useRef(l),R=j(),T=jr(R),U=x.useCallback(function(ne){ne===void 0&&(ne=[]),!T.current&&m(re=>re===null?ne:re.concat(ne.filter(Q=>!re.includes(Q))))},[T]),q=x.useRef(null),M=Or(ne=>{if(R&&!u)return Vs;if(!ne||ne===Vs||D.current!==l||p!=null){const re=new Map;for(let Q of l){if(!Q)continue;if(p&&p.length>0&&!p.includes(Q.id)&&Q.rect.current){re.set(Q.id,Q.rect.current);continue}const K=Q.node.current,le=K?new xi(g(K),K):null;Q.rect.current=le,le&&re.set(Q.id,le)}return re}return ne},[l,p,u,R,g]);return x.useEffect(()=>{D.current=l},[l]),x.useEffect(()=>{R||U()},[u,R]),x.useEffect(()=>{p&&p.length>0&&m(null)},[JSON.stringify(p)]),x.useEffect(()=>{R||typeof v!="number"||q.current!==null||(q.current=setTimeout(()=>{U(),q.current=null},v))},[v,R,U,...c]),{droppableRects:M,measureDroppableContainers:U,measuringScheduled:p!=null};function j(){switch(_){case Ur.Always:return!1;case Ur.BeforeDragging:return u;default:return!u}}}function Di(l,s){return Or(u=>l?u||(typeof s=="function"?s(l):l):null,[s,l])}function Zf(l,s){return Di(l,s)}function Jf(l){let{callback:s,disabled:u}=l;const c=zl(s),d=x.useMemo(()=>{if(u||typeof window>"u"||typeof window.MutationObserver>"u")return;const{MutationObserver:p}=window;return new p(c)},[c,u]);return x.useEffect(()=>()=>d==null?void 0:d.disconnect(),[d]),d}function Bl(l){let{callback:s,disabled:u}=l;const c=zl(s),d=x.useMemo(()=>{if(u||typeof window>"u"||typeof window.ResizeObserver>"u")return;const{ResizeObserver:p}=window;return new p(c)},[u]);return x.useEffect(()=>()=>d==null?void 0:d.disconnect(),[d]),d}function qf(l){return new xi(Ar(l),l)}function Qs(l,s,u){s===void 0&&(s=qf);const[c,d]=x.useState(null);function p(){d(g=>{if(!l)return null;if(l.isConnected===!1){var _;return(_=g??u)!=null?_:null}const D=s(l);return JSON.stringify(g)===JSON.stringify(D)?g:D})}const m=Jf({callback(g){if(l)for(const _ of g){const{type:D,target:R}=_;if(D==="childList"&&R instanceof HTMLElement&&R.contains(l)){p();break}}}}),v=Bl({callback:p});return nn(()=>{p(),l?(v==null||v.observe(l),m==null||m.observe(document.body,{childList:!0,subtree:!0})):(v==null||v.disconnect(),m==null||m.disconnect())},[l]),c}function bf(l){const s=Di(l);return Ts(l,s)}const Ks=[];function ep(l){const s=x.useRef(l),u=Or(c=>l?c&&c!==Ks&&l&&s.current&&l.parentNode===s.current.parentNode?c:gi(l):Ks,[l]);return x.useEffect(()=>{s.current=l},[l]),u}function tp(l){const[s,u]=x.useState(null),c=x.useRef(l),d=x.useCallback(p=>{const m=yi(p.target);m&&u(v=>v?(v.set(m,wi(m)),new Map(v)):null)},[]);return x.useEffect(()=>{const p=c.current;if(l!==p){m(p);const v=l.map(g=>{const _=yi(g);return _?(_.addEventListener("scroll",d,{passive:!0}),[_,wi(_)]):null}).filter(g=>g!=null);u(v.length?new Map(v):null),c.current=l}return()=>{m(l),m(p)};function m(v){v.forEach(g=>{const _=yi(g);_==null||_.removeEventListener("scroll",d)})}},[d,l]),x.useMemo(()=>l.length?s?Array.from(s.values()).reduce((p,m)=>nr(p,m),It):As(l):It,[l,s])}function Xs(l,s){s===void 0&&(s=[]);const u=x.useRef(null);return x.useEffect(()=>{u.current=null},s),x.useEffect(()=>{const c=l!==It;c&&!u.current&&(u.current=l),!c&&u.current&&(u.current=null)},[l]),u.current?Ol(l,u.current):It}function np(l){x.useEffect(()=>{if(!Pl)return;const s=l.map(u=>{let{sensor:c}=u;return c.setup==null?void 0:c.setup()});return()=>{for(const u of s)u==null||u()}},l.map(s=>{let{sensor:u}=s;return u}))}function rp(l,s){return x.useMemo(()=>l.reduce((u,c)=>{let{eventName:d,handler:p}=c;return u[d]=m=>{p(m,s)},u},{}),[l,s])}function Ys(l){return x.useMemo(()=>l?Nf(l):null,[l])}const Gs=[];function lp(l,s){s===void 0&&(s=Ar);const[u]=l,c=Ys(u?ut(u):null),[d,p]=x.useState(Gs);function m(){p(()=>l.length?l.map(g=>Os(g)?c:new xi(s(g),g)):Gs)}const v=Bl({callback:m});return nn(()=>{v==null||v.disconnect(),m(),l.forEach(g=>v==null?void 0:v.observe(g))},[l]),d}function Zs(l){if(!l)return null;if(l.children.length>1)return l;const s=l.children[0];return Mr(s)?s:l}function op(l){let{measure:s}=l;const[u,c]=x.useState(null),d=x.useCallback(_=>{for(const{target:D}of _)if(Mr(D)){c(R=>{const T=s(D);return R?{...R,width:T.width,height:T.height}:T});break}},[s]),p=Bl({callback:d}),m=x.useCallback(_=>{const D=Zs(_);p==null||p.disconnect(),D&&(p==null||p.observe(D)),c(D?s(D):null)},[s,p]),[v,g]=Ll(m);return x.useMemo(()=>({nodeRef:v,rect:u,setRef:g}),[u,v,g])}const ip=[{sensor:Ci,options:{}},{sensor:Ws,options:{}}],up={current:{}},Ul={draggable:{measure:zs},droppable:{measure:zs,strategy:Ur.WhileDragging,frequency:Ri.Optimized},dragOverlay:{measure:Ar}};class Wr extends Map{get(s){var u;return s!=null&&(u=super.get(s))!=null?u:void 0}toArray(){return Array.from(this.values())}getEnabled(){return this.toArray().filter(s=>{let{disabled:u}=s;return!u})}getNodeFor(s){var u,c;return(u=(c=this.get(s))==null?void 0:c.node.current)!=null?u:void 0}}const sp={activatorEvent:null,active:null,activeNode:null,activeNodeRect:null,collisions:null,containerNodeRect:null,draggableNodes:new Map,droppableRects:new Map,droppableContainers:new Wr,over:null,dragOverlay:{nodeRef:{current:null},rect:null,setRef:Al},scrollableAncestors:[],scrollableAncestorRects:[],measuringConfiguration:Ul,measureDroppableContainers:Al,windowRect:null,measuringScheduled:!1},Js={activatorEvent:null,activators:[],active:null,activeNodeRect:null,ariaDescribedById:{draggable:""},dispatch:Al,draggableNodes:new Map,over:null,measureDroppableContainers:Al},Hr=x.createContext(Js),qs=x.createContext(sp);function ap(){return{draggable:{active:null,initialCoordinates:{x:0,y:0},nodes:new Map,translate:{x:0,y:0}},droppable:{containers:new Wr}}}function cp(l,s){switch(s.type){case He.DragStart:return{...l,draggable:{...l.draggable,initialCoordinates:s.initialCoordinates,active:s.active}};case He.DragMove:return l.draggable.active==null?l:{...l,draggable:{...l.draggable,translate:{x:s.coordinates.x-l.draggable.initialCoordinates.x,y:s.coordinates.y-l.draggable.initialCoordinates.y}}};case He.DragEnd:case He.DragCancel:return{...l,draggable:{...l.draggable,active:null,initialCoordinates:{x:0,y:0},translate:{x:0,y:0}}};case He.RegisterDroppable:{const{element:u}=s,{id:c}=u,d=new Wr(l.droppable.containers);return d.set(c,u),{...l,droppable:{...l.droppable,containers:d}}}case He.SetDroppableDisabled:{const{id:u,key:c,disabled:d}=s,p=l.droppable.containers.get(u);if(!p||c!==p.key)return l;const m=new Wr(l.droppable.containers);return m.set(u,{...p,disabled:d}),{...l,droppable:{...l.droppable,containers:m}}}case He.UnregisterDroppable:{const{id:u,key:c}=s,d=l.droppable.containers.get(u);if(!d||c!==d.key)return l;const p=new Wr(l.droppable.containers);return p.delete(u),{...l,droppable:{...l.droppable,containers:p}}}default:return l}}function dp(l){let{disabled:s}=l;const{active:u,activatorEvent:c,draggableNodes:d}=x.useContext(Hr),p=Ml(c),m=Ml(u==null?void 0:u.id);return x.useEffect(()=>{if(!s&&!c&&p&&m!=null){if(!mi(p)||document.activeElement===p.target)return;const v=d.get(m);if(!v)return;const{activatorNode:g,node:_}=v;if(!g.current&&!_.current)return;requestAnimationFrame(()=>{for(const D of[g.current,_.current]){if(!D)continue;const R=of(D);if(R){R.focus();break}}})}},[c,s,d,m,p]),null}function bs(l,s){let{transform:u,...c}=s;return l!=null&&l.length?l.reduce((d,p)=>p({transform:d,...c}),u):u}function fp(l){return x.useMemo(()=>({draggable:{...Ul.draggable,...l==null?void 0:l.draggable},droppable:{...Ul.droppable,...l==null?void 0:l.droppable},dragOverlay:{...Ul.dragOverlay,...l==null?void 0:l.dragOverlay}}),[l==null?void 0:l.draggable,l==null?void 0:l.droppable,l==null?void 0:l.dragOverlay])}function pp(l){let{activeNode:s,measure:u,initialRect:c,config:d=!0}=l;const p=x.useRef(!1),{x:m,y:v}=typeof d=="boolean"?{x:d,y:d}:d;nn(()=>{if(!m&&!v||!s){p.current=!1;return}if(p.current||!c)return;const _=s==null?void 0:s.node.current;if(!_||_.isConnected===!1)return;const D=u(_),R=Ts(D,c);if(m||(R.x=0),v||(R.y=0),p.current=!0,Math.abs(R.x)>0||Math.abs(R.y)>0){const T=Ls(_);T&&T.scrollBy({top:R.y,left:R.x})}},[s,m,v,c,u])}const Wl=x.createContext({...It,scaleX:1,scaleY:1});var gn;(function(l){l[l.Uninitialized=0]="Uninitialized",l[l.Initializing=1]="Initializing",l[l.Initialized=2]="Initialized"})(gn||(gn={}));const hp=x.memo(function(s){var u,c,d,p;let{id:m,accessibility:v,autoScroll:g=!0,children:_,sensors:D=ip,collisionDetection:R=kf,measuring:T,modifiers:U,...q}=s;const M=x.useReducer(cp,void 0,ap),[j,ne]=M,[re,Q]=ff(),[K,le]=x.useState(gn.Uninitialized),oe=K===gn.Initialized,{draggable:{active:Z,nodes:A,translate:F},droppable:{containers:b}}=j,$=Z!=null?A.get(Z):null,te=x.useRef({initial:null,translated:null}),se=x.useMemo(()=>{var ze;return Z!=null?{id:Z,data:(ze=$==null?void 0:$.data)!=null?ze:up,rect:te}:null},[Z,$]),ae=x.useRef(null),[ye,ve]=x.useState(null),[fe,I]=x.useState(null),J=jr(q,Object.values(q)),W=jl("DndDescribedBy",m),w=x.useMemo(()=>b.getEnabled(),[b]),N=fp(T),{droppableRects:ce,measureDroppableContainers:he,measuringScheduled:V}=Gf(w,{dragging:oe,dependencies:[F.x,F.y],config:N.droppable}),B=Xf(A,Z),de=x.useMemo(()=>fe?Il(fe):null,[fe]),ge=xn(),we=Zf(B,N.draggable.measure);pp({activeNode:Z!=null?A.get(Z):null,config:ge.layoutShiftCompensation,initialRect:we,measure:N.draggable.measure});const ke=Qs(B,N.draggable.measure,we),Ce=Qs(B?B.parentElement:null),xt=x.useRef({activatorEvent:null,active:null,activeNode:B,collisionRect:null,collisions:null,droppableRects:ce,draggableNodes:A,draggingNode:null,draggingNodeRect:null,droppableContainers:b,over:null,scrollableAncestors:[],scrollAdjustedTranslate:null}),ln=b.getNodeFor((u=xt.current.over)==null?void 0:u.id),St=op({measure:N.dragOverlay.measure}),on=(c=St.nodeRef.current)!=null?c:B,Ge=oe?(d=St.rect)!=null?d:ke:null,Un=!!(St.nodeRef.current&&St.rect),Pe=bf(Un?null:ke),Ze=Ys(on?ut(on):null),Oe=ep(oe?ln??B:null),Ue=lp(Oe),ft=bs(U,{transform:{x:F.x-Pe.x,y:F.y-Pe.y,scaleX:1,scaleY:1},activatorEvent:fe,active:se,activeNodeRect:ke,containerNodeRect:Ce,draggingNodeRect:Ge,over:xt.current.over,overlayNodeRect:St.rect,scrollableAncestors:Oe,scrollableAncestorRects:Ue,windowRect:Ze}),Nt=de?nr(de,F):null,Vr=tp(Oe),Zl=Xs(Vr),Jl=Xs(Vr,[ke]),Gt=nr(ft,Zl),At=Ge?_f(Ge,ft):null,yn=se&&At?R({active:se,collisionRect:At,droppableRects:ce,droppableContainers:w,pointerCoordinates:Nt}):null,wn=xf(yn,"id"),[pt,ql]=x.useState(null),bl=Un?ft:nr(ft,Jl),eo=Cf(bl,(p=pt==null?void 0:pt.rect)!=null?p:null,ke),Qr=x.useRef(null),ur=x.useCallback((ze,be)=>{let{sensor:et,options:Ft}=be;if(ae.current==null)return;const st=A.get(ae.current);if(!st)return;const tt=ze.nativeEvent,ht=new et({active:ae.current,activeNode:st,event:tt,options:Ft,context:xt,onAbort(Le){if(!A.get(Le))return;const{onDragAbort:nt}=J.current,Bt={id:Le};nt==null||nt(Bt),re({type:"onDragAbort",event:Bt})},onPending(Le,Tt,nt,Bt){if(!A.get(Le))return;const{onDragPending:Zt}=J.current,kt={id:Le,constraint:Tt,initialCoordinates:nt,offset:Bt};Zt==null||Zt(kt),re({type:"onDragPending",event:kt})},onStart(Le){const Tt=ae.current;if(Tt==null)return;const nt=A.get(Tt);if(!nt)return;const{onDragStart:Bt}=J.current,Ut={activatorEvent:tt,active:{id:Tt,data:nt.data,rect:te}};Lr.unstable_batchedUpdates(()=>{Bt==null||Bt(Ut),le(gn.Initializing),ne({type:He.DragStart,initialCoordinates:Le,active:Tt}),re({type:"onDragStart",event:Ut}),ve(Qr.current),I(tt)})},onMove(Le){ne({type:He.DragMove,coordinates:Le})},onEnd:un(He.DragEnd),onCancel:un(He.DragCancel)});Qr.current=ht;function un(Le){return async function(){const{active:nt,collisions:Bt,over:Ut,scrollAdjustedTranslate:Zt}=xt.current;let kt=null;if(nt&&Zt){const{cancelDrop:sn}=J.current;kt={activatorEvent:tt,active:nt,collisions:Bt,delta:Zt,over:Ut},Le===He.DragEnd&&typeof sn=="function"&&await Promise.resolve(sn(kt))&&(Le=He.DragCancel)}ae.current=null,Lr.unstable_batchedUpdates(()=>{ne({type:Le}),le(gn.Uninitialized),ql(null),ve(null),I(null),Qr.current=null;const sn=Le===He.DragEnd?"onDragEnd":"onDragCancel";if(kt){const Gr=J.current[sn];Gr==null||Gr(kt),re({type:sn,event:kt})}})}}},[A]),Kr=x.useCallback((ze,be)=>(et,Ft)=>{const st=et.nativeEvent,tt=A.get(Ft);if(ae.current!==null||!tt||st.dndKit||st.defaultPrevented)return;const ht={active:tt};ze(et,be.options,ht)===!0&&(st.dndKit={capturedBy:be.sensor},ae.current=Ft,ur(et,be))},[A,ur]),sr=Yf(D,Kr);np(D),nn(()=>{ke&&K===gn.Initializing&&le(gn.Initialized)},[ke,K]),x.useEffect(()=>{const{onDragMove:ze}=J.current,{active:be,activatorEvent:et,collisions:Ft,over:st}=xt.current;if(!be||!et)return;const tt={active:be,activatorEvent:et,collisions:Ft,delta:{x:Gt.x,y:Gt.y},over:st};Lr.unstable_batchedUpdates(()=>{ze==null||ze(tt),re({type:"onDragMove",event:tt})})},[Gt.x,Gt.y]),x.useEffect(()=>{const{active:ze,activatorEvent:be,collisions:et,droppableContainers:Ft,scrollAdjustedTranslate:st}=xt.current;if(!ze||ae.current==null||!be||!st)return;const{onDragOver:tt}=J.current,ht=Ft.get(wn),un=ht&&ht.rect.current?{id:ht.id,rect:ht.rect.current,data:ht.data,disabled:ht.disabled}:null,Le={active:ze,activatorEvent:be,collisions:et,delta:{x:st.x,y:st.y},over:un};Lr.unstable_batchedUpdates(()=>{ql(un),tt==null||tt(Le),re({type:"onDragOver",event:Le})})},[wn]),nn(()=>{xt.current={activatorEvent:fe,active:se,activeNode:B,collisionRect:At,collisions:yn,droppableRects:ce,draggableNodes:A,draggingNode:on,draggingNodeRect:Ge,droppableContainers:b,over:pt,scrollableAncestors:Oe,scrollAdjustedTranslate:Gt},te.current={initial:Ge,translated:At}},[se,B,yn,At,A,on,Ge,ce,b,pt,Oe,Gt]),Vf({...ge,delta:F,draggingRect:At,pointerCoordinates:Nt,scrollableAncestors:Oe,scrollableAncestorRects:Ue});const Xr=x.useMemo(()=>({active:se,activeNode:B,activeNodeRect:ke,activatorEvent:fe,collisions:yn,containerNodeRect:Ce,dragOverlay:St,draggableNodes:A,droppableContainers:b,droppableRects:ce,over:pt,measureDroppableContainers:he,scrollableAncestors:Oe,scrollableAncestorRects:Ue,measuringConfiguration:N,measuringScheduled:V,windowRect:Ze}),[se,B,ke,fe,yn,Ce,St,A,b,ce,pt,he,Oe,Ue,N,V,Ze]),Yr=x.useMemo(()=>({activatorEvent:fe,activators:sr,active:se,activeNodeRect:ke,ariaDescribedById:{draggable:W},dispatch:ne,draggableNodes:A,over:pt,measureDroppableContainers:he}),[fe,sr,se,ke,ne,W,A,pt,he]);return Ae.createElement(Ns.Provider,{value:Q},Ae.createElement(Hr.Provider,{value:Yr},Ae.createElement(qs.Provider,{value:Xr},Ae.createElement(Wl.Provider,{value:eo},_)),Ae.createElement(dp,{disabled:(v==null?void 0:v.restoreFocus)===!1})),Ae.createElement(vf,{...v,hiddenTextDescribedById:W}));function xn(){const ze=(ye==null?void 0:ye.autoScrollEnabled)===!1,be=typeof g=="object"?g.enabled===!1:g===!1,et=oe&&!ze&&!be;return typeof g=="object"?{...g,enabled:et}:{enabled:et}}}),vp=x.createContext(null),ea="button",mp="Draggable";function ta(l){let{id:s,data:u,disabled:c=!1,attributes:d}=l;const p=jl(mp),{activators:m,activatorEvent:v,active:g,activeNodeRect:_,ariaDescribedById:D,draggableNodes:R,over:T}=x.useContext(Hr),{role:U=ea,roleDescription:q="draggable",tabIndex:M=0}=d??{},j=(g==null?void 0:g.id)===s,ne=x.useContext(j?Wl:vp),[re,Q]=Ll(),[K,le]=Ll(),oe=rp(m,s),Z=jr(u);nn(()=>(R.set(s,{id:s,key:p,node:re,activatorNode:K,data:Z}),()=>{const F=R.get(s);F&&F.key===p&&R.delete(s)}),[R,s]);const A=x.useMemo(()=>({role:U,tabIndex:M,"aria-disabled":c,"aria-pressed":j&&U===ea?!0:void 0,"aria-roledescription":q,"aria-describedby":D.draggable}),[c,U,M,j,q,D.draggable]);return{active:g,activatorEvent:v,activeNodeRect:_,attributes:A,isDragging:j,listeners:c?void 0:oe,node:re,over:T,setNodeRef:Q,setActivatorNodeRef:le,transform:ne}}function gp(){return x.useContext(qs)}const yp="Droppable",wp={timeout:25};function na(l){let{data:s,disabled:u=!1,id:c,resizeObserverConfig:d}=l;const p=jl(yp),{active:m,dispatch:v,over:g,measureDroppableContainers:_}=x.useContext(Hr),D=x.useRef({disabled:u}),R=x.useRef(!1),T=x.useRef(null),U=x.useRef(null),{disabled:q,updateMeasurementsFor:M,timeout:j}={...wp,...d},ne=jr(M??c),re=x.useCallback(()=>{if(!R.current){R.current=!0;return}U.current!=null&&clearTimeout(U.current),U.current=setTimeout(()=>{_(Array.isArray(ne.current)?ne.current:[ne.current]),U.current=null},j)},[j]),Q=Bl({callback:re,disabled:q||!m}),K=x.useCallback((A,F)=>{Q&&(F&&(Q.unobserve(F),R.current=!1),A&&Q.observe(A))},[Q]),[le,oe]=Ll(K),Z=jr(s);return x.useEffect(()=>{!Q||!le.current||(Q.disconnect(),R.current=!1,Q.observe(le.current))},[le,Q]),x.useEffect(()=>(v({type:He.RegisterDroppable,element:{id:c,key:p,disabled:u,node:le,rect:T,data:Z}}),()=>v({type:He.UnregisterDroppable,key:p,id:c})),[c]),x.useEffect(()=>{u!==D.current.disabled&&(v({type:He.SetDroppableDisabled,id:c,key:p,disabled:u}),D.current.disabled=u)},[c,p,u,v]),{active:m,rect:T,isOver:(g==null?void 0:g.id)===c,node:le,over:g,setNodeRef:oe}}function xp(l){let{animation:s,children:u}=l;const[c,d]=x.useState(null),[p,m]=x.useState(null),v=Ml(u);return!u&&!c&&v&&d(v),nn(()=>{if(!p)return;const g=c==null?void 0:c.key,_=c==null?void 0:c.props.id;if(g==null||_==null){d(null);return}Promise.resolve(s(_,p)).then(()=>{d(null)})},[s,c,p]),Ae.createElement(Ae.Fragment,null,u,c?x.cloneElement(c,{ref:m}):null)}const Sp={x:0,y:0,scaleX:1,scaleY:1};function kp(l){let{children:s}=l;return Ae.createElement(Hr.Provider,{value:Js},Ae.createElement(Wl.Provider,{value:Sp},s))}const Cp={position:"fixed",touchAction:"none"},Ep=l=>mi(l)?"transform 250ms ease":void 0,_p=x.forwardRef((l,s)=>{let{as:u,activatorEvent:c,adjustScale:d,children:p,className:m,rect:v,style:g,transform:_,transition:D=Ep}=l;if(!v)return null;const R=d?_:{..._,scaleX:1,scaleY:1},T={...Cp,width:v.width,height:v.height,top:v.top,left:v.left,transform:Ir.Transform.toString(R),transformOrigin:d&&c?yf(c,v):void 0,transition:typeof D=="function"?D(c):D,...g};return Ae.createElement(u,{className:m,style:T,ref:s},p)}),Rp={duration:250,easing:"ease",keyframes:l=>{let{transform:{initial:s,final:u}}=l;return[{transform:Ir.Transform.toString(s)},{transform:Ir.Transform.toString(u)}]},sideEffects:(l=>s=>{let{active:u,dragOverlay:c}=s;const d={},{styles:p,className:m}=l;if(p!=null&&p.active)for(const[v,g]of Object.entries(p.active))g!==void 0&&(d[v]=u.node.style.getPropertyValue(v),u.node.style.setProperty(v,g));if(p!=null&&p.dragOverlay)for(const[v,g]of Object.entries(p.dragOverlay))g!==void 0&&c.node.style.setProperty(v,g);return m!=null&&m.active&&u.node.classList.add(m.active),m!=null&&m.dragOverlay&&c.node.classList.add(m.dragOverlay),function(){for(const[g,_]of Object.entries(d))u.node.style.setProperty(g,_);m!=null&&m.active&&u.node.classList.remove(m.active)}})({styles:{active:{opacity:"0"}}})};function Dp(l){let{config:s,draggableNodes:u,droppableContainers:c,measuringConfiguration:d}=l;return zl((p,m)=>{if(s===null)return;const v=u.get(p);if(!v)return;const g=v.node.current;if(!g)return;const _=Zs(m);if(!_)return;const{transform:D}=ut(m).getComputedStyle(m),R=Ps(D);if(!R)return;const T=typeof s=="function"?s:Np(s);return Fs(g,d.draggable.measure),T({active:{id:p,data:v.data,node:g,rect:d.draggable.measure(g)},draggableNodes:u,dragOverlay:{node:m,rect:d.dragOverlay.measure(_)},droppableContainers:c,measuringConfiguration:d,transform:R})})}function Np(l){const{duration:s,easing:u,sideEffects:c,keyframes:d}={...Rp,...l};return p=>{let{active:m,dragOverlay:v,transform:g,..._}=p;if(!s)return;const D={x:v.rect.left-m.rect.left,y:v.rect.top-m.rect.top},R={scaleX:g.scaleX!==1?m.rect.width*g.scaleX/v.rect.width:1,scaleY:g.scaleY!==1?m.rect.height*g.scaleY/v.rect.height:1},T={x:g.x-D.x,y:g.y-D.y,...R},U=d({..._,active:m,dragOverlay:v,transform:{initial:g,final:T}}),[q]=U,M=U[U.length-1];if(JSON.stringify(q)===JSON.stringify(M))return;const j=c==null?void 0:c({active:m,dragOverlay:v,..._}),ne=v.node.animate(U,{duration:s,easing:u,fill:"forwards"});return new Promise(re=>{ne.onfinish=()=>{j==null||j(),re()}})}}let ra=0;function Tp(l){return x.useMemo(()=>{if(l!=null)return ra++,ra},[l])}const Pp=Ae.memo(l=>{let{adjustScale:s=!1,children:u,dropAnimation:c,style:d,transition:p,modifiers:m,wrapperElement:v="div",className:g,zIndex:_=999}=l;const{activatorEvent:D,active:R,activeNodeRect:T,containerNodeRect:U,draggableNodes:q,droppableContainers:M,dragOverlay:j,over:ne,measuringConfiguration:re,scrollableAncestors:Q,scrollableAncestorRects:K,windowRect:le}=gp(),oe=x.useContext(Wl),Z=Tp(R==null?void 0:R.id),A=bs(m,{activatorEvent:D,active:R,activeNodeRect:T,containerNodeRect:U,draggingNodeRect:j.rect,over:ne,overlayNodeRect:j.rect,scrollableAncestors:Q,scrollableAncestorRects:K,transform:oe,windowRect:le}),F=Di(T),b=Dp({config:c,draggableNodes:q,droppableContainers:M,measuringConfiguration:re}),$=F?j.setRef:void 0;return Ae.createElement(kp,null,Ae.createElement(xp,{animation:b},R&&Z?Ae.createElement(_p,{key:Z,id:R.id,ref:$,as:v,activatorEvent:D,adjustScale:s,className:g,transition:p,rect:F,style:{zIndex:_,...d},transform:A},u):null))});let $r=1;function Ni(l){return l.id?l:{...l,id:`blk_${$r++}`}}function zp(l){const[s,u]=x.useState(()=>((l==null?void 0:l.schedule)??[]).map(Ni)),[c,d]=x.useState(()=>((l==null?void 0:l.cipWindows)??[]).map(Ni)),[p,m]=x.useState(()=>((l==null?void 0:l.holdingArea)??[]).map(Ni)),[v,g]=x.useState(""),_=x.useRef([]),D=x.useRef([]),R=x.useCallback(()=>({schedule:[...s],cipWindows:[...c],holdingArea:[...p]}),[s,c,p]),T=x.useCallback(()=>{_.current.push(R()),D.current=[],_.current.length>50&&_.current.shift()},[R]),U=x.useCallback(()=>{const F=_.current.pop();F&&(D.current.push(R()),u(F.schedule),d(F.cipWindows),m(F.holdingArea),g("Undo"))},[R]),q=x.useCallback(()=>{const F=D.current.pop();F&&(_.current.push(R()),u(F.schedule),d(F.cipWindows),m(F.holdingArea),g("Redo"))},[R]),M=x.useCallback((F,b)=>{T(),u($=>$.map(te=>te.id===F?{...te,...b}:te)),d($=>$.map(te=>te.id===F?{...te,...b}:te))},[T]),j=x.useCallback((F,b,$,te,se)=>{T(),u(ae=>ae.map(ye=>ye.id===F?{...ye,line_name:b,line_id:$,start_hour:te,end_hour:te+se,run_hours:se}:ye)),d(ae=>ae.map(ye=>ye.id===F?{...ye,line_name:b,line_id:$,start_hour:te,end_hour:te+se,run_hours:se}:ye)),g(`Moved ${F} to ${b} at h${te}`)},[T]),ne=x.useCallback((F,b,$)=>{T();const te=$-b;u(se=>se.map(ae=>ae.id===F?{...ae,start_hour:b,end_hour:$,run_hours:te}:ae)),d(se=>se.map(ae=>ae.id===F?{...ae,start_hour:b,end_hour:$,run_hours:te}:ae)),g(`Resized ${F} to h${b}-${$}`)},[T]),re=x.useCallback((F,b)=>{T(),u($=>{const te=$.findIndex(fe=>fe.id===F);if(te<0)return $;const se=$[te],ae={...se,id:`blk_${$r++}`,end_hour:b,run_hours:b-se.start_hour},ye={...se,id:`blk_${$r++}`,start_hour:b,run_hours:se.end_hour-b},ve=[...$];return ve.splice(te,1,ae,ye),ve}),g(`Split block at h${b}`)},[T]),Q=x.useCallback(F=>{const b=s.find($=>$.id===F)??c.find($=>$.id===F);b&&(T(),u($=>$.filter(te=>te.id!==F)),d($=>$.filter(te=>te.id!==F)),m($=>[...$,b]),g(`Removed ${b.order_id} to holding`))},[T,s,c]),K=x.useCallback((F,b,$,te,se)=>{const ae=p.find(ve=>ve.id===F);if(!ae)return;T();const ye={...ae,line_name:b,line_id:$,start_hour:te,end_hour:te+se,run_hours:se};m(ve=>ve.filter(fe=>fe.id!==F)),ye.block_type==="cip"?d(ve=>[...ve,ye]):u(ve=>[...ve,ye]),g(`Restored ${ae.order_id} to ${b}`)},[T,p]),le=x.useCallback((F,b,$,te)=>{T();const se={id:`blk_${$r++}`,line_id:b,line_name:F,order_id:"CIP",sku:"CIP",start_hour:$,end_hour:$+te,run_hours:te,is_trial:!1,block_type:"cip"};d(ae=>[...ae,se]),g(`Added CIP on ${F} at h${$}`)},[T]),oe=x.useCallback((F,b,$,te,se)=>{T();const ae={id:`blk_${$r++}`,line_id:b,line_name:F,order_id:`TRIAL-${$}-L${F}`,sku:$,start_hour:te,end_hour:te+se,run_hours:se,is_trial:!0,block_type:"trial"};u(ye=>[...ye,ae]),g(`Added trial ${$} on ${F}`)},[T]),Z={schedule:s,cipWindows:c,holdingArea:p,lastAction:v},A={updateBlock:M,moveBlock:j,resizeBlock:ne,splitBlock:re,removeToHolding:Q,restoreFromHolding:K,addCip:le,addTrial:oe,undo:U,redo:q,canUndo:_.current.length>0,canRedo:D.current.length>0};return[Z,A]}const rn=40,Yt=48,Hl=50,la=1,Lp=30;function rr(l,s,u){return Hl+(l-s)*u}function $l(l){return Math.round(l)}function Ti(l,s){const u=l-Hl-10;return Math.max(la,u/s)}function Mp(l,s){const[u,c]=x.useState({blockId:null,edge:null,previewStart:0,previewEnd:0}),d=x.useRef({start:0,end:0}),p=x.useRef(0),m=x.useRef(6),v=x.useCallback((g,_,D,R,T,U)=>{d.current={start:D,end:R},p.current=T,m.current=U,c({blockId:g,edge:_,previewStart:D,previewEnd:R});const q=j=>{const ne=j.clientX-p.current,re=$l(ne/m.current);let Q=d.current.start,K=d.current.end;_==="left"?(Q=d.current.start+re,K-Q<l&&(Q=K-l),Q<0&&(Q=0)):(K=d.current.end+re,K-Q<l&&(K=Q+l)),c({blockId:g,edge:_,previewStart:Q,previewEnd:K})},M=()=>{document.removeEventListener("pointermove",q),document.removeEventListener("pointerup",M),c(j=>(j.blockId&&s(j.blockId,j.previewStart,j.previewEnd),{blockId:null,edge:null,previewStart:0,previewEnd:0}))};document.addEventListener("pointermove",q),document.addEventListener("pointerup",M)},[l,s]);return{resizing:u,startResize:v}}const oa={visible:!1,x:0,y:0,blockId:null,blockType:"sku",startHour:0,endHour:0};function jp(){const[l,s]=x.useState(oa),u=x.useCallback((d,p,m,v,g,_)=>{s({visible:!0,x:d,y:p,blockId:m,blockType:v,startHour:g,endHour:_})},[]),c=x.useCallback(()=>s(oa),[]);return{menu:l,openMenu:u,closeMenu:c}}function ia(l,s,u){var p;const c={};for(const m of l){if(m.block_type==="cip")continue;const v=((p=u[m.line_name])==null?void 0:p[m.sku])??0;c[m.order_id]=(c[m.order_id]??0)+v*m.run_hours}const d=s.map(m=>{const v=c[m.order_id]??0,g=m.qty_min>0?v/m.qty_min*100:v>0?999:100;let _="MET";return v<m.qty_min?_="UNDER":m.qty_max>0&&v>m.qty_max&&(_="OVER"),{order_id:m.order_id,sku:m.sku,qty_min:m.qty_min,qty_max:m.qty_max,scheduled_qty:Math.round(v),pct_adherence:Math.round(g*10)/10,status:_}});return d.sort((m,v)=>m.sku.localeCompare(v.sku)),d}function Op(l){var d;const s={};for(const p of l)p.block_type!=="cip"&&(s[d=p.line_name]??(s[d]=[])).push(p);const u={};let c=0;for(const[p,m]of Object.entries(s)){const v=[...m].sort((_,D)=>_.start_hour-D.start_hour);let g=0;for(let _=1;_<v.length;_++)v[_].sku!==v[_-1].sku&&g++;u[p]=g,c+=g}return{total:c,perLine:u}}function Ip(l,s,u,c){const d=ia(l,u,c),p=d.filter(R=>R.status==="MET").length,m=d.length>0?Math.round(p/d.length*1e3)/10:100,{total:v,perLine:g}=Op(l),_=[...l,...s],D=Ap(_);return{pctAdherence:m,ordersMet:p,ordersTotal:d.length,totalChangeovers:v,perLineChangeovers:g,overlaps:D}}function Ap(l){var c;const s={};for(const d of l)(s[c=d.line_name]??(s[c]=[])).push(d);const u=[];for(const[d,p]of Object.entries(s)){const m=[...p].sort((v,g)=>v.start_hour-g.start_hour);for(let v=1;v<m.length;v++)m[v].start_hour<m[v-1].end_hour&&u.push(`${d}: overlap at h${m[v].start_hour}`)}return u}function Pi(l,s,u){var c;return(((c=u[l])==null?void 0:c[s])??0)>0}function zi(l,s,u){var c;return((c=u[l])==null?void 0:c[s])??0}function ua(l,s,u){const c=zi(l.line_name,l.sku,u),d=zi(s,l.sku,u);if(d<=0)return null;if(c<=0)return l.run_hours;const p=c*l.run_hours;return Math.ceil(p/d)}function sa(l,s,u,c,d){return l.some(p=>p.line_name===s&&p.id!==u&&p.start_hour<d&&p.end_hour>c)}let aa=!1;const ca=[];function Fp(l){ca.push(l)}function Bp(){aa||(aa=!0,window.parent.postMessage({isStreamlitMessage:!0,type:"streamlit:componentReady",apiVersion:1},"*"))}function da(l){const s=l??document.documentElement.scrollHeight;window.parent.postMessage({isStreamlitMessage:!0,type:"streamlit:setFrameHeight",height:s},"*")}function Up(l){window.parent.postMessage({isStreamlitMessage:!0,type:"streamlit:setComponentValue",value:l},"*")}window.addEventListener("message",l=>{const s=l.data;if(!(!s||typeof s!="object")&&s.type==="streamlit:render")for(const u of ca)u(s)});const Vl={display:"inline-flex",flexDirection:"column",alignItems:"center",padding:"8px 18px",borderRadius:8,background:"#f7f7fa",border:"1px solid #e0e0e5",minWidth:120},Ql={fontSize:11,color:"#666",textTransform:"uppercase",letterSpacing:.5},Kl={fontSize:22,fontWeight:700,marginTop:2},Wp=({kpis:l})=>{const s=l.pctAdherence>=100?"#00CC96":l.pctAdherence>=80?"#FFA15A":"#EF553B",u=l.overlaps.length>0?"#EF553B":"#00CC96";return C.jsxs("div",{style:{display:"flex",gap:12,padding:"8px 0",flexWrap:"wrap"},children:[C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Adherence"}),C.jsxs("span",{style:{...Kl,color:s},children:[l.pctAdherence,"%"]})]}),C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Orders Met"}),C.jsxs("span",{style:Kl,children:[l.ordersMet,"/",l.ordersTotal]})]}),C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Changeovers"}),C.jsx("span",{style:Kl,children:l.totalChangeovers})]}),C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Overlaps"}),C.jsx("span",{style:{...Kl,color:u},children:l.overlaps.length})]})]})},fa=["#636EFA","#EF553B","#00CC96","#AB63FA","#FFA15A","#19D3F3","#FF6692","#B6E880","#FF97FF","#FECB52"],Hp="#888888",$p="#D4A017",Xl=new Map;function pa(l,s){return s==="cip"?Hp:s==="trial"?$p:(Xl.has(l)||Xl.set(l,fa[Xl.size%fa.length]),Xl.get(l))}function ha(l){const s=l.replace("#",""),u=parseInt(s.substring(0,2),16),c=parseInt(s.substring(2,4),16),d=parseInt(s.substring(4,6),16);return(.299*u+.587*c+.114*d)/255>.5?"#000":"#fff"}const Vp=({block:l,lineIndex:s,viewStart:u,hourWidth:c,isResizing:d,previewStart:p,previewEnd:m,isHighlighted:v,onResizeStart:g,onContextMenu:_,onClick:D})=>{const{attributes:R,listeners:T,setNodeRef:U,transform:q,isDragging:M}=ta({id:l.id,data:{block:l}}),j=U,ne=d?p??l.start_hour:l.start_hour,re=d?m??l.end_hour:l.end_hour,Q=rr(ne,u,c),K=(re-ne)*c,le=4,oe=rn-8,Z=pa(l.sku,l.block_type),A=ha(Z),F=x.useCallback(w=>{w.stopPropagation(),w.preventDefault(),g(l.id,"left",l.start_hour,l.end_hour,w.clientX,c)},[l,c,g]),b=x.useCallback(w=>{w.stopPropagation(),w.preventDefault(),g(l.id,"right",l.start_hour,l.end_hour,w.clientX,c)},[l,c,g]),$=x.useCallback(w=>{w.preventDefault(),_(w,l.id)},[l.id,_]),te=x.useCallback(w=>{w.stopPropagation(),D(l.id)},[l.id,D]),se=M&&q?q.x:0,ae=M&&q?q.y:0,ye=l.sku_description||"",ve=l.block_type==="cip"?"CIP":l.block_type==="trial"?`T:${l.sku}`:l.sku,fe=Math.floor((K-12)/6.5);let I;if(l.block_type==="cip")I="CIP";else if(fe<=0)I="";else{const w=`${ve} (${l.run_hours}h)`,N=ye?`${ve} ${ye} (${l.run_hours}h)`:w;N.length<=fe?I=N:w.length<=fe?I=w:ve.length<=fe?I=ve:I=ve.slice(0,Math.max(fe-1,1))+"…"}const J=M?"#333":"none",W=M?2:0;return C.jsxs("g",{ref:j,...T,...R,transform:`translate(${se}, ${ae})`,style:{cursor:M?"grabbing":"grab",opacity:M?.6:1},onContextMenu:$,onClick:te,children:[v&&C.jsx("rect",{x:Q-2,y:le-2,width:Math.max(K,2)+4,height:oe+4,rx:6,fill:"none",stroke:"#FFD700",strokeWidth:2,opacity:.5}),C.jsx("rect",{x:Q,y:le,width:Math.max(K,2),height:oe,rx:4,fill:Z,stroke:J,strokeWidth:W}),K>20&&I&&C.jsx("text",{x:Q+6,y:le+oe/2+1,textAnchor:"start",dominantBaseline:"middle",fontSize:K>60?11:9,fill:A,fontWeight:600,pointerEvents:"none",style:{userSelect:"none"},children:I}),C.jsx("rect",{x:Q,y:le,width:8,height:oe,fill:"transparent",style:{cursor:"ew-resize"},onPointerDown:F}),C.jsx("rect",{x:Q+Math.max(K,2)-8,y:le,width:8,height:oe,fill:"transparent",style:{cursor:"ew-resize"},onPointerDown:b})]})},Qp=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],Kp=({viewStart:l,viewEnd:s,hourWidth:u,anchor:c,svgWidth:d,svgHeight:p})=>{const m=24*u,v=[],g=Math.floor(l/24)*24;for(let D=g;D<=s;D+=24)if(D>=l){const R=new Date(c.getTime()+D*36e5);v.push({hour:D,label:`${Qp[R.getMonth()]} ${R.getDate()}`})}const _=[];for(let D=g+7;D<=s;D+=12)if(D>=l){const R=(D%24+24)%24;(R===7||R===19)&&_.push({hour:D,isAm:R===7})}return C.jsxs("g",{className:"time-axis",children:[C.jsx("rect",{x:0,y:0,width:d,height:Yt,fill:"#fafafa"}),C.jsx("line",{x1:Hl,y1:Yt,x2:d,y2:Yt,stroke:"#ccc"}),v.map((D,R)=>{const T=rr(D.hour,l,u),q=rr(D.hour+24,l,u)-T;return C.jsxs("g",{children:[R%2===1&&C.jsx("rect",{x:T,y:0,width:q,height:Yt,fill:"#eef0f5"}),C.jsx("line",{x1:T,y1:Yt,x2:T,y2:p,stroke:"#d0d0d0",strokeWidth:1}),m>30&&C.jsx("text",{x:T+q/2,y:Yt/2+1,textAnchor:"middle",dominantBaseline:"middle",fontSize:m>=55?11:9,fontWeight:600,fill:"#333",children:D.label})]},D.hour)}),_.map(D=>{const R=rr(D.hour,l,u);return C.jsx("line",{x1:R,y1:Yt,x2:R,y2:p,stroke:D.isAm?"#d4a020":"#6a8dbf",strokeDasharray:"4,4",strokeWidth:1,opacity:.5},`shift_${D.hour}`)}),168>=l&&168<=s&&C.jsx("line",{x1:rr(168,l,u),y1:0,x2:rr(168,l,u),y2:p,stroke:"#AB63FA",strokeDasharray:"6,3",strokeWidth:2})]})},Xp=({onZoomIn:l,onZoomOut:s,onResetZoom:u})=>C.jsxs("div",{style:{display:"flex",gap:4,padding:"4px 0",alignItems:"center"},children:[C.jsx("button",{onClick:l,style:Li,title:"Zoom in",children:"+"}),C.jsx("button",{onClick:s,style:Li,title:"Zoom out",children:"−"}),C.jsx("button",{onClick:u,style:{...Li,fontSize:11},title:"Fit 2 weeks",children:"Fit"})]}),Li={width:28,height:24,border:"1px solid #ccc",borderRadius:4,background:"#fff",cursor:"pointer",fontSize:14,fontWeight:700,lineHeight:"22px"},Yp=({line:l,index:s,svgWidth:u,isCapable:c})=>{const{setNodeRef:d,isOver:p}=na({id:`line_${l.line_name}`}),m=d,v=Yt+s*rn;let g;return p?g=c===!1?"#e57373":"#66bb6a":c===!0?g="#a5d6a7":c===!1?g="#ef9a9a":g=s%2===0?"#fff":"#fafafa",C.jsxs("g",{ref:m,children:[C.jsx("rect",{x:0,y:v,width:u,height:rn,fill:g}),C.jsx("line",{x1:0,y1:v+rn,x2:u,y2:v+rn,stroke:"#eee"}),C.jsx("text",{x:4,y:v+rn/2,dominantBaseline:"middle",fontSize:11,fontWeight:600,fill:"#333",children:l.line_name})]})},Gp=({schedule:l,cipWindows:s,lines:u,viewStart:c,viewEnd:d,hourWidth:p,anchor:m,resizing:v,highlightSku:g,capableLines:_,onResizeStart:D,onContextMenu:R,onBlockClick:T,onZoomIn:U,onZoomOut:q,onResetZoom:M})=>{const j=x.useRef(null),ne=Hl+(d-c)*p,re=Yt+u.length*rn+4,Q=[...l,...s];return C.jsxs(C.Fragment,{children:[C.jsx(Xp,{onZoomIn:U,onZoomOut:q,onResetZoom:M}),C.jsx("div",{style:{overflowX:"hidden",overflowY:"hidden",border:"1px solid #e0e0e5",borderRadius:8},children:C.jsxs("svg",{ref:j,width:ne,height:re,style:{display:"block"},children:[C.jsx(Kp,{viewStart:c,viewEnd:d,hourWidth:p,anchor:m,svgWidth:ne,svgHeight:re}),u.map((K,le)=>C.jsx(Yp,{line:K,index:le,svgWidth:ne,isCapable:_?_.has(K.line_name):null},K.line_name)),Q.map(K=>{const le=u.findIndex(F=>F.line_name===K.line_name);if(le<0)return null;const oe=Yt+le*rn,Z=v.blockId===K.id,A=g!==null&&K.sku===g&&K.block_type!=="cip";return C.jsx("g",{transform:`translate(0, ${oe})`,children:C.jsx(Vp,{block:K,lineIndex:le,viewStart:c,hourWidth:p,isResizing:Z,previewStart:Z?v.previewStart:void 0,previewEnd:Z?v.previewEnd:void 0,isHighlighted:A,onResizeStart:D,onContextMenu:R,onClick:T})},K.id)})]})})]})},Zp=({block:l})=>{const{attributes:s,listeners:u,setNodeRef:c,isDragging:d}=ta({id:`holding_${l.id}`,data:{block:l,fromHolding:!0}}),p=pa(l.sku,l.block_type),m=ha(p);return C.jsxs("div",{ref:c,...u,...s,style:{display:"inline-flex",alignItems:"center",gap:6,padding:"4px 10px",borderRadius:6,background:p,color:m,fontSize:12,fontWeight:600,cursor:"grab",opacity:d?.5:1,whiteSpace:"nowrap"},children:[l.block_type==="cip"?"CIP":l.order_id,": ",l.sku,", ",l.run_hours,"h"]})},Jp=({blocks:l})=>{const[s,u]=x.useState(!0),{setNodeRef:c,isOver:d}=na({id:"holding_area"});return C.jsxs("div",{ref:c,style:{border:`2px dashed ${d?"#636EFA":"#ccc"}`,borderRadius:8,padding:8,background:d?"#f0f4ff":"#fafafa",transition:"background 0.15s, border-color 0.15s"},children:[C.jsxs("div",{style:{display:"flex",justifyContent:"space-between",alignItems:"center",cursor:"pointer",marginBottom:s?6:0},onClick:()=>u(!s),children:[C.jsxs("strong",{style:{fontSize:13},children:["Holding Area [",l.length," items]"]}),C.jsx("span",{style:{fontSize:11,color:"#666"},children:s?"▲ collapse":"▼ expand"})]}),s&&C.jsxs("div",{style:{display:"flex",flexWrap:"wrap",gap:6},children:[l.length===0&&C.jsx("span",{style:{fontSize:12,color:"#999",fontStyle:"italic"},children:"Drag blocks here to remove from schedule"}),l.map(p=>C.jsx(Zp,{block:p},p.id))]})]})},qp=({lines:l,cipDuration:s,onAddCip:u,onAddTrial:c})=>{var oe,Z;const[d,p]=x.useState(!1),[m,v]=x.useState(!1),[g,_]=x.useState(((oe=l[0])==null?void 0:oe.line_name)??""),[D,R]=x.useState(0),[T,U]=x.useState(((Z=l[0])==null?void 0:Z.line_name)??""),[q,M]=x.useState(""),[j,ne]=x.useState(0),[re,Q]=x.useState(8),K=()=>{const A=l.find(F=>F.line_name===g);A&&u(g,A.line_id,D,s),p(!1)},le=()=>{const A=l.find(F=>F.line_name===T);A&&q&&c(T,A.line_id,q,j,re),v(!1)};return C.jsxs("div",{style:{display:"flex",gap:8,alignItems:"flex-start",flexWrap:"wrap",padding:"4px 0"},children:[C.jsx("button",{onClick:()=>p(!d),style:Yl,children:"+ CIP"}),C.jsx("button",{onClick:()=>v(!m),style:Yl,children:"+ Trial"}),d&&C.jsxs("div",{style:va,children:[C.jsx("label",{style:lr,children:"Line"}),C.jsx("select",{value:g,onChange:A=>_(A.target.value),style:or,children:l.map(A=>C.jsx("option",{value:A.line_name,children:A.line_name},A.line_name))}),C.jsx("label",{style:lr,children:"Start Hour"}),C.jsx("input",{type:"number",value:D,min:0,onChange:A=>R(+A.target.value),style:or}),C.jsx("button",{onClick:K,style:{...Yl,background:"#636EFA",color:"#fff"},children:"Add"})]}),m&&C.jsxs("div",{style:va,children:[C.jsx("label",{style:lr,children:"Line"}),C.jsx("select",{value:T,onChange:A=>U(A.target.value),style:or,children:l.map(A=>C.jsx("option",{value:A.line_name,children:A.line_name},A.line_name))}),C.jsx("label",{style:lr,children:"SKU"}),C.jsx("input",{value:q,onChange:A=>M(A.target.value),placeholder:"e.g. 280573",style:or}),C.jsx("label",{style:lr,children:"Start Hour"}),C.jsx("input",{type:"number",value:j,min:0,onChange:A=>ne(+A.target.value),style:or}),C.jsx("label",{style:lr,children:"Duration (h)"}),C.jsx("input",{type:"number",value:re,min:1,onChange:A=>Q(+A.target.value),style:or}),C.jsx("button",{onClick:le,style:{...Yl,background:"#D4A017",color:"#fff"},children:"Add"})]})]})},Yl={padding:"6px 14px",border:"1px solid #ccc",borderRadius:6,background:"#fff",cursor:"pointer",fontSize:13,fontWeight:600},va={display:"flex",gap:8,alignItems:"center",padding:"6px 10px",border:"1px solid #e0e0e5",borderRadius:6,background:"#fafafa",flexWrap:"wrap"},lr={fontSize:11,color:"#666"},or={fontSize:12,padding:"4px 6px",borderRadius:4,border:"1px solid #ccc",width:80},bp={MET:"#00CC96",UNDER:"#EF553B",OVER:"#FFA15A"},eh=({rows:l,highlightSku:s,onSkuClick:u})=>C.jsx("div",{style:{maxHeight:260,overflowY:"auto",border:"1px solid #e0e0e5",borderRadius:8,background:"#ffffff"},children:C.jsxs("table",{style:{width:"100%",borderCollapse:"collapse",fontSize:12,color:"#333"},children:[C.jsx("thead",{children:C.jsxs("tr",{style:{background:"#f7f7fa",position:"sticky",top:0},children:[C.jsx("th",{style:ir,children:"SKU"}),C.jsx("th",{style:ir,children:"Order"}),C.jsx("th",{style:ir,children:"Min Qty"}),C.jsx("th",{style:ir,children:"Sched Qty"}),C.jsx("th",{style:ir,children:"% Adh"}),C.jsx("th",{style:ir,children:"Status"})]})}),C.jsx("tbody",{children:l.map(c=>{const d=s===c.sku;return C.jsxs("tr",{style:{borderBottom:"1px solid #eee",background:d?"#fff8dc":"#ffffff",cursor:"pointer"},onClick:p=>{p.stopPropagation(),u(d?null:c.sku)},children:[C.jsx("td",{style:{...Gl,fontWeight:d?700:400},children:c.sku}),C.jsx("td",{style:Gl,children:c.order_id}),C.jsx("td",{style:Mi,children:c.qty_min.toLocaleString()}),C.jsx("td",{style:Mi,children:c.scheduled_qty.toLocaleString()}),C.jsxs("td",{style:Mi,children:[c.pct_adherence,"%"]}),C.jsx("td",{style:{...Gl,color:bp[c.status]??"#333",fontWeight:600},children:c.status})]},c.order_id)})})]})}),ir={textAlign:"left",padding:"6px 10px",fontSize:11,fontWeight:600,color:"#666",textTransform:"uppercase",letterSpacing:.5},Gl={padding:"4px 10px"},Mi={...Gl,textAlign:"right",fontVariantNumeric:"tabular-nums"},ji={padding:"6px 16px",cursor:"pointer",fontSize:13,borderBottom:"1px solid #f0f0f0"},th=({menu:l,onSplit:s,onRemove:u,onDetails:c,onClose:d,minRunHours:p})=>{if(!l.visible||!l.blockId)return null;const m=l.endHour-l.startHour>=p*2,v=Math.round((l.startHour+l.endHour)/2);return C.jsxs(C.Fragment,{children:[C.jsx("div",{style:{position:"fixed",inset:0,zIndex:999},onClick:d,onContextMenu:g=>{g.preventDefault(),d()}}),C.jsxs("div",{style:{position:"fixed",left:l.x,top:l.y,background:"#fff",border:"1px solid #ccc",borderRadius:6,boxShadow:"0 4px 12px rgba(0,0,0,0.12)",zIndex:1e3,minWidth:160,overflow:"hidden"},children:[m&&C.jsxs("div",{style:ji,onClick:()=>{s(l.blockId,v),d()},onMouseEnter:g=>{g.target.style.background="#f0f4ff"},onMouseLeave:g=>{g.target.style.background="transparent"},children:["✂ Split at h",v]}),C.jsx("div",{style:ji,onClick:()=>{u(l.blockId),d()},onMouseEnter:g=>{g.target.style.background="#fff0f0"},onMouseLeave:g=>{g.target.style.background="transparent"},children:"🗑 Remove to holding"}),C.jsx("div",{style:{...ji,borderBottom:"none"},onClick:()=>{c(l.blockId),d()},onMouseEnter:g=>{g.target.style.background="#f0f4ff"},onMouseLeave:g=>{g.target.style.background="transparent"},children:"ℹ Details"})]})]})},nh=({block:l,x:s,y:u,rate:c,onClose:d})=>{if(!l)return null;const p=c>0?Math.round(c*l.run_hours):"—";return C.jsxs("div",{style:{position:"fixed",left:s,top:u,background:"#fff",border:"1px solid #ccc",borderRadius:8,padding:"10px 14px",boxShadow:"0 4px 16px rgba(0,0,0,0.15)",zIndex:1e3,minWidth:180,fontSize:13},onClick:m=>m.stopPropagation(),children:[C.jsxs("div",{style:{display:"flex",justifyContent:"space-between",marginBottom:6},children:[C.jsx("strong",{children:l.block_type==="cip"?"CIP":l.order_id}),C.jsx("span",{style:{cursor:"pointer",fontWeight:700,color:"#888"},onClick:d,children:"×"})]}),C.jsx("table",{style:{fontSize:12,lineHeight:1.8},children:C.jsxs("tbody",{children:[C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Line"}),C.jsx("td",{children:l.line_name})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"SKU"}),C.jsx("td",{children:l.sku})]}),l.sku_description&&C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Description"}),C.jsx("td",{children:l.sku_description})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Start"}),C.jsxs("td",{children:["h",l.start_hour]})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"End"}),C.jsxs("td",{children:["h",l.end_hour]})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Duration"}),C.jsxs("td",{children:[l.run_hours,"h"]})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Rate"}),C.jsx("td",{children:c>0?`${c} UPH`:"N/A"})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Est. Qty"}),C.jsx("td",{children:p})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Type"}),C.jsx("td",{children:l.block_type})]})]})})]})},rh=({args:l})=>{const[s,u]=zp(l),{schedule:c,cipWindows:d,holdingArea:p,lastAction:m}=s,v=l.config.horizon_hours||336,g=x.useRef(null),[_,D]=x.useState(()=>Ti(1200,v)),[R,T]=x.useState(0),U=R+v,q=x.useMemo(()=>new Date(l.config.planning_anchor),[l.config.planning_anchor]),M=l.capabilities,j=l.lines;x.useEffect(()=>{const V=()=>{var de;const B=((de=g.current)==null?void 0:de.offsetWidth)??1200;D(Ti(B,v)),T(0)};return V(),window.addEventListener("resize",V),()=>window.removeEventListener("resize",V)},[v]);const[ne,re]=x.useState(null),[Q,K]=x.useState(null),le=x.useMemo(()=>{if(!Q)return null;const V=new Set;for(const B of j)Pi(B.line_name,Q,M)&&V.add(B.line_name);return V},[Q,j,M]),oe=gf(mf(Ci,{activationConstraint:{distance:5}})),Z=x.useCallback(V=>{var de;const B=(de=V.active.data.current)==null?void 0:de.block;B&&B.block_type!=="cip"&&K(B.sku)},[]),A=x.useCallback(V=>{K(null);const{active:B,over:de,delta:ge}=V;if(!B)return;const we=B.id,ke=de==null?void 0:de.id;if(we.startsWith("holding_")){if(!(ke!=null&&ke.startsWith("line_")))return;const Pe=we.replace("holding_",""),Ze=ke.replace("line_",""),Oe=j.find(Nt=>Nt.line_name===Ze);if(!Oe)return;const Ue=p.find(Nt=>Nt.id===Pe);if(!Ue||Ue.block_type!=="cip"&&!Pi(Ze,Ue.sku,M))return;let ft=Ue.run_hours;if(Ue.block_type!=="cip"){const Nt=ua(Ue,Ze,M);Nt!==null&&(ft=Nt)}u.restoreFromHolding(Pe,Oe.line_name,Oe.line_id,0,ft);return}if(ke==="holding_area"){u.removeToHolding(we);return}const Ce=c.find(Pe=>Pe.id===we)??d.find(Pe=>Pe.id===we);if(!Ce)return;const xt=$l(ge.x/_),ln=j.findIndex(Pe=>Pe.line_name===Ce.line_name),St=Math.round(ge.y/rn),on=Math.max(0,Math.min(ln+St,j.length-1)),Ge=j[on];if(!Ge)return;if(Ge.line_name===Ce.line_name){const Pe=Math.max(0,$l(Ce.start_hour+xt));if(Pe===Ce.start_hour)return;const Ze=Pe+Ce.run_hours,Oe=[...c,...d];if(sa(Oe,Ce.line_name,Ce.id,Pe,Ze))return;u.moveBlock(Ce.id,Ce.line_name,Ce.line_id,Pe,Ce.run_hours)}else{if(Ce.block_type!=="cip"&&!Pi(Ge.line_name,Ce.sku,M))return;let Pe=Ce.run_hours;if(Ce.block_type!=="cip"){const ft=ua(Ce,Ge.line_name,M);if(ft===null)return;Pe=ft}const Ze=Math.max(0,$l(Ce.start_hour+xt)),Oe=Ze+Pe,Ue=[...c,...d];if(sa(Ue,Ge.line_name,Ce.id,Ze,Oe))return;u.moveBlock(Ce.id,Ge.line_name,Ge.line_id,Ze,Pe)}},[c,d,p,u,_,M,j]),F=x.useCallback((V,B,de)=>u.resizeBlock(V,B,de),[u]),{resizing:b,startResize:$}=Mp(l.config.min_run_hours,F),{menu:te,openMenu:se,closeMenu:ae}=jp(),ye=x.useCallback((V,B)=>{const de=[...c,...d].find(ge=>ge.id===B);de&&se(V.clientX,V.clientY,B,de.block_type,de.start_hour,de.end_hour)},[c,d,se]),[ve,fe]=x.useState(null),I=x.useCallback(V=>{const B=[...c,...d].find(de=>de.id===V);B&&fe({block:B,x:300,y:200})},[c,d]),J=x.useMemo(()=>Ip(c,d,l.demandTargets,l.capabilities),[c,d,l.demandTargets,l.capabilities]),W=x.useMemo(()=>ia(c,l.demandTargets,l.capabilities),[c,l.demandTargets,l.capabilities]),w=x.useCallback(()=>D(V=>Math.min(V*1.3,Lp)),[]),N=x.useCallback(()=>D(V=>Math.max(V/1.3,la)),[]),ce=x.useCallback(()=>{var B;const V=((B=g.current)==null?void 0:B.offsetWidth)??1200;D(Ti(V,v)),T(0)},[v]),he=x.useRef("");return x.useEffect(()=>{const V=JSON.stringify({schedule:c,cipWindows:d,holdingArea:p});V!==he.current&&(he.current=V,Up({schedule:c,cipWindows:d,holdingArea:p,lastAction:m}))},[c,d,p,m]),x.useEffect(()=>{var B;const V=((B=g.current)==null?void 0:B.scrollHeight)??800;da(V+20)}),x.useEffect(()=>{const V=B=>{B.ctrlKey&&B.key==="z"&&(B.preventDefault(),u.undo()),B.ctrlKey&&B.key==="y"&&(B.preventDefault(),u.redo()),B.key==="Escape"&&(ae(),fe(null),re(null))};return window.addEventListener("keydown",V),()=>window.removeEventListener("keydown",V)},[u,ae]),C.jsxs("div",{ref:g,style:{fontFamily:"-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif"},onClick:()=>{ae(),fe(null)},children:[C.jsx(Wp,{kpis:J}),C.jsxs(hp,{sensors:oe,onDragStart:Z,onDragEnd:A,children:[C.jsx(Gp,{schedule:c,cipWindows:d,lines:l.lines,viewStart:R,viewEnd:Math.min(U,v),hourWidth:_,anchor:q,resizing:b,highlightSku:ne,capableLines:le,onResizeStart:$,onContextMenu:ye,onBlockClick:I,onZoomIn:w,onZoomOut:N,onResetZoom:ce}),C.jsx("div",{style:{marginTop:8},children:C.jsx(Jp,{blocks:p})}),C.jsx(Pp,{})]}),C.jsx(qp,{lines:l.lines,cipDuration:l.config.cip_duration_h,onAddCip:u.addCip,onAddTrial:u.addTrial}),C.jsxs("div",{style:{marginTop:8},children:[C.jsx("strong",{style:{fontSize:13,display:"block",marginBottom:4},children:"SKU Adherence (live) — click a row to highlight on chart"}),C.jsx(eh,{rows:W,highlightSku:ne,onSkuClick:re})]}),C.jsx(th,{menu:te,onSplit:u.splitBlock,onRemove:u.removeToHolding,onDetails:I,onClose:ae,minRunHours:l.config.min_run_hours}),ve&&C.jsx(nh,{block:ve.block,x:ve.x,y:ve.y,rate:zi(ve.block.line_name,ve.block.sku,l.capabilities),onClose:()=>fe(null)}),m&&C.jsxs("div",{style:{fontSize:11,color:"#888",marginTop:4},children:["Last action: ",m]})]})},lh=()=>{const[l,s]=x.useState(null);return x.useEffect(()=>{Fp(u=>{u.args&&s(u.args)}),Bp(),da(200)},[]),l?C.jsx(rh,{args:l}):C.jsx("div",{style:{padding:20,textAlign:"center",color:"#888"},children:"Waiting for schedule data from Streamlit..."})};tf.createRoot(document.getElementById("root")).render(C.jsx(lh,{}))})();
+  `},hf={onDragStart(l){let{active:s}=l;return"Picked up draggable item "+s.id+"."},onDragOver(l){let{active:s,over:u}=l;return u?"Draggable item "+s.id+" was moved over droppable area "+u.id+".":"Draggable item "+s.id+" is no longer over a droppable area."},onDragEnd(l){let{active:s,over:u}=l;return u?"Draggable item "+s.id+" was dropped over droppable area "+u.id:"Draggable item "+s.id+" was dropped."},onDragCancel(l){let{active:s}=l;return"Dragging was cancelled. Draggable item "+s.id+" was dropped."}};function vf(l){let{announcements:s=hf,container:u,hiddenTextDescribedById:c,screenReaderInstructions:d=pf}=l;const{announce:p,announcement:m}=cf(),v=jl("DndLiveRegion"),[g,_]=x.useState(!1);if(x.useEffect(()=>{_(!0)},[]),df(x.useMemo(()=>({onDragStart(R){let{active:T}=R;p(s.onDragStart({active:T}))},onDragMove(R){let{active:T,over:U}=R;s.onDragMove&&p(s.onDragMove({active:T,over:U}))},onDragOver(R){let{active:T,over:U}=R;p(s.onDragOver({active:T,over:U}))},onDragEnd(R){let{active:T,over:U}=R;p(s.onDragEnd({active:T,over:U}))},onDragCancel(R){let{active:T,over:U}=R;p(s.onDragCancel({active:T,over:U}))}}),[p,s])),!g)return null;const D=Ae.createElement(Ae.Fragment,null,Ae.createElement(sf,{id:c,value:d.draggable}),Ae.createElement(af,{id:v,announcement:m}));return u?Lr.createPortal(D,u):D}var He;(function(l){l.DragStart="dragStart",l.DragMove="dragMove",l.DragEnd="dragEnd",l.DragCancel="dragCancel",l.DragOver="dragOver",l.RegisterDroppable="registerDroppable",l.SetDroppableDisabled="setDroppableDisabled",l.UnregisterDroppable="unregisterDroppable"})(He||(He={}));function Al(){}function mf(l,s){return x.useMemo(()=>({sensor:l,options:s??{}}),[l,s])}function gf(){for(var l=arguments.length,s=new Array(l),u=0;u<l;u++)s[u]=arguments[u];return x.useMemo(()=>[...s].filter(c=>c!=null),[...s])}const It=Object.freeze({x:0,y:0});function yf(l,s){const u=Il(l);if(!u)return"0 0";const c={x:(u.x-s.left)/s.width*100,y:(u.y-s.top)/s.height*100};return c.x+"% "+c.y+"%"}function wf(l,s){let{data:{value:u}}=l,{data:{value:c}}=s;return c-u}function xf(l,s){if(!l||l.length===0)return null;const[u]=l;return u[s]}function Sf(l,s){const u=Math.max(s.top,l.top),c=Math.max(s.left,l.left),d=Math.min(s.left+s.width,l.left+l.width),p=Math.min(s.top+s.height,l.top+l.height),m=d-c,v=p-u;if(c<d&&u<p){const g=s.width*s.height,_=l.width*l.height,D=m*v,R=D/(g+_-D);return Number(R.toFixed(4))}return 0}const kf=l=>{let{collisionRect:s,droppableRects:u,droppableContainers:c}=l;const d=[];for(const p of c){const{id:m}=p,v=u.get(m);if(v){const g=Sf(v,s);g>0&&d.push({id:m,data:{droppableContainer:p,value:g}})}}return d.sort(wf)};function Cf(l,s,u){return{...l,scaleX:s&&u?s.width/u.width:1,scaleY:s&&u?s.height/u.height:1}}function Ts(l,s){return l&&s?{x:l.left-s.left,y:l.top-s.top}:It}function Ef(l){return function(u){for(var c=arguments.length,d=new Array(c>1?c-1:0),p=1;p<c;p++)d[p-1]=arguments[p];return d.reduce((m,v)=>({...m,top:m.top+l*v.y,bottom:m.bottom+l*v.y,left:m.left+l*v.x,right:m.right+l*v.x}),{...u})}}const _f=Ef(1);function Ps(l){if(l.startsWith("matrix3d(")){const s=l.slice(9,-1).split(/, /);return{x:+s[12],y:+s[13],scaleX:+s[0],scaleY:+s[5]}}else if(l.startsWith("matrix(")){const s=l.slice(7,-1).split(/, /);return{x:+s[4],y:+s[5],scaleX:+s[0],scaleY:+s[3]}}return null}function Rf(l,s,u){const c=Ps(s);if(!c)return l;const{scaleX:d,scaleY:p,x:m,y:v}=c,g=l.left-m-(1-d)*parseFloat(u),_=l.top-v-(1-p)*parseFloat(u.slice(u.indexOf(" ")+1)),D=d?l.width/d:l.width,R=p?l.height/p:l.height;return{width:D,height:R,top:_,right:g+D,bottom:_+R,left:g}}const Df={ignoreTransform:!1};function Ar(l,s){s===void 0&&(s=Df);let u=l.getBoundingClientRect();if(s.ignoreTransform){const{transform:_,transformOrigin:D}=ut(l).getComputedStyle(l);_&&(u=Rf(u,_,D))}const{top:c,left:d,width:p,height:m,bottom:v,right:g}=u;return{top:c,left:d,width:p,height:m,bottom:v,right:g}}function zs(l){return Ar(l,{ignoreTransform:!0})}function Nf(l){const s=l.innerWidth,u=l.innerHeight;return{top:0,left:0,right:s,bottom:u,width:s,height:u}}function Tf(l,s){return s===void 0&&(s=ut(l).getComputedStyle(l)),s.position==="fixed"}function Pf(l,s){s===void 0&&(s=ut(l).getComputedStyle(l));const u=/(auto|scroll|overlay)/;return["overflow","overflowX","overflowY"].some(d=>{const p=s[d];return typeof p=="string"?u.test(p):!1})}function gi(l,s){const u=[];function c(d){if(s!=null&&u.length>=s||!d)return u;if(hi(d)&&d.scrollingElement!=null&&!u.includes(d.scrollingElement))return u.push(d.scrollingElement),u;if(!Mr(d)||_s(d)||u.includes(d))return u;const p=ut(l).getComputedStyle(d);return d!==l&&Pf(d,p)&&u.push(d),Tf(d,p)?u:c(d.parentNode)}return l?c(l):u}function Ls(l){const[s]=gi(l,1);return s??null}function yi(l){return!Pl||!l?null:er(l)?l:pi(l)?hi(l)||l===tr(l).scrollingElement?window:Mr(l)?l:null:null}function Ms(l){return er(l)?l.scrollX:l.scrollLeft}function js(l){return er(l)?l.scrollY:l.scrollTop}function wi(l){return{x:Ms(l),y:js(l)}}var Qe;(function(l){l[l.Forward=1]="Forward",l[l.Backward=-1]="Backward"})(Qe||(Qe={}));function Os(l){return!Pl||!l?!1:l===document.scrollingElement}function Is(l){const s={x:0,y:0},u=Os(l)?{height:window.innerHeight,width:window.innerWidth}:{height:l.clientHeight,width:l.clientWidth},c={x:l.scrollWidth-u.width,y:l.scrollHeight-u.height},d=l.scrollTop<=s.y,p=l.scrollLeft<=s.x,m=l.scrollTop>=c.y,v=l.scrollLeft>=c.x;return{isTop:d,isLeft:p,isBottom:m,isRight:v,maxScroll:c,minScroll:s}}const zf={x:.2,y:.2};function Lf(l,s,u,c,d){let{top:p,left:m,right:v,bottom:g}=u;c===void 0&&(c=10),d===void 0&&(d=zf);const{isTop:_,isBottom:D,isLeft:R,isRight:T}=Is(l),U={x:0,y:0},q={x:0,y:0},M={height:s.height*d.y,width:s.width*d.x};return!_&&p<=s.top+M.height?(U.y=Qe.Backward,q.y=c*Math.abs((s.top+M.height-p)/M.height)):!D&&g>=s.bottom-M.height&&(U.y=Qe.Forward,q.y=c*Math.abs((s.bottom-M.height-g)/M.height)),!T&&v>=s.right-M.width?(U.x=Qe.Forward,q.x=c*Math.abs((s.right-M.width-v)/M.width)):!R&&m<=s.left+M.width&&(U.x=Qe.Backward,q.x=c*Math.abs((s.left+M.width-m)/M.width)),{direction:U,speed:q}}function Mf(l){if(l===document.scrollingElement){const{innerWidth:p,innerHeight:m}=window;return{top:0,left:0,right:p,bottom:m,width:p,height:m}}const{top:s,left:u,right:c,bottom:d}=l.getBoundingClientRect();return{top:s,left:u,right:c,bottom:d,width:l.clientWidth,height:l.clientHeight}}function As(l){return l.reduce((s,u)=>nr(s,wi(u)),It)}function jf(l){return l.reduce((s,u)=>s+Ms(u),0)}function Of(l){return l.reduce((s,u)=>s+js(u),0)}function Fs(l,s){if(s===void 0&&(s=Ar),!l)return;const{top:u,left:c,bottom:d,right:p}=s(l);Ls(l)&&(d<=0||p<=0||u>=window.innerHeight||c>=window.innerWidth)&&l.scrollIntoView({block:"center",inline:"center"})}const If=[["x",["left","right"],jf],["y",["top","bottom"],Of]];class xi{constructor(s,u){this.rect=void 0,this.width=void 0,this.height=void 0,this.top=void 0,this.bottom=void 0,this.right=void 0,this.left=void 0;const c=gi(u),d=As(c);this.rect={...s},this.width=s.width,this.height=s.height;for(const[p,m,v]of If)for(const g of m)Object.defineProperty(this,g,{get:()=>{const _=v(c),D=d[p]-_;return this.rect[g]+D},enumerable:!0});Object.defineProperty(this,"rect",{enumerable:!1})}}class Fr{constructor(s){this.target=void 0,this.listeners=[],this.removeAll=()=>{this.listeners.forEach(u=>{var c;return(c=this.target)==null?void 0:c.removeEventListener(...u)})},this.target=s}add(s,u,c){var d;(d=this.target)==null||d.addEventListener(s,u,c),this.listeners.push([s,u,c])}}function Af(l){const{EventTarget:s}=ut(l);return l instanceof s?l:tr(l)}function Si(l,s){const u=Math.abs(l.x),c=Math.abs(l.y);return typeof s=="number"?Math.sqrt(u**2+c**2)>s:"x"in s&&"y"in s?u>s.x&&c>s.y:"x"in s?u>s.x:"y"in s?c>s.y:!1}var Dt;(function(l){l.Click="click",l.DragStart="dragstart",l.Keydown="keydown",l.ContextMenu="contextmenu",l.Resize="resize",l.SelectionChange="selectionchange",l.VisibilityChange="visibilitychange"})(Dt||(Dt={}));function Bs(l){l.preventDefault()}function Ff(l){l.stopPropagation()}var _e;(function(l){l.Space="Space",l.Down="ArrowDown",l.Right="ArrowRight",l.Left="ArrowLeft",l.Up="ArrowUp",l.Esc="Escape",l.Enter="Enter",l.Tab="Tab"})(_e||(_e={}));const Us={start:[_e.Space,_e.Enter],cancel:[_e.Esc],end:[_e.Space,_e.Enter,_e.Tab]},Bf=(l,s)=>{let{currentCoordinates:u}=s;switch(l.code){case _e.Right:return{...u,x:u.x+25};case _e.Left:return{...u,x:u.x-25};case _e.Down:return{...u,y:u.y+25};case _e.Up:return{...u,y:u.y-25}}};class Ws{constructor(s){this.props=void 0,this.autoScrollEnabled=!1,this.referenceCoordinates=void 0,this.listeners=void 0,this.windowListeners=void 0,this.props=s;const{event:{target:u}}=s;this.props=s,this.listeners=new Fr(tr(u)),this.windowListeners=new Fr(ut(u)),this.handleKeyDown=this.handleKeyDown.bind(this),this.handleCancel=this.handleCancel.bind(this),this.attach()}attach(){this.handleStart(),this.windowListeners.add(Dt.Resize,this.handleCancel),this.windowListeners.add(Dt.VisibilityChange,this.handleCancel),setTimeout(()=>this.listeners.add(Dt.Keydown,this.handleKeyDown))}handleStart(){const{activeNode:s,onStart:u}=this.props,c=s.node.current;c&&Fs(c),u(It)}handleKeyDown(s){if(mi(s)){const{active:u,context:c,options:d}=this.props,{keyboardCodes:p=Us,coordinateGetter:m=Bf,scrollBehavior:v="smooth"}=d,{code:g}=s;if(p.end.includes(g)){this.handleEnd(s);return}if(p.cancel.includes(g)){this.handleCancel(s);return}const{collisionRect:_}=c.current,D=_?{x:_.left,y:_.top}:It;this.referenceCoordinates||(this.referenceCoordinates=D);const R=m(s,{active:u,context:c.current,currentCoordinates:D});if(R){const T=Ol(R,D),U={x:0,y:0},{scrollableAncestors:q}=c.current;for(const M of q){const j=s.code,{isTop:ne,isRight:re,isLeft:Q,isBottom:K,maxScroll:le,minScroll:oe}=Is(M),Z=Mf(M),A={x:Math.min(j===_e.Right?Z.right-Z.width/2:Z.right,Math.max(j===_e.Right?Z.left:Z.left+Z.width/2,R.x)),y:Math.min(j===_e.Down?Z.bottom-Z.height/2:Z.bottom,Math.max(j===_e.Down?Z.top:Z.top+Z.height/2,R.y))},F=j===_e.Right&&!re||j===_e.Left&&!Q,b=j===_e.Down&&!K||j===_e.Up&&!ne;if(F&&A.x!==R.x){const $=M.scrollLeft+T.x,te=j===_e.Right&&$<=le.x||j===_e.Left&&$>=oe.x;if(te&&!T.y){M.scrollTo({left:$,behavior:v});return}te?U.x=M.scrollLeft-$:U.x=j===_e.Right?M.scrollLeft-le.x:M.scrollLeft-oe.x,U.x&&M.scrollBy({left:-U.x,behavior:v});break}else if(b&&A.y!==R.y){const $=M.scrollTop+T.y,te=j===_e.Down&&$<=le.y||j===_e.Up&&$>=oe.y;if(te&&!T.x){M.scrollTo({top:$,behavior:v});return}te?U.y=M.scrollTop-$:U.y=j===_e.Down?M.scrollTop-le.y:M.scrollTop-oe.y,U.y&&M.scrollBy({top:-U.y,behavior:v});break}}this.handleMove(s,nr(Ol(R,this.referenceCoordinates),U))}}}handleMove(s,u){const{onMove:c}=this.props;s.preventDefault(),c(u)}handleEnd(s){const{onEnd:u}=this.props;s.preventDefault(),this.detach(),u()}handleCancel(s){const{onCancel:u}=this.props;s.preventDefault(),this.detach(),u()}detach(){this.listeners.removeAll(),this.windowListeners.removeAll()}}Ws.activators=[{eventName:"onKeyDown",handler:(l,s,u)=>{let{keyboardCodes:c=Us,onActivation:d}=s,{active:p}=u;const{code:m}=l.nativeEvent;if(c.start.includes(m)){const v=p.activatorNode.current;return v&&l.target!==v?!1:(l.preventDefault(),d==null||d({event:l.nativeEvent}),!0)}return!1}}];function Hs(l){return!!(l&&"distance"in l)}function $s(l){return!!(l&&"delay"in l)}class ki{constructor(s,u,c){var d;c===void 0&&(c=Af(s.event.target)),this.props=void 0,this.events=void 0,this.autoScrollEnabled=!0,this.document=void 0,this.activated=!1,this.initialCoordinates=void 0,this.timeoutId=null,this.listeners=void 0,this.documentListeners=void 0,this.windowListeners=void 0,this.props=s,this.events=u;const{event:p}=s,{target:m}=p;this.props=s,this.events=u,this.document=tr(m),this.documentListeners=new Fr(this.document),this.listeners=new Fr(c),this.windowListeners=new Fr(ut(m)),this.initialCoordinates=(d=Il(p))!=null?d:It,this.handleStart=this.handleStart.bind(this),this.handleMove=this.handleMove.bind(this),this.handleEnd=this.handleEnd.bind(this),this.handleCancel=this.handleCancel.bind(this),this.handleKeydown=this.handleKeydown.bind(this),this.removeTextSelection=this.removeTextSelection.bind(this),this.attach()}attach(){const{events:s,props:{options:{activationConstraint:u,bypassActivationConstraint:c}}}=this;if(this.listeners.add(s.move.name,this.handleMove,{passive:!1}),this.listeners.add(s.end.name,this.handleEnd),s.cancel&&this.listeners.add(s.cancel.name,this.handleCancel),this.windowListeners.add(Dt.Resize,this.handleCancel),this.windowListeners.add(Dt.DragStart,Bs),this.windowListeners.add(Dt.VisibilityChange,this.handleCancel),this.windowListeners.add(Dt.ContextMenu,Bs),this.documentListeners.add(Dt.Keydown,this.handleKeydown),u){if(c!=null&&c({event:this.props.event,activeNode:this.props.activeNode,options:this.props.options}))return this.handleStart();if($s(u)){this.timeoutId=setTimeout(this.handleStart,u.delay),this.handlePending(u);return}if(Hs(u)){this.handlePending(u);return}}this.handleStart()}detach(){this.listeners.removeAll(),this.windowListeners.removeAll(),setTimeout(this.documentListeners.removeAll,50),this.timeoutId!==null&&(clearTimeout(this.timeoutId),this.timeoutId=null)}handlePending(s,u){const{active:c,onPending:d}=this.props;d(c,s,this.initialCoordinates,u)}handleStart(){const{initialCoordinates:s}=this,{onStart:u}=this.props;s&&(this.activated=!0,this.documentListeners.add(Dt.Click,Ff,{capture:!0}),this.removeTextSelection(),this.documentListeners.add(Dt.SelectionChange,this.removeTextSelection),u(s))}handleMove(s){var u;const{activated:c,initialCoordinates:d,props:p}=this,{onMove:m,options:{activationConstraint:v}}=p;if(!d)return;const g=(u=Il(s))!=null?u:It,_=Ol(d,g);if(!c&&v){if(Hs(v)){if(v.tolerance!=null&&Si(_,v.tolerance))return this.handleCancel();if(Si(_,v.distance))return this.handleStart()}if($s(v)&&Si(_,v.tolerance))return this.handleCancel();this.handlePending(v,_);return}s.cancelable&&s.preventDefault(),m(g)}handleEnd(){const{onAbort:s,onEnd:u}=this.props;this.detach(),this.activated||s(this.props.active),u()}handleCancel(){const{onAbort:s,onCancel:u}=this.props;this.detach(),this.activated||s(this.props.active),u()}handleKeydown(s){s.code===_e.Esc&&this.handleCancel()}removeTextSelection(){var s;(s=this.document.getSelection())==null||s.removeAllRanges()}}const Uf={cancel:{name:"pointercancel"},move:{name:"pointermove"},end:{name:"pointerup"}};class Ci extends ki{constructor(s){const{event:u}=s,c=tr(u.target);super(s,Uf,c)}}Ci.activators=[{eventName:"onPointerDown",handler:(l,s)=>{let{nativeEvent:u}=l,{onActivation:c}=s;return!u.isPrimary||u.button!==0?!1:(c==null||c({event:u}),!0)}}];const Wf={move:{name:"mousemove"},end:{name:"mouseup"}};var Ei;(function(l){l[l.RightClick=2]="RightClick"})(Ei||(Ei={}));class Hf extends ki{constructor(s){super(s,Wf,tr(s.event.target))}}Hf.activators=[{eventName:"onMouseDown",handler:(l,s)=>{let{nativeEvent:u}=l,{onActivation:c}=s;return u.button===Ei.RightClick?!1:(c==null||c({event:u}),!0)}}];const _i={cancel:{name:"touchcancel"},move:{name:"touchmove"},end:{name:"touchend"}};class $f extends ki{constructor(s){super(s,_i)}static setup(){return window.addEventListener(_i.move.name,s,{capture:!1,passive:!1}),function(){window.removeEventListener(_i.move.name,s)};function s(){}}}$f.activators=[{eventName:"onTouchStart",handler:(l,s)=>{let{nativeEvent:u}=l,{onActivation:c}=s;const{touches:d}=u;return d.length>1?!1:(c==null||c({event:u}),!0)}}];var Br;(function(l){l[l.Pointer=0]="Pointer",l[l.DraggableRect=1]="DraggableRect"})(Br||(Br={}));var Fl;(function(l){l[l.TreeOrder=0]="TreeOrder",l[l.ReversedTreeOrder=1]="ReversedTreeOrder"})(Fl||(Fl={}));function Vf(l){let{acceleration:s,activator:u=Br.Pointer,canScroll:c,draggingRect:d,enabled:p,interval:m=5,order:v=Fl.TreeOrder,pointerCoordinates:g,scrollableAncestors:_,scrollableAncestorRects:D,delta:R,threshold:T}=l;const U=Kf({delta:R,disabled:!p}),[q,M]=nf(),j=x.useRef({x:0,y:0}),ne=x.useRef({x:0,y:0}),re=x.useMemo(()=>{switch(u){case Br.Pointer:return g?{top:g.y,bottom:g.y,left:g.x,right:g.x}:null;case Br.DraggableRect:return d}},[u,d,g]),Q=x.useRef(null),K=x.useCallback(()=>{const oe=Q.current;if(!oe)return;const Z=j.current.x*ne.current.x,A=j.current.y*ne.current.y;oe.scrollBy(Z,A)},[]),le=x.useMemo(()=>v===Fl.TreeOrder?[..._].reverse():_,[v,_]);x.useEffect(()=>{if(!p||!_.length||!re){M();return}for(const oe of le){if((c==null?void 0:c(oe))===!1)continue;const Z=_.indexOf(oe),A=D[Z];if(!A)continue;const{direction:F,speed:b}=Lf(oe,A,re,s,T);for(const $ of["x","y"])U[$][F[$]]||(b[$]=0,F[$]=0);if(b.x>0||b.y>0){M(),Q.current=oe,q(K,m),j.current=b,ne.current=F;return}}j.current={x:0,y:0},ne.current={x:0,y:0},M()},[s,K,c,M,p,m,JSON.stringify(re),JSON.stringify(U),q,_,le,D,JSON.stringify(T)])}const Qf={x:{[Qe.Backward]:!1,[Qe.Forward]:!1},y:{[Qe.Backward]:!1,[Qe.Forward]:!1}};function Kf(l){let{delta:s,disabled:u}=l;const c=Ml(s);return Or(d=>{if(u||!c||!d)return Qf;const p={x:Math.sign(s.x-c.x),y:Math.sign(s.y-c.y)};return{x:{[Qe.Backward]:d.x[Qe.Backward]||p.x===-1,[Qe.Forward]:d.x[Qe.Forward]||p.x===1},y:{[Qe.Backward]:d.y[Qe.Backward]||p.y===-1,[Qe.Forward]:d.y[Qe.Forward]||p.y===1}}},[u,s,c])}function Xf(l,s){const u=s!=null?l.get(s):void 0,c=u?u.node.current:null;return Or(d=>{var p;return s==null?null:(p=c??d)!=null?p:null},[c,s])}function Yf(l,s){return x.useMemo(()=>l.reduce((u,c)=>{const{sensor:d}=c,p=d.activators.map(m=>({eventName:m.eventName,handler:s(m.handler,c)}));return[...u,...p]},[]),[l,s])}var Ur;(function(l){l[l.Always=0]="Always",l[l.BeforeDragging=1]="BeforeDragging",l[l.WhileDragging=2]="WhileDragging"})(Ur||(Ur={}));var Ri;(function(l){l.Optimized="optimized"})(Ri||(Ri={}));const Vs=new Map;function Gf(l,s){let{dragging:u,dependencies:c,config:d}=s;const[p,m]=x.useState(null),{frequency:v,measure:g,strategy:_}=d,D=x.useRef(l),R=j(),T=jr(R),U=x.useCallback(function(ne){ne===void 0&&(ne=[]),!T.current&&m(re=>re===null?ne:re.concat(ne.filter(Q=>!re.includes(Q))))},[T]),q=x.useRef(null),M=Or(ne=>{if(R&&!u)return Vs;if(!ne||ne===Vs||D.current!==l||p!=null){const re=new Map;for(let Q of l){if(!Q)continue;if(p&&p.length>0&&!p.includes(Q.id)&&Q.rect.current){re.set(Q.id,Q.rect.current);continue}const K=Q.node.current,le=K?new xi(g(K),K):null;Q.rect.current=le,le&&re.set(Q.id,le)}return re}return ne},[l,p,u,R,g]);return x.useEffect(()=>{D.current=l},[l]),x.useEffect(()=>{R||U()},[u,R]),x.useEffect(()=>{p&&p.length>0&&m(null)},[JSON.stringify(p)]),x.useEffect(()=>{R||typeof v!="number"||q.current!==null||(q.current=setTimeout(()=>{U(),q.current=null},v))},[v,R,U,...c]),{droppableRects:M,measureDroppableContainers:U,measuringScheduled:p!=null};function j(){switch(_){case Ur.Always:return!1;case Ur.BeforeDragging:return u;default:return!u}}}function Di(l,s){return Or(u=>l?u||(typeof s=="function"?s(l):l):null,[s,l])}function Zf(l,s){return Di(l,s)}function Jf(l){let{callback:s,disabled:u}=l;const c=zl(s),d=x.useMemo(()=>{if(u||typeof window>"u"||typeof window.MutationObserver>"u")return;const{MutationObserver:p}=window;return new p(c)},[c,u]);return x.useEffect(()=>()=>d==null?void 0:d.disconnect(),[d]),d}function Bl(l){let{callback:s,disabled:u}=l;const c=zl(s),d=x.useMemo(()=>{if(u||typeof window>"u"||typeof window.ResizeObserver>"u")return;const{ResizeObserver:p}=window;return new p(c)},[u]);return x.useEffect(()=>()=>d==null?void 0:d.disconnect(),[d]),d}function qf(l){return new xi(Ar(l),l)}function Qs(l,s,u){s===void 0&&(s=qf);const[c,d]=x.useState(null);function p(){d(g=>{if(!l)return null;if(l.isConnected===!1){var _;return(_=g??u)!=null?_:null}const D=s(l);return JSON.stringify(g)===JSON.stringify(D)?g:D})}const m=Jf({callback(g){if(l)for(const _ of g){const{type:D,target:R}=_;if(D==="childList"&&R instanceof HTMLElement&&R.contains(l)){p();break}}}}),v=Bl({callback:p});return nn(()=>{p(),l?(v==null||v.observe(l),m==null||m.observe(document.body,{childList:!0,subtree:!0})):(v==null||v.disconnect(),m==null||m.disconnect())},[l]),c}function bf(l){const s=Di(l);return Ts(l,s)}const Ks=[];function ep(l){const s=x.useRef(l),u=Or(c=>l?c&&c!==Ks&&l&&s.current&&l.parentNode===s.current.parentNode?c:gi(l):Ks,[l]);return x.useEffect(()=>{s.current=l},[l]),u}function tp(l){const[s,u]=x.useState(null),c=x.useRef(l),d=x.useCallback(p=>{const m=yi(p.target);m&&u(v=>v?(v.set(m,wi(m)),new Map(v)):null)},[]);return x.useEffect(()=>{const p=c.current;if(l!==p){m(p);const v=l.map(g=>{const _=yi(g);return _?(_.addEventListener("scroll",d,{passive:!0}),[_,wi(_)]):null}).filter(g=>g!=null);u(v.length?new Map(v):null),c.current=l}return()=>{m(l),m(p)};function m(v){v.forEach(g=>{const _=yi(g);_==null||_.removeEventListener("scroll",d)})}},[d,l]),x.useMemo(()=>l.length?s?Array.from(s.values()).reduce((p,m)=>nr(p,m),It):As(l):It,[l,s])}function Xs(l,s){s===void 0&&(s=[]);const u=x.useRef(null);return x.useEffect(()=>{u.current=null},s),x.useEffect(()=>{const c=l!==It;c&&!u.current&&(u.current=l),!c&&u.current&&(u.current=null)},[l]),u.current?Ol(l,u.current):It}function np(l){x.useEffect(()=>{if(!Pl)return;const s=l.map(u=>{let{sensor:c}=u;return c.setup==null?void 0:c.setup()});return()=>{for(const u of s)u==null||u()}},l.map(s=>{let{sensor:u}=s;return u}))}function rp(l,s){return x.useMemo(()=>l.reduce((u,c)=>{let{eventName:d,handler:p}=c;return u[d]=m=>{p(m,s)},u},{}),[l,s])}function Ys(l){return x.useMemo(()=>l?Nf(l):null,[l])}const Gs=[];function lp(l,s){s===void 0&&(s=Ar);const[u]=l,c=Ys(u?ut(u):null),[d,p]=x.useState(Gs);function m(){p(()=>l.length?l.map(g=>Os(g)?c:new xi(s(g),g)):Gs)}const v=Bl({callback:m});return nn(()=>{v==null||v.disconnect(),m(),l.forEach(g=>v==null?void 0:v.observe(g))},[l]),d}function Zs(l){if(!l)return null;if(l.children.length>1)return l;const s=l.children[0];return Mr(s)?s:l}function op(l){let{measure:s}=l;const[u,c]=x.useState(null),d=x.useCallback(_=>{for(const{target:D}of _)if(Mr(D)){c(R=>{const T=s(D);return R?{...R,width:T.width,height:T.height}:T});break}},[s]),p=Bl({callback:d}),m=x.useCallback(_=>{const D=Zs(_);p==null||p.disconnect(),D&&(p==null||p.observe(D)),c(D?s(D):null)},[s,p]),[v,g]=Ll(m);return x.useMemo(()=>({nodeRef:v,rect:u,setRef:g}),[u,v,g])}const ip=[{sensor:Ci,options:{}},{sensor:Ws,options:{}}],up={current:{}},Ul={draggable:{measure:zs},droppable:{measure:zs,strategy:Ur.WhileDragging,frequency:Ri.Optimized},dragOverlay:{measure:Ar}};class Wr extends Map{get(s){var u;return s!=null&&(u=super.get(s))!=null?u:void 0}toArray(){return Array.from(this.values())}getEnabled(){return this.toArray().filter(s=>{let{disabled:u}=s;return!u})}getNodeFor(s){var u,c;return(u=(c=this.get(s))==null?void 0:c.node.current)!=null?u:void 0}}const sp={activatorEvent:null,active:null,activeNode:null,activeNodeRect:null,collisions:null,containerNodeRect:null,draggableNodes:new Map,droppableRects:new Map,droppableContainers:new Wr,over:null,dragOverlay:{nodeRef:{current:null},rect:null,setRef:Al},scrollableAncestors:[],scrollableAncestorRects:[],measuringConfiguration:Ul,measureDroppableContainers:Al,windowRect:null,measuringScheduled:!1},Js={activatorEvent:null,activators:[],active:null,activeNodeRect:null,ariaDescribedById:{draggable:""},dispatch:Al,draggableNodes:new Map,over:null,measureDroppableContainers:Al},Hr=x.createContext(Js),qs=x.createContext(sp);function ap(){return{draggable:{active:null,initialCoordinates:{x:0,y:0},nodes:new Map,translate:{x:0,y:0}},droppable:{containers:new Wr}}}function cp(l,s){switch(s.type){case He.DragStart:return{...l,draggable:{...l.draggable,initialCoordinates:s.initialCoordinates,active:s.active}};case He.DragMove:return l.draggable.active==null?l:{...l,draggable:{...l.draggable,translate:{x:s.coordinates.x-l.draggable.initialCoordinates.x,y:s.coordinates.y-l.draggable.initialCoordinates.y}}};case He.DragEnd:case He.DragCancel:return{...l,draggable:{...l.draggable,active:null,initialCoordinates:{x:0,y:0},translate:{x:0,y:0}}};case He.RegisterDroppable:{const{element:u}=s,{id:c}=u,d=new Wr(l.droppable.containers);return d.set(c,u),{...l,droppable:{...l.droppable,containers:d}}}case He.SetDroppableDisabled:{const{id:u,key:c,disabled:d}=s,p=l.droppable.containers.get(u);if(!p||c!==p.key)return l;const m=new Wr(l.droppable.containers);return m.set(u,{...p,disabled:d}),{...l,droppable:{...l.droppable,containers:m}}}case He.UnregisterDroppable:{const{id:u,key:c}=s,d=l.droppable.containers.get(u);if(!d||c!==d.key)return l;const p=new Wr(l.droppable.containers);return p.delete(u),{...l,droppable:{...l.droppable,containers:p}}}default:return l}}function dp(l){let{disabled:s}=l;const{active:u,activatorEvent:c,draggableNodes:d}=x.useContext(Hr),p=Ml(c),m=Ml(u==null?void 0:u.id);return x.useEffect(()=>{if(!s&&!c&&p&&m!=null){if(!mi(p)||document.activeElement===p.target)return;const v=d.get(m);if(!v)return;const{activatorNode:g,node:_}=v;if(!g.current&&!_.current)return;requestAnimationFrame(()=>{for(const D of[g.current,_.current]){if(!D)continue;const R=of(D);if(R){R.focus();break}}})}},[c,s,d,m,p]),null}function bs(l,s){let{transform:u,...c}=s;return l!=null&&l.length?l.reduce((d,p)=>p({transform:d,...c}),u):u}function fp(l){return x.useMemo(()=>({draggable:{...Ul.draggable,...l==null?void 0:l.draggable},droppable:{...Ul.droppable,...l==null?void 0:l.droppable},dragOverlay:{...Ul.dragOverlay,...l==null?void 0:l.dragOverlay}}),[l==null?void 0:l.draggable,l==null?void 0:l.droppable,l==null?void 0:l.dragOverlay])}function pp(l){let{activeNode:s,measure:u,initialRect:c,config:d=!0}=l;const p=x.useRef(!1),{x:m,y:v}=typeof d=="boolean"?{x:d,y:d}:d;nn(()=>{if(!m&&!v||!s){p.current=!1;return}if(p.current||!c)return;const _=s==null?void 0:s.node.current;if(!_||_.isConnected===!1)return;const D=u(_),R=Ts(D,c);if(m||(R.x=0),v||(R.y=0),p.current=!0,Math.abs(R.x)>0||Math.abs(R.y)>0){const T=Ls(_);T&&T.scrollBy({top:R.y,left:R.x})}},[s,m,v,c,u])}const Wl=x.createContext({...It,scaleX:1,scaleY:1});var gn;(function(l){l[l.Uninitialized=0]="Uninitialized",l[l.Initializing=1]="Initializing",l[l.Initialized=2]="Initialized"})(gn||(gn={}));const hp=x.memo(function(s){var u,c,d,p;let{id:m,accessibility:v,autoScroll:g=!0,children:_,sensors:D=ip,collisionDetection:R=kf,measuring:T,modifiers:U,...q}=s;const M=x.useReducer(cp,void 0,ap),[j,ne]=M,[re,Q]=ff(),[K,le]=x.useState(gn.Uninitialized),oe=K===gn.Initialized,{draggable:{active:Z,nodes:A,translate:F},droppable:{containers:b}}=j,$=Z!=null?A.get(Z):null,te=x.useRef({initial:null,translated:null}),se=x.useMemo(()=>{var ze;return Z!=null?{id:Z,data:(ze=$==null?void 0:$.data)!=null?ze:up,rect:te}:null},[Z,$]),ae=x.useRef(null),[ye,ve]=x.useState(null),[fe,I]=x.useState(null),J=jr(q,Object.values(q)),W=jl("DndDescribedBy",m),w=x.useMemo(()=>b.getEnabled(),[b]),N=fp(T),{droppableRects:ce,measureDroppableContainers:he,measuringScheduled:V}=Gf(w,{dragging:oe,dependencies:[F.x,F.y],config:N.droppable}),B=Xf(A,Z),de=x.useMemo(()=>fe?Il(fe):null,[fe]),ge=xn(),we=Zf(B,N.draggable.measure);pp({activeNode:Z!=null?A.get(Z):null,config:ge.layoutShiftCompensation,initialRect:we,measure:N.draggable.measure});const ke=Qs(B,N.draggable.measure,we),Ce=Qs(B?B.parentElement:null),xt=x.useRef({activatorEvent:null,active:null,activeNode:B,collisionRect:null,collisions:null,droppableRects:ce,draggableNodes:A,draggingNode:null,draggingNodeRect:null,droppableContainers:b,over:null,scrollableAncestors:[],scrollAdjustedTranslate:null}),ln=b.getNodeFor((u=xt.current.over)==null?void 0:u.id),St=op({measure:N.dragOverlay.measure}),on=(c=St.nodeRef.current)!=null?c:B,Ge=oe?(d=St.rect)!=null?d:ke:null,Un=!!(St.nodeRef.current&&St.rect),Pe=bf(Un?null:ke),Ze=Ys(on?ut(on):null),Oe=ep(oe?ln??B:null),Ue=lp(Oe),ft=bs(U,{transform:{x:F.x-Pe.x,y:F.y-Pe.y,scaleX:1,scaleY:1},activatorEvent:fe,active:se,activeNodeRect:ke,containerNodeRect:Ce,draggingNodeRect:Ge,over:xt.current.over,overlayNodeRect:St.rect,scrollableAncestors:Oe,scrollableAncestorRects:Ue,windowRect:Ze}),Nt=de?nr(de,F):null,Vr=tp(Oe),Zl=Xs(Vr),Jl=Xs(Vr,[ke]),Gt=nr(ft,Zl),At=Ge?_f(Ge,ft):null,yn=se&&At?R({active:se,collisionRect:At,droppableRects:ce,droppableContainers:w,pointerCoordinates:Nt}):null,wn=xf(yn,"id"),[pt,ql]=x.useState(null),bl=Un?ft:nr(ft,Jl),eo=Cf(bl,(p=pt==null?void 0:pt.rect)!=null?p:null,ke),Qr=x.useRef(null),ur=x.useCallback((ze,be)=>{let{sensor:et,options:Ft}=be;if(ae.current==null)return;const st=A.get(ae.current);if(!st)return;const tt=ze.nativeEvent,ht=new et({active:ae.current,activeNode:st,event:tt,options:Ft,context:xt,onAbort(Le){if(!A.get(Le))return;const{onDragAbort:nt}=J.current,Bt={id:Le};nt==null||nt(Bt),re({type:"onDragAbort",event:Bt})},onPending(Le,Tt,nt,Bt){if(!A.get(Le))return;const{onDragPending:Zt}=J.current,kt={id:Le,constraint:Tt,initialCoordinates:nt,offset:Bt};Zt==null||Zt(kt),re({type:"onDragPending",event:kt})},onStart(Le){const Tt=ae.current;if(Tt==null)return;const nt=A.get(Tt);if(!nt)return;const{onDragStart:Bt}=J.current,Ut={activatorEvent:tt,active:{id:Tt,data:nt.data,rect:te}};Lr.unstable_batchedUpdates(()=>{Bt==null||Bt(Ut),le(gn.Initializing),ne({type:He.DragStart,initialCoordinates:Le,active:Tt}),re({type:"onDragStart",event:Ut}),ve(Qr.current),I(tt)})},onMove(Le){ne({type:He.DragMove,coordinates:Le})},onEnd:un(He.DragEnd),onCancel:un(He.DragCancel)});Qr.current=ht;function un(Le){return async function(){const{active:nt,collisions:Bt,over:Ut,scrollAdjustedTranslate:Zt}=xt.current;let kt=null;if(nt&&Zt){const{cancelDrop:sn}=J.current;kt={activatorEvent:tt,active:nt,collisions:Bt,delta:Zt,over:Ut},Le===He.DragEnd&&typeof sn=="function"&&await Promise.resolve(sn(kt))&&(Le=He.DragCancel)}ae.current=null,Lr.unstable_batchedUpdates(()=>{ne({type:Le}),le(gn.Uninitialized),ql(null),ve(null),I(null),Qr.current=null;const sn=Le===He.DragEnd?"onDragEnd":"onDragCancel";if(kt){const Gr=J.current[sn];Gr==null||Gr(kt),re({type:sn,event:kt})}})}}},[A]),Kr=x.useCallback((ze,be)=>(et,Ft)=>{const st=et.nativeEvent,tt=A.get(Ft);if(ae.current!==null||!tt||st.dndKit||st.defaultPrevented)return;const ht={active:tt};ze(et,be.options,ht)===!0&&(st.dndKit={capturedBy:be.sensor},ae.current=Ft,ur(et,be))},[A,ur]),sr=Yf(D,Kr);np(D),nn(()=>{ke&&K===gn.Initializing&&le(gn.Initialized)},[ke,K]),x.useEffect(()=>{const{onDragMove:ze}=J.current,{active:be,activatorEvent:et,collisions:Ft,over:st}=xt.current;if(!be||!et)return;const tt={active:be,activatorEvent:et,collisions:Ft,delta:{x:Gt.x,y:Gt.y},over:st};Lr.unstable_batchedUpdates(()=>{ze==null||ze(tt),re({type:"onDragMove",event:tt})})},[Gt.x,Gt.y]),x.useEffect(()=>{const{active:ze,activatorEvent:be,collisions:et,droppableContainers:Ft,scrollAdjustedTranslate:st}=xt.current;if(!ze||ae.current==null||!be||!st)return;const{onDragOver:tt}=J.current,ht=Ft.get(wn),un=ht&&ht.rect.current?{id:ht.id,rect:ht.rect.current,data:ht.data,disabled:ht.disabled}:null,Le={active:ze,activatorEvent:be,collisions:et,delta:{x:st.x,y:st.y},over:un};Lr.unstable_batchedUpdates(()=>{ql(un),tt==null||tt(Le),re({type:"onDragOver",event:Le})})},[wn]),nn(()=>{xt.current={activatorEvent:fe,active:se,activeNode:B,collisionRect:At,collisions:yn,droppableRects:ce,draggableNodes:A,draggingNode:on,draggingNodeRect:Ge,droppableContainers:b,over:pt,scrollableAncestors:Oe,scrollAdjustedTranslate:Gt},te.current={initial:Ge,translated:At}},[se,B,yn,At,A,on,Ge,ce,b,pt,Oe,Gt]),Vf({...ge,delta:F,draggingRect:At,pointerCoordinates:Nt,scrollableAncestors:Oe,scrollableAncestorRects:Ue});const Xr=x.useMemo(()=>({active:se,activeNode:B,activeNodeRect:ke,activatorEvent:fe,collisions:yn,containerNodeRect:Ce,dragOverlay:St,draggableNodes:A,droppableContainers:b,droppableRects:ce,over:pt,measureDroppableContainers:he,scrollableAncestors:Oe,scrollableAncestorRects:Ue,measuringConfiguration:N,measuringScheduled:V,windowRect:Ze}),[se,B,ke,fe,yn,Ce,St,A,b,ce,pt,he,Oe,Ue,N,V,Ze]),Yr=x.useMemo(()=>({activatorEvent:fe,activators:sr,active:se,activeNodeRect:ke,ariaDescribedById:{draggable:W},dispatch:ne,draggableNodes:A,over:pt,measureDroppableContainers:he}),[fe,sr,se,ke,ne,W,A,pt,he]);return Ae.createElement(Ns.Provider,{value:Q},Ae.createElement(Hr.Provider,{value:Yr},Ae.createElement(qs.Provider,{value:Xr},Ae.createElement(Wl.Provider,{value:eo},_)),Ae.createElement(dp,{disabled:(v==null?void 0:v.restoreFocus)===!1})),Ae.createElement(vf,{...v,hiddenTextDescribedById:W}));function xn(){const ze=(ye==null?void 0:ye.autoScrollEnabled)===!1,be=typeof g=="object"?g.enabled===!1:g===!1,et=oe&&!ze&&!be;return typeof g=="object"?{...g,enabled:et}:{enabled:et}}}),vp=x.createContext(null),ea="button",mp="Draggable";function ta(l){let{id:s,data:u,disabled:c=!1,attributes:d}=l;const p=jl(mp),{activators:m,activatorEvent:v,active:g,activeNodeRect:_,ariaDescribedById:D,draggableNodes:R,over:T}=x.useContext(Hr),{role:U=ea,roleDescription:q="draggable",tabIndex:M=0}=d??{},j=(g==null?void 0:g.id)===s,ne=x.useContext(j?Wl:vp),[re,Q]=Ll(),[K,le]=Ll(),oe=rp(m,s),Z=jr(u);nn(()=>(R.set(s,{id:s,key:p,node:re,activatorNode:K,data:Z}),()=>{const F=R.get(s);F&&F.key===p&&R.delete(s)}),[R,s]);const A=x.useMemo(()=>({role:U,tabIndex:M,"aria-disabled":c,"aria-pressed":j&&U===ea?!0:void 0,"aria-roledescription":q,"aria-describedby":D.draggable}),[c,U,M,j,q,D.draggable]);return{active:g,activatorEvent:v,activeNodeRect:_,attributes:A,isDragging:j,listeners:c?void 0:oe,node:re,over:T,setNodeRef:Q,setActivatorNodeRef:le,transform:ne}}function gp(){return x.useContext(qs)}const yp="Droppable",wp={timeout:25};function na(l){let{data:s,disabled:u=!1,id:c,resizeObserverConfig:d}=l;const p=jl(yp),{active:m,dispatch:v,over:g,measureDroppableContainers:_}=x.useContext(Hr),D=x.useRef({disabled:u}),R=x.useRef(!1),T=x.useRef(null),U=x.useRef(null),{disabled:q,updateMeasurementsFor:M,timeout:j}={...wp,...d},ne=jr(M??c),re=x.useCallback(()=>{if(!R.current){R.current=!0;return}U.current!=null&&clearTimeout(U.current),U.current=setTimeout(()=>{_(Array.isArray(ne.current)?ne.current:[ne.current]),U.current=null},j)},[j]),Q=Bl({callback:re,disabled:q||!m}),K=x.useCallback((A,F)=>{Q&&(F&&(Q.unobserve(F),R.current=!1),A&&Q.observe(A))},[Q]),[le,oe]=Ll(K),Z=jr(s);return x.useEffect(()=>{!Q||!le.current||(Q.disconnect(),R.current=!1,Q.observe(le.current))},[le,Q]),x.useEffect(()=>(v({type:He.RegisterDroppable,element:{id:c,key:p,disabled:u,node:le,rect:T,data:Z}}),()=>v({type:He.UnregisterDroppable,key:p,id:c})),[c]),x.useEffect(()=>{u!==D.current.disabled&&(v({type:He.SetDroppableDisabled,id:c,key:p,disabled:u}),D.current.disabled=u)},[c,p,u,v]),{active:m,rect:T,isOver:(g==null?void 0:g.id)===c,node:le,over:g,setNodeRef:oe}}function xp(l){let{animation:s,children:u}=l;const[c,d]=x.useState(null),[p,m]=x.useState(null),v=Ml(u);return!u&&!c&&v&&d(v),nn(()=>{if(!p)return;const g=c==null?void 0:c.key,_=c==null?void 0:c.props.id;if(g==null||_==null){d(null);return}Promise.resolve(s(_,p)).then(()=>{d(null)})},[s,c,p]),Ae.createElement(Ae.Fragment,null,u,c?x.cloneElement(c,{ref:m}):null)}const Sp={x:0,y:0,scaleX:1,scaleY:1};function kp(l){let{children:s}=l;return Ae.createElement(Hr.Provider,{value:Js},Ae.createElement(Wl.Provider,{value:Sp},s))}const Cp={position:"fixed",touchAction:"none"},Ep=l=>mi(l)?"transform 250ms ease":void 0,_p=x.forwardRef((l,s)=>{let{as:u,activatorEvent:c,adjustScale:d,children:p,className:m,rect:v,style:g,transform:_,transition:D=Ep}=l;if(!v)return null;const R=d?_:{..._,scaleX:1,scaleY:1},T={...Cp,width:v.width,height:v.height,top:v.top,left:v.left,transform:Ir.Transform.toString(R),transformOrigin:d&&c?yf(c,v):void 0,transition:typeof D=="function"?D(c):D,...g};return Ae.createElement(u,{className:m,style:T,ref:s},p)}),Rp={duration:250,easing:"ease",keyframes:l=>{let{transform:{initial:s,final:u}}=l;return[{transform:Ir.Transform.toString(s)},{transform:Ir.Transform.toString(u)}]},sideEffects:(l=>s=>{let{active:u,dragOverlay:c}=s;const d={},{styles:p,className:m}=l;if(p!=null&&p.active)for(const[v,g]of Object.entries(p.active))g!==void 0&&(d[v]=u.node.style.getPropertyValue(v),u.node.style.setProperty(v,g));if(p!=null&&p.dragOverlay)for(const[v,g]of Object.entries(p.dragOverlay))g!==void 0&&c.node.style.setProperty(v,g);return m!=null&&m.active&&u.node.classList.add(m.active),m!=null&&m.dragOverlay&&c.node.classList.add(m.dragOverlay),function(){for(const[g,_]of Object.entries(d))u.node.style.setProperty(g,_);m!=null&&m.active&&u.node.classList.remove(m.active)}})({styles:{active:{opacity:"0"}}})};function Dp(l){let{config:s,draggableNodes:u,droppableContainers:c,measuringConfiguration:d}=l;return zl((p,m)=>{if(s===null)return;const v=u.get(p);if(!v)return;const g=v.node.current;if(!g)return;const _=Zs(m);if(!_)return;const{transform:D}=ut(m).getComputedStyle(m),R=Ps(D);if(!R)return;const T=typeof s=="function"?s:Np(s);return Fs(g,d.draggable.measure),T({active:{id:p,data:v.data,node:g,rect:d.draggable.measure(g)},draggableNodes:u,dragOverlay:{node:m,rect:d.dragOverlay.measure(_)},droppableContainers:c,measuringConfiguration:d,transform:R})})}function Np(l){const{duration:s,easing:u,sideEffects:c,keyframes:d}={...Rp,...l};return p=>{let{active:m,dragOverlay:v,transform:g,..._}=p;if(!s)return;const D={x:v.rect.left-m.rect.left,y:v.rect.top-m.rect.top},R={scaleX:g.scaleX!==1?m.rect.width*g.scaleX/v.rect.width:1,scaleY:g.scaleY!==1?m.rect.height*g.scaleY/v.rect.height:1},T={x:g.x-D.x,y:g.y-D.y,...R},U=d({..._,active:m,dragOverlay:v,transform:{initial:g,final:T}}),[q]=U,M=U[U.length-1];if(JSON.stringify(q)===JSON.stringify(M))return;const j=c==null?void 0:c({active:m,dragOverlay:v,..._}),ne=v.node.animate(U,{duration:s,easing:u,fill:"forwards"});return new Promise(re=>{ne.onfinish=()=>{j==null||j(),re()}})}}let ra=0;function Tp(l){return x.useMemo(()=>{if(l!=null)return ra++,ra},[l])}const Pp=Ae.memo(l=>{let{adjustScale:s=!1,children:u,dropAnimation:c,style:d,transition:p,modifiers:m,wrapperElement:v="div",className:g,zIndex:_=999}=l;const{activatorEvent:D,active:R,activeNodeRect:T,containerNodeRect:U,draggableNodes:q,droppableContainers:M,dragOverlay:j,over:ne,measuringConfiguration:re,scrollableAncestors:Q,scrollableAncestorRects:K,windowRect:le}=gp(),oe=x.useContext(Wl),Z=Tp(R==null?void 0:R.id),A=bs(m,{activatorEvent:D,active:R,activeNodeRect:T,containerNodeRect:U,draggingNodeRect:j.rect,over:ne,overlayNodeRect:j.rect,scrollableAncestors:Q,scrollableAncestorRects:K,transform:oe,windowRect:le}),F=Di(T),b=Dp({config:c,draggableNodes:q,droppableContainers:M,measuringConfiguration:re}),$=F?j.setRef:void 0;return Ae.createElement(kp,null,Ae.createElement(xp,{animation:b},R&&Z?Ae.createElement(_p,{key:Z,id:R.id,ref:$,as:v,activatorEvent:D,adjustScale:s,className:g,transition:p,rect:F,style:{zIndex:_,...d},transform:A},u):null))});let $r=1;function Ni(l){return l.id?l:{...l,id:`blk_${$r++}`}}function zp(l){const[s,u]=x.useState(()=>((l==null?void 0:l.schedule)??[]).map(Ni)),[c,d]=x.useState(()=>((l==null?void 0:l.cipWindows)??[]).map(Ni)),[p,m]=x.useState(()=>((l==null?void 0:l.holdingArea)??[]).map(Ni)),[v,g]=x.useState(""),_=x.useRef([]),D=x.useRef([]),R=x.useCallback(()=>({schedule:[...s],cipWindows:[...c],holdingArea:[...p]}),[s,c,p]),T=x.useCallback(()=>{_.current.push(R()),D.current=[],_.current.length>50&&_.current.shift()},[R]),U=x.useCallback(()=>{const F=_.current.pop();F&&(D.current.push(R()),u(F.schedule),d(F.cipWindows),m(F.holdingArea),g("Undo"))},[R]),q=x.useCallback(()=>{const F=D.current.pop();F&&(_.current.push(R()),u(F.schedule),d(F.cipWindows),m(F.holdingArea),g("Redo"))},[R]),M=x.useCallback((F,b)=>{T(),u($=>$.map(te=>te.id===F?{...te,...b}:te)),d($=>$.map(te=>te.id===F?{...te,...b}:te))},[T]),j=x.useCallback((F,b,$,te,se)=>{T(),u(ae=>ae.map(ye=>ye.id===F?{...ye,line_name:b,line_id:$,start_hour:te,end_hour:te+se,run_hours:se}:ye)),d(ae=>ae.map(ye=>ye.id===F?{...ye,line_name:b,line_id:$,start_hour:te,end_hour:te+se,run_hours:se}:ye)),g(`Moved ${F} to ${b} at h${te}`)},[T]),ne=x.useCallback((F,b,$)=>{T();const te=$-b;u(se=>se.map(ae=>ae.id===F?{...ae,start_hour:b,end_hour:$,run_hours:te}:ae)),d(se=>se.map(ae=>ae.id===F?{...ae,start_hour:b,end_hour:$,run_hours:te}:ae)),g(`Resized ${F} to h${b}-${$}`)},[T]),re=x.useCallback((F,b)=>{T(),u($=>{const te=$.findIndex(fe=>fe.id===F);if(te<0)return $;const se=$[te],ae={...se,id:`blk_${$r++}`,end_hour:b,run_hours:b-se.start_hour},ye={...se,id:`blk_${$r++}`,start_hour:b,run_hours:se.end_hour-b},ve=[...$];return ve.splice(te,1,ae,ye),ve}),g(`Split block at h${b}`)},[T]),Q=x.useCallback(F=>{const b=s.find($=>$.id===F)??c.find($=>$.id===F);b&&(T(),u($=>$.filter(te=>te.id!==F)),d($=>$.filter(te=>te.id!==F)),m($=>[...$,b]),g(`Removed ${b.order_id} to holding`))},[T,s,c]),K=x.useCallback((F,b,$,te,se)=>{const ae=p.find(ve=>ve.id===F);if(!ae)return;T();const ye={...ae,line_name:b,line_id:$,start_hour:te,end_hour:te+se,run_hours:se};m(ve=>ve.filter(fe=>fe.id!==F)),ye.block_type==="cip"?d(ve=>[...ve,ye]):u(ve=>[...ve,ye]),g(`Restored ${ae.order_id} to ${b}`)},[T,p]),le=x.useCallback((F,b,$,te)=>{T();const se={id:`blk_${$r++}`,line_id:b,line_name:F,order_id:"CIP",sku:"CIP",start_hour:$,end_hour:$+te,run_hours:te,is_trial:!1,block_type:"cip"};d(ae=>[...ae,se]),g(`Added CIP on ${F} at h${$}`)},[T]),oe=x.useCallback((F,b,$,te,se)=>{T();const ae={id:`blk_${$r++}`,line_id:b,line_name:F,order_id:`TRIAL-${$}-L${F}`,sku:$,start_hour:te,end_hour:te+se,run_hours:se,is_trial:!0,block_type:"trial"};u(ye=>[...ye,ae]),g(`Added trial ${$} on ${F}`)},[T]),Z={schedule:s,cipWindows:c,holdingArea:p,lastAction:v},A={updateBlock:M,moveBlock:j,resizeBlock:ne,splitBlock:re,removeToHolding:Q,restoreFromHolding:K,addCip:le,addTrial:oe,undo:U,redo:q,canUndo:_.current.length>0,canRedo:D.current.length>0};return[Z,A]}const rn=40,Yt=48,Hl=50,la=1,Lp=30;function rr(l,s,u){return Hl+(l-s)*u}function $l(l){return Math.round(l)}function Ti(l,s){const u=l-Hl-10;return Math.max(la,u/s)}function Mp(l,s){const[u,c]=x.useState({blockId:null,edge:null,previewStart:0,previewEnd:0}),d=x.useRef({start:0,end:0}),p=x.useRef(0),m=x.useRef(6),v=x.useCallback((g,_,D,R,T,U)=>{d.current={start:D,end:R},p.current=T,m.current=U,c({blockId:g,edge:_,previewStart:D,previewEnd:R});const q=j=>{const ne=j.clientX-p.current,re=$l(ne/m.current);let Q=d.current.start,K=d.current.end;_==="left"?(Q=d.current.start+re,K-Q<l&&(Q=K-l),Q<0&&(Q=0)):(K=d.current.end+re,K-Q<l&&(K=Q+l)),c({blockId:g,edge:_,previewStart:Q,previewEnd:K})},M=()=>{document.removeEventListener("pointermove",q),document.removeEventListener("pointerup",M),c(j=>(j.blockId&&s(j.blockId,j.previewStart,j.previewEnd),{blockId:null,edge:null,previewStart:0,previewEnd:0}))};document.addEventListener("pointermove",q),document.addEventListener("pointerup",M)},[l,s]);return{resizing:u,startResize:v}}const oa={visible:!1,x:0,y:0,blockId:null,blockType:"sku",startHour:0,endHour:0};function jp(){const[l,s]=x.useState(oa),u=x.useCallback((d,p,m,v,g,_)=>{s({visible:!0,x:d,y:p,blockId:m,blockType:v,startHour:g,endHour:_})},[]),c=x.useCallback(()=>s(oa),[]);return{menu:l,openMenu:u,closeMenu:c}}function ia(l,s,u){var p;const c={};for(const m of l){if(m.block_type==="cip")continue;const v=((p=u[m.line_name])==null?void 0:p[m.sku])??0;c[m.order_id]=(c[m.order_id]??0)+v*m.run_hours}const d=s.map(m=>{const v=c[m.order_id]??0,g=m.qty_min>0?v/m.qty_min*100:v>0?999:100;let _="MET";return v<m.qty_min?_="UNDER":m.qty_max>0&&v>m.qty_max&&(_="OVER"),{order_id:m.order_id,sku:m.sku,qty_min:m.qty_min,qty_max:m.qty_max,scheduled_qty:Math.round(v),pct_adherence:Math.round(g*10)/10,status:_}});return d.sort((m,v)=>m.sku.localeCompare(v.sku)),d}function Op(l){var d;const s={};for(const p of l)p.block_type!=="cip"&&(s[d=p.line_name]??(s[d]=[])).push(p);const u={};let c=0;for(const[p,m]of Object.entries(s)){const v=[...m].sort((_,D)=>_.start_hour-D.start_hour);let g=0;for(let _=1;_<v.length;_++)v[_].sku!==v[_-1].sku&&g++;u[p]=g,c+=g}return{total:c,perLine:u}}function Ip(l,s,u,c){const d=ia(l,u,c),p=d.filter(R=>R.status==="MET").length,m=d.length>0?Math.round(p/d.length*1e3)/10:100,{total:v,perLine:g}=Op(l),_=[...l,...s],D=Ap(_);return{pctAdherence:m,ordersMet:p,ordersTotal:d.length,totalChangeovers:v,perLineChangeovers:g,overlaps:D}}function Ap(l){var c;const s={};for(const d of l)(s[c=d.line_name]??(s[c]=[])).push(d);const u=[];for(const[d,p]of Object.entries(s)){const m=[...p].sort((v,g)=>v.start_hour-g.start_hour);for(let v=1;v<m.length;v++)m[v].start_hour<m[v-1].end_hour&&u.push(`${d}: overlap at h${m[v].start_hour}`)}return u}function Pi(l,s,u){var c;return(((c=u[l])==null?void 0:c[s])??0)>0}function zi(l,s,u){var c;return((c=u[l])==null?void 0:c[s])??0}function ua(l,s,u){const c=zi(l.line_name,l.sku,u),d=zi(s,l.sku,u);if(d<=0)return null;if(c<=0)return l.run_hours;const p=c*l.run_hours;return Math.ceil(p/d)}function sa(l,s,u,c,d){return l.some(p=>p.line_name===s&&p.id!==u&&p.start_hour<d&&p.end_hour>c)}let aa=!1;const ca=[];function Fp(l){ca.push(l)}function Bp(){aa||(aa=!0,window.parent.postMessage({isStreamlitMessage:!0,type:"streamlit:componentReady",apiVersion:1},"*"))}function da(l){const s=l??document.documentElement.scrollHeight;window.parent.postMessage({isStreamlitMessage:!0,type:"streamlit:setFrameHeight",height:s},"*")}function Up(l){window.parent.postMessage({isStreamlitMessage:!0,type:"streamlit:setComponentValue",value:l},"*")}window.addEventListener("message",l=>{const s=l.data;if(!(!s||typeof s!="object")&&s.type==="streamlit:render")for(const u of ca)u(s)});const Vl={display:"inline-flex",flexDirection:"column",alignItems:"center",padding:"8px 18px",borderRadius:8,background:"#f7f7fa",border:"1px solid #e0e0e5",minWidth:120},Ql={fontSize:11,color:"#666",textTransform:"uppercase",letterSpacing:.5},Kl={fontSize:22,fontWeight:700,marginTop:2},Wp=({kpis:l})=>{const s=l.pctAdherence>=100?"#00CC96":l.pctAdherence>=80?"#FFA15A":"#EF553B",u=l.overlaps.length>0?"#EF553B":"#00CC96";return C.jsxs("div",{style:{display:"flex",gap:12,padding:"8px 0",flexWrap:"wrap"},children:[C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Adherence"}),C.jsxs("span",{style:{...Kl,color:s},children:[l.pctAdherence,"%"]})]}),C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Orders Met"}),C.jsxs("span",{style:Kl,children:[l.ordersMet,"/",l.ordersTotal]})]}),C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Changeovers"}),C.jsx("span",{style:Kl,children:l.totalChangeovers})]}),C.jsxs("div",{style:Vl,children:[C.jsx("span",{style:Ql,children:"Overlaps"}),C.jsx("span",{style:{...Kl,color:u},children:l.overlaps.length})]})]})},fa=["#636EFA","#EF553B","#00CC96","#AB63FA","#FFA15A","#19D3F3","#FF6692","#B6E880","#FF97FF","#FECB52"],Hp="#888888",$p="#D4A017",Xl=new Map;function pa(l,s){return s==="cip"?Hp:s==="trial"?$p:(Xl.has(l)||Xl.set(l,fa[Xl.size%fa.length]),Xl.get(l))}function ha(l){const s=l.replace("#",""),u=parseInt(s.substring(0,2),16),c=parseInt(s.substring(2,4),16),d=parseInt(s.substring(4,6),16);return(.299*u+.587*c+.114*d)/255>.5?"#000":"#fff"}const Vp=({block:l,lineIndex:s,viewStart:u,hourWidth:c,isResizing:d,previewStart:p,previewEnd:m,isHighlighted:v,onResizeStart:g,onContextMenu:_,onClick:D})=>{const{attributes:R,listeners:T,setNodeRef:U,transform:q,isDragging:M}=ta({id:l.id,data:{block:l}}),j=U,ne=d?p??l.start_hour:l.start_hour,re=d?m??l.end_hour:l.end_hour,Q=rr(ne,u,c),K=(re-ne)*c,le=4,oe=rn-8,Z=pa(l.sku,l.block_type),A=ha(Z),F=x.useCallback(w=>{w.stopPropagation(),w.preventDefault(),g(l.id,"left",l.start_hour,l.end_hour,w.clientX,c)},[l,c,g]),b=x.useCallback(w=>{w.stopPropagation(),w.preventDefault(),g(l.id,"right",l.start_hour,l.end_hour,w.clientX,c)},[l,c,g]),$=x.useCallback(w=>{w.preventDefault(),_(w,l.id)},[l.id,_]),te=x.useCallback(w=>{w.stopPropagation(),D(l.id)},[l.id,D]),se=M&&q?q.x:0,ae=M&&q?q.y:0,ye=l.sku_description||"",ve=l.block_type==="cip"?"CIP":l.block_type==="trial"?`T:${l.sku}`:l.sku,fe=Math.floor((K-12)/6.5);let I;if(l.block_type==="cip")I="CIP";else if(fe<=0)I="";else{const w=`${ve} (${l.run_hours}h)`,N=ye?`${ve} ${ye} (${l.run_hours}h)`:w;N.length<=fe?I=N:w.length<=fe?I=w:ve.length<=fe?I=ve:I=ve.slice(0,Math.max(fe-1,1))+"…"}const J=M?"#333":"none",W=M?2:0;return C.jsxs("g",{ref:j,...T,...R,transform:`translate(${se}, ${ae})`,style:{cursor:M?"grabbing":"grab",opacity:M?.6:1},onContextMenu:$,onClick:te,children:[v&&C.jsx("rect",{x:Q-2,y:le-2,width:Math.max(K,2)+4,height:oe+4,rx:6,fill:"none",stroke:"#FFD700",strokeWidth:2,opacity:.5}),C.jsx("rect",{x:Q,y:le,width:Math.max(K,2),height:oe,rx:4,fill:Z,stroke:J,strokeWidth:W}),K>20&&I&&C.jsx("text",{x:Q+6,y:le+oe/2+1,textAnchor:"start",dominantBaseline:"middle",fontSize:K>60?11:9,fill:A,fontWeight:600,pointerEvents:"none",style:{userSelect:"none"},children:I}),C.jsx("rect",{x:Q,y:le,width:8,height:oe,fill:"transparent",style:{cursor:"ew-resize"},onPointerDown:F}),C.jsx("rect",{x:Q+Math.max(K,2)-8,y:le,width:8,height:oe,fill:"transparent",style:{cursor:"ew-resize"},onPointerDown:b})]})},Qp=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],Kp=({viewStart:l,viewEnd:s,hourWidth:u,anchor:c,svgWidth:d,svgHeight:p})=>{const m=24*u,v=[],g=Math.floor(l/24)*24;for(let D=g;D<=s;D+=24)if(D>=l){const R=new Date(c.getTime()+D*36e5);v.push({hour:D,label:`${Qp[R.getMonth()]} ${R.getDate()}`})}const _=[];for(let D=g+7;D<=s;D+=12)if(D>=l){const R=(D%24+24)%24;(R===7||R===19)&&_.push({hour:D,isAm:R===7})}return C.jsxs("g",{className:"time-axis",children:[C.jsx("rect",{x:0,y:0,width:d,height:Yt,fill:"#fafafa"}),C.jsx("line",{x1:Hl,y1:Yt,x2:d,y2:Yt,stroke:"#ccc"}),v.map((D,R)=>{const T=rr(D.hour,l,u),q=rr(D.hour+24,l,u)-T;return C.jsxs("g",{children:[R%2===1&&C.jsx("rect",{x:T,y:0,width:q,height:Yt,fill:"#eef0f5"}),C.jsx("line",{x1:T,y1:Yt,x2:T,y2:p,stroke:"#d0d0d0",strokeWidth:1}),m>30&&C.jsx("text",{x:T+q/2,y:Yt/2+1,textAnchor:"middle",dominantBaseline:"middle",fontSize:m>=55?11:9,fontWeight:600,fill:"#333",children:D.label})]},D.hour)}),_.map(D=>{const R=rr(D.hour,l,u);return C.jsx("line",{x1:R,y1:Yt,x2:R,y2:p,stroke:D.isAm?"#d4a020":"#6a8dbf",strokeDasharray:"4,4",strokeWidth:1,opacity:.5},`shift_${D.hour}`)}),168>=l&&168<=s&&C.jsx("line",{x1:rr(168,l,u),y1:0,x2:rr(168,l,u),y2:p,stroke:"#AB63FA",strokeDasharray:"6,3",strokeWidth:2})]})},Xp=({onZoomIn:l,onZoomOut:s,onResetZoom:u})=>C.jsxs("div",{style:{display:"flex",gap:4,padding:"4px 0",alignItems:"center"},children:[C.jsx("button",{onClick:l,style:Li,title:"Zoom in",children:"+"}),C.jsx("button",{onClick:s,style:Li,title:"Zoom out",children:"−"}),C.jsx("button",{onClick:u,style:{...Li,fontSize:11},title:"Fit 2 weeks",children:"Fit"})]}),Li={width:28,height:24,border:"1px solid #ccc",borderRadius:4,background:"#fff",cursor:"pointer",fontSize:14,fontWeight:700,lineHeight:"22px"},Yp=({line:l,index:s,svgWidth:u,isCapable:c})=>{const{setNodeRef:d,isOver:p}=na({id:`line_${l.line_name}`}),m=d,v=Yt+s*rn;let g;return p?g=c===!1?"#e57373":"#66bb6a":c===!0?g="#a5d6a7":c===!1?g="#ef9a9a":g=s%2===0?"#fff":"#fafafa",C.jsxs("g",{ref:m,children:[C.jsx("rect",{x:0,y:v,width:u,height:rn,fill:g}),C.jsx("line",{x1:0,y1:v+rn,x2:u,y2:v+rn,stroke:"#eee"}),C.jsx("text",{x:4,y:v+rn/2,dominantBaseline:"middle",fontSize:11,fontWeight:600,fill:"#333",children:l.line_name})]})},Gp=({schedule:l,cipWindows:s,lines:u,viewStart:c,viewEnd:d,hourWidth:p,anchor:m,resizing:v,highlightSku:g,capableLines:_,onResizeStart:D,onContextMenu:R,onBlockClick:T,onZoomIn:U,onZoomOut:q,onResetZoom:M})=>{const j=x.useRef(null),ne=Hl+(d-c)*p,re=Yt+u.length*rn+4,Q=[...l,...s];return C.jsxs(C.Fragment,{children:[C.jsx(Xp,{onZoomIn:U,onZoomOut:q,onResetZoom:M}),C.jsx("div",{style:{overflowX:"hidden",overflowY:"hidden",border:"1px solid #e0e0e5",borderRadius:8},children:C.jsxs("svg",{ref:j,width:ne,height:re,style:{display:"block"},children:[C.jsx(Kp,{viewStart:c,viewEnd:d,hourWidth:p,anchor:m,svgWidth:ne,svgHeight:re}),u.map((K,le)=>C.jsx(Yp,{line:K,index:le,svgWidth:ne,isCapable:_?_.has(K.line_name):null},K.line_name)),Q.map(K=>{const le=u.findIndex(F=>F.line_name===K.line_name);if(le<0)return null;const oe=Yt+le*rn,Z=v.blockId===K.id,A=g!==null&&K.sku===g&&K.block_type!=="cip";return C.jsx("g",{transform:`translate(0, ${oe})`,children:C.jsx(Vp,{block:K,lineIndex:le,viewStart:c,hourWidth:p,isResizing:Z,previewStart:Z?v.previewStart:void 0,previewEnd:Z?v.previewEnd:void 0,isHighlighted:A,onResizeStart:D,onContextMenu:R,onClick:T})},K.id)})]})})]})},Zp=({block:l})=>{const{attributes:s,listeners:u,setNodeRef:c,isDragging:d}=ta({id:`holding_${l.id}`,data:{block:l,fromHolding:!0}}),p=pa(l.sku,l.block_type),m=ha(p);return C.jsxs("div",{ref:c,...u,...s,style:{display:"inline-flex",alignItems:"center",gap:6,padding:"4px 10px",borderRadius:6,background:p,color:m,fontSize:12,fontWeight:600,cursor:"grab",opacity:d?.5:1,whiteSpace:"nowrap"},children:[l.block_type==="cip"?"CIP":l.order_id,": ",l.sku,", ",l.run_hours,"h"]})},Jp=({blocks:l})=>{const[s,u]=x.useState(!0),{setNodeRef:c,isOver:d}=na({id:"holding_area"});return C.jsxs("div",{ref:c,style:{border:`2px dashed ${d?"#636EFA":"#ccc"}`,borderRadius:8,padding:8,background:d?"#f0f4ff":"#fafafa",transition:"background 0.15s, border-color 0.15s"},children:[C.jsxs("div",{style:{display:"flex",justifyContent:"space-between",alignItems:"center",cursor:"pointer",marginBottom:s?6:0},onClick:()=>u(!s),children:[C.jsxs("strong",{style:{fontSize:13},children:["Holding Area [",l.length," items]"]}),C.jsx("span",{style:{fontSize:11,color:"#666"},children:s?"▲ collapse":"▼ expand"})]}),s&&C.jsxs("div",{style:{display:"flex",flexWrap:"wrap",gap:6},children:[l.length===0&&C.jsx("span",{style:{fontSize:12,color:"#999",fontStyle:"italic"},children:"Drag blocks here to remove from schedule"}),l.map(p=>C.jsx(Zp,{block:p},p.id))]})]})},qp=({lines:l,cipDuration:s,onAddCip:u,onAddTrial:c})=>{var oe,Z;const[d,p]=x.useState(!1),[m,v]=x.useState(!1),[g,_]=x.useState(((oe=l[0])==null?void 0:oe.line_name)??""),[D,R]=x.useState(0),[T,U]=x.useState(((Z=l[0])==null?void 0:Z.line_name)??""),[q,M]=x.useState(""),[j,ne]=x.useState(0),[re,Q]=x.useState(8),K=()=>{const A=l.find(F=>F.line_name===g);A&&u(g,A.line_id,D,s),p(!1)},le=()=>{const A=l.find(F=>F.line_name===T);A&&q&&c(T,A.line_id,q,j,re),v(!1)};return C.jsxs("div",{style:{display:"flex",gap:8,alignItems:"flex-start",flexWrap:"wrap",padding:"4px 0"},children:[C.jsx("button",{onClick:()=>p(!d),style:Yl,children:"+ CIP"}),C.jsx("button",{onClick:()=>v(!m),style:Yl,children:"+ Trial"}),d&&C.jsxs("div",{style:va,children:[C.jsx("label",{style:lr,children:"Line"}),C.jsx("select",{value:g,onChange:A=>_(A.target.value),style:or,children:l.map(A=>C.jsx("option",{value:A.line_name,children:A.line_name},A.line_name))}),C.jsx("label",{style:lr,children:"Start Hour"}),C.jsx("input",{type:"number",value:D,min:0,onChange:A=>R(+A.target.value),style:or}),C.jsx("button",{onClick:K,style:{...Yl,background:"#636EFA",color:"#fff"},children:"Add"})]}),m&&C.jsxs("div",{style:va,children:[C.jsx("label",{style:lr,children:"Line"}),C.jsx("select",{value:T,onChange:A=>U(A.target.value),style:or,children:l.map(A=>C.jsx("option",{value:A.line_name,children:A.line_name},A.line_name))}),C.jsx("label",{style:lr,children:"SKU"}),C.jsx("input",{value:q,onChange:A=>M(A.target.value),placeholder:"e.g. 280573",style:or}),C.jsx("label",{style:lr,children:"Start Hour"}),C.jsx("input",{type:"number",value:j,min:0,onChange:A=>ne(+A.target.value),style:or}),C.jsx("label",{style:lr,children:"Duration (h)"}),C.jsx("input",{type:"number",value:re,min:1,onChange:A=>Q(+A.target.value),style:or}),C.jsx("button",{onClick:le,style:{...Yl,background:"#D4A017",color:"#fff"},children:"Add"})]})]})},Yl={padding:"6px 14px",border:"1px solid #ccc",borderRadius:6,background:"#fff",cursor:"pointer",fontSize:13,fontWeight:600},va={display:"flex",gap:8,alignItems:"center",padding:"6px 10px",border:"1px solid #e0e0e5",borderRadius:6,background:"#fafafa",flexWrap:"wrap"},lr={fontSize:11,color:"#666"},or={fontSize:12,padding:"4px 6px",borderRadius:4,border:"1px solid #ccc",width:80},bp={MET:"#00CC96",UNDER:"#EF553B",OVER:"#FFA15A"},eh=({rows:l,highlightSku:s,onSkuClick:u})=>C.jsx("div",{style:{maxHeight:260,overflowY:"auto",border:"1px solid #e0e0e5",borderRadius:8,background:"#ffffff"},children:C.jsxs("table",{style:{width:"100%",borderCollapse:"collapse",fontSize:12,color:"#333"},children:[C.jsx("thead",{children:C.jsxs("tr",{style:{background:"#f7f7fa",position:"sticky",top:0},children:[C.jsx("th",{style:ir,children:"SKU"}),C.jsx("th",{style:ir,children:"Order"}),C.jsx("th",{style:ir,children:"Min Qty"}),C.jsx("th",{style:ir,children:"Sched Qty"}),C.jsx("th",{style:ir,children:"% Adh"}),C.jsx("th",{style:ir,children:"Status"})]})}),C.jsx("tbody",{children:l.map(c=>{const d=s===c.sku;return C.jsxs("tr",{style:{borderBottom:"1px solid #eee",background:d?"#fff8dc":"#ffffff",cursor:"pointer"},onClick:p=>{p.stopPropagation(),u(d?null:c.sku)},children:[C.jsx("td",{style:{...Gl,fontWeight:d?700:400},children:c.sku}),C.jsx("td",{style:Gl,children:c.order_id}),C.jsx("td",{style:Mi,children:c.qty_min.toLocaleString()}),C.jsx("td",{style:Mi,children:c.scheduled_qty.toLocaleString()}),C.jsxs("td",{style:Mi,children:[c.pct_adherence,"%"]}),C.jsx("td",{style:{...Gl,color:bp[c.status]??"#333",fontWeight:600},children:c.status})]},c.order_id)})})]})}),ir={textAlign:"left",padding:"6px 10px",fontSize:11,fontWeight:600,color:"#666",textTransform:"uppercase",letterSpacing:.5},Gl={padding:"4px 10px"},Mi={...Gl,textAlign:"right",fontVariantNumeric:"tabular-nums"},ji={padding:"6px 16px",cursor:"pointer",fontSize:13,borderBottom:"1px solid #f0f0f0"},th=({menu:l,onSplit:s,onRemove:u,onDetails:c,onClose:d,minRunHours:p})=>{if(!l.visible||!l.blockId)return null;const m=l.endHour-l.startHour>=p*2,v=Math.round((l.startHour+l.endHour)/2);return C.jsxs(C.Fragment,{children:[C.jsx("div",{style:{position:"fixed",inset:0,zIndex:999},onClick:d,onContextMenu:g=>{g.preventDefault(),d()}}),C.jsxs("div",{style:{position:"fixed",left:l.x,top:l.y,background:"#fff",border:"1px solid #ccc",borderRadius:6,boxShadow:"0 4px 12px rgba(0,0,0,0.12)",zIndex:1e3,minWidth:160,overflow:"hidden"},children:[m&&C.jsxs("div",{style:ji,onClick:()=>{s(l.blockId,v),d()},onMouseEnter:g=>{g.target.style.background="#f0f4ff"},onMouseLeave:g=>{g.target.style.background="transparent"},children:["✂ Split at h",v]}),C.jsx("div",{style:ji,onClick:()=>{u(l.blockId),d()},onMouseEnter:g=>{g.target.style.background="#fff0f0"},onMouseLeave:g=>{g.target.style.background="transparent"},children:"🗑 Remove to holding"}),C.jsx("div",{style:{...ji,borderBottom:"none"},onClick:()=>{c(l.blockId),d()},onMouseEnter:g=>{g.target.style.background="#f0f4ff"},onMouseLeave:g=>{g.target.style.background="transparent"},children:"ℹ Details"})]})]})},nh=({block:l,x:s,y:u,rate:c,onClose:d})=>{if(!l)return null;const p=c>0?Math.round(c*l.run_hours):"—";return C.jsxs("div",{style:{position:"fixed",left:s,top:u,background:"#fff",border:"1px solid #ccc",borderRadius:8,padding:"10px 14px",boxShadow:"0 4px 16px rgba(0,0,0,0.15)",zIndex:1e3,minWidth:180,fontSize:13},onClick:m=>m.stopPropagation(),children:[C.jsxs("div",{style:{display:"flex",justifyContent:"space-between",marginBottom:6},children:[C.jsx("strong",{children:l.block_type==="cip"?"CIP":l.order_id}),C.jsx("span",{style:{cursor:"pointer",fontWeight:700,color:"#888"},onClick:d,children:"×"})]}),C.jsx("table",{style:{fontSize:12,lineHeight:1.8},children:C.jsxs("tbody",{children:[C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Line"}),C.jsx("td",{children:l.line_name})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"SKU"}),C.jsx("td",{children:l.sku})]}),l.sku_description&&C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Description"}),C.jsx("td",{children:l.sku_description})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Start"}),C.jsxs("td",{children:["h",l.start_hour]})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"End"}),C.jsxs("td",{children:["h",l.end_hour]})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Duration"}),C.jsxs("td",{children:[l.run_hours,"h"]})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Rate"}),C.jsx("td",{children:c>0?`${c} UPH`:"N/A"})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Est. Qty"}),C.jsx("td",{children:p})]}),C.jsxs("tr",{children:[C.jsx("td",{style:{color:"#888",paddingRight:12},children:"Type"}),C.jsx("td",{children:l.block_type})]})]})})]})},PUSH_DEBOUNCE_MS=120,FULL_PUSH_RATIO=.5,LIST_NAMES=["schedule","cipWindows","holdingArea"],diffLists=(prev,next)=>{const ops=[];for(const list of LIST_NAMES){const before=new Map(prev[list].map(b=>[b.id,b]));for(const b of next[list]){const old=before.get(b.id);before.delete(b.id);if(old===b||old&&JSON.stringify(old)===JSON.stringify(b))continue;ops.push({type:"upsert",list,block:b})}for(const id of before.keys())ops.push({type:"remove",list,id})}return ops},blockCount=lists=>lists.schedule.length+lists.cipWindows.length+lists.holdingArea.length,toVersionKpis=(schedule,kpis)=>{let first=1/0,last=-1/0;for(const b of schedule){if(b.block_type==="cip")continue;first=Math.min(first,b.start_hour);last=Math.max(last,b.end_hour)}return{changeovers:kpis.totalChangeovers,makespan_h:first<=last?Math.round((last-first)*10)/10:0,orders_met:kpis.ordersMet,orders_total:kpis.ordersTotal,adherence_pct:kpis.pctAdherence}},rh=({args:l})=>{const[s,u]=zp(l),{schedule:c,cipWindows:d,holdingArea:p,lastAction:m}=s,v=l.config.horizon_hours||336,g=x.useRef(null),[_,D]=x.useState(()=>Ti(1200,v)),[R,T]=x.useState(0),U=R+v,q=x.useMemo(()=>new Date(l.config.planning_anchor),[l.config.planning_anchor]),M=l.capabilities,j=l.lines;x.useEffect(()=>{const V=()=>{var de;const B=((de=g.current)==null?void 0:de.offsetWidth)??1200;D(Ti(B,v)),T(0)};return V(),window.addEventListener("resize",V),()=>window.removeEventListener("resize",V)},[v]);const[ne,re]=x.useState(null),[Q,K]=x.useState(null),le=x.useMemo(()=>{if(!Q)return null;const V=new Set;for(const B of j)Pi(B.line_name,Q,M)&&V.add(B.line_name);return V},[Q,j,M]),oe=gf(mf(Ci,{activationConstraint:{distance:5}})),Z=x.useCallback(V=>{var de;const B=(de=V.active.data.current)==null?void 0:de.block;B&&B.block_type!=="cip"&&K(B.sku)},[]),A=x.useCallback(V=>{K(null);const{active:B,over:de,delta:ge}=V;if(!B)return;const we=B.id,ke=de==null?void 0:de.id;if(we.startsWith("holding_")){if(!(ke!=null&&ke.startsWith("line_")))return;const Pe=we.replace("holding_",""),Ze=ke.replace("line_",""),Oe=j.find(Nt=>Nt.line_name===Ze);if(!Oe)return;const Ue=p.find(Nt=>Nt.id===Pe);if(!Ue||Ue.block_type!=="cip"&&!Pi(Ze,Ue.sku,M))return;let ft=Ue.run_hours;if(Ue.block_type!=="cip"){const Nt=ua(Ue,Ze,M);Nt!==null&&(ft=Nt)}u.restoreFromHolding(Pe,Oe.line_name,Oe.line_id,0,ft);return}if(ke==="holding_area"){u.removeToHolding(we);return}const Ce=c.find(Pe=>Pe.id===we)??d.find(Pe=>Pe.id===we);if(!Ce)return;const xt=$l(ge.x/_),ln=j.findIndex(Pe=>Pe.line_name===Ce.line_name),St=Math.round(ge.y/rn),on=Math.max(0,Math.min(ln+St,j.length-1)),Ge=j[on];if(!Ge)return;if(Ge.line_name===Ce.line_name){const Pe=Math.max(0,$l(Ce.start_hour+xt));if(Pe===Ce.start_hour)return;const Ze=Pe+Ce.run_hours,Oe=[...c,...d];if(sa(Oe,Ce.line_name,Ce.id,Pe,Ze))return;u.moveBlock(Ce.id,Ce.line_name,Ce.line_id,Pe,Ce.run_hours)}else{if(Ce.block_type!=="cip"&&!Pi(Ge.line_name,Ce.sku,M))return;let Pe=Ce.run_hours;if(Ce.block_type!=="cip"){const ft=ua(Ce,Ge.line_name,M);if(ft===null)return;Pe=ft}const Ze=Math.max(0,$l(Ce.start_hour+xt)),Oe=Ze+Pe,Ue=[...c,...d];if(sa(Ue,Ge.line_name,Ce.id,Ze,Oe))return;u.moveBlock(Ce.id,Ge.line_name,Ge.line_id,Ze,Pe)}},[c,d,p,u,_,M,j]),F=x.useCallback((V,B,de)=>u.resizeBlock(V,B,de),[u]),{resizing:b,startResize:$}=Mp(l.config.min_run_hours,F),{menu:te,openMenu:se,closeMenu:ae}=jp(),ye=x.useCallback((V,B)=>{const de=[...c,...d].find(ge=>ge.id===B);de&&se(V.clientX,V.clientY,B,de.block_type,de.start_hour,de.end_hour)},[c,d,se]),[ve,fe]=x.useState(null),I=x.useCallback(V=>{const B=[...c,...d].find(de=>de.id===V);B&&fe({block:B,x:300,y:200})},[c,d]),J=x.useMemo(()=>Ip(c,d,l.demandTargets,l.capabilities),[c,d,l.demandTargets,l.capabilities]),W=x.useMemo(()=>ia(c,l.demandTargets,l.capabilities),[c,l.demandTargets,l.capabilities]),w=x.useCallback(()=>D(V=>Math.min(V*1.3,Lp)),[]),N=x.useCallback(()=>D(V=>Math.max(V/1.3,la)),[]),ce=x.useCallback(()=>{var B;const V=((B=g.current)==null?void 0:B.offsetWidth)??1200;D(Ti(V,v)),T(0)},[v]),lastSent=x.useRef(null),pushSeq=x.useRef(Date.now()),resyncSeen=x.useRef(l.resync??0),resync=l.resync??0;return x.useEffect(()=>{const timer=window.setTimeout(()=>{const next={schedule:c,cipWindows:d,holdingArea:p},prev=lastSent.current,ops=prev&&resync===resyncSeen.current?diffLists(prev,next):null;if(ops&&ops.length===0)return;const base=pushSeq.current;pushSeq.current+=1,lastSent.current=next,resyncSeen.current=resync;const versionKpis=toVersionKpis(c,J);ops&&ops.length<=blockCount(next)*FULL_PUSH_RATIO?Up({ops,base,kpis:versionKpis,lastAction:m,seq:pushSeq.current}):Up({full:!0,...next,kpis:versionKpis,lastAction:m,seq:pushSeq.current})},PUSH_DEBOUNCE_MS);return()=>window.clearTimeout(timer)},[c,d,p,J,m,resync]),x.useEffect(()=>{var B;const V=((B=g.current)==null?void 0:B.scrollHeight)??800;da(V+20)}),x.useEffect(()=>{const V=B=>{B.ctrlKey&&B.key==="z"&&(B.preventDefault(),u.undo()),B.ctrlKey&&B.key==="y"&&(B.preventDefault(),u.redo()),B.key==="Escape"&&(ae(),fe(null),re(null))};return window.addEventListener("keydown",V),()=>window.removeEventListener("keydown",V)},[u,ae]),C.jsxs("div",{ref:g,style:{fontFamily:"-apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif"},onClick:()=>{ae(),fe(null)},children:[C.jsx(Wp,{kpis:J}),C.jsxs(hp,{sensors:oe,onDragStart:Z,onDragEnd:A,children:[C.jsx(Gp,{schedule:c,cipWindows:d,lines:l.lines,viewStart:R,viewEnd:Math.min(U,v),hourWidth:_,anchor:q,resizing:b,highlightSku:ne,capableLines:le,onResizeStart:$,onContextMenu:ye,onBlockClick:I,onZoomIn:w,onZoomOut:N,onResetZoom:ce}),C.jsx("div",{style:{marginTop:8},children:C.jsx(Jp,{blocks:p})}),C.jsx(Pp,{})]}),C.jsx(qp,{lines:l.lines,cipDuration:l.config.cip_duration_h,onAddCip:u.addCip,onAddTrial:u.addTrial}),C.jsxs("div",{style:{marginTop:8},children:[C.jsx("strong",{style:{fontSize:13,display:"block",marginBottom:4},children:"SKU Adherence (live) — click a row to highlight on chart"}),C.jsx(eh,{rows:W,highlightSku:ne,onSkuClick:re})]}),C.jsx(th,{menu:te,onSplit:u.splitBlock,onRemove:u.removeToHolding,onDetails:I,onClose:ae,minRunHours:l.config.min_run_hours}),ve&&C.jsx(nh,{block:ve.block,x:ve.x,y:ve.y,rate:zi(ve.block.line_name,ve.block.sku,l.capabilities),onClose:()=>fe(null)}),m&&C.jsxs("div",{style:{fontSize:11,color:"#888",marginTop:4},children:["Last action: ",m]})]})},lh=()=>{const[l,s]=x.useState(null);return x.useEffect(()=>{Fp(u=>{u.args&&s(u.args)}),Bp(),da(200)},[]),l?C.jsx(rh,{args:l}):C.jsx("div",{style:{padding:20,textAlign:"center",color:"#888"},children:"Waiting for schedule data from Streamlit..."})};tf.createRoot(document.getElementById("root")).render(C.jsx(lh,{}))})();
@@ -10,10 +10,11 @@ import type { SandboxArgs, ScheduleBlock } from "./types";
 import { useScheduleState } from "./hooks/useScheduleState";
 import { useBlockResize } from "./hooks/useBlockResize";
 import { useContextMenu } from "./hooks/useContextMenu";
-import { computeKpis, computeAdherence } from "./utils/kpi";
+import { computeKpis, computeAdherence, toVersionKpis } from "./utils/kpi";
 import { isCapable, recalcDuration, findOverlapsOnLine } from "./utils/validation";
 import { LINE_HEIGHT, MIN_HOUR_WIDTH, MAX_HOUR_WIDTH, snapToHour, fitToWidth } from "./utils/layout";
 import { getRate } from "./utils/validation";
+import { diffLists, blockCount, type SandboxLists } from "./utils/diff";
 import { setComponentValue, setFrameHeight } from "./streamlit";
 
 import { KpiBar } from "./components/KpiBar";
@@ -28,6 +29,11 @@ interface Props {
   args: SandboxArgs;
 }
 
+/** Quiet period after the last edit before state is sent back to Python. */
+const PUSH_DEBOUNCE_MS = 120;
+/** Above this share of changed blocks a full snapshot is cheaper than ops. */
+const FULL_PUSH_RATIO = 0.5;
+
 export const GanttSandbox: React.FC<Props> = ({ args }) => {
   const [data, actions] = useScheduleState(args);
   const { schedule, cipWindows, holdingArea, lastAction } = data;
@@ -217,14 +223,37 @@ export const GanttSandbox: React.FC<Props> = ({ args }) => {
   // pan removed — full 2-week view fits in viewport, no scrolling needed
 
   // ── Push state to Python ──
-  const lastPushed = useRef("");
+  // Every setComponentValue triggers a full Streamlit rerun, so bursts of
+  // edits (undo/redo mashing, drag + resize) are coalesced into one trailing
+  // push.  ``seq`` increases per push so Python can skip a value it has
+  // already applied when the page reruns for some other reason; it starts
+  // from the clock so a remounted component never reuses an old value.
+  // After the first push only the changed blocks are sent, as ops on top of
+  // the previous push; Python bumps ``args.resync`` if it missed that push.
+  // The KPI bar's figures ride along so a saved version records them as shown.
+  const lastSent = useRef<SandboxLists | null>(null);
+  const pushSeq = useRef(Date.now());
+  const resyncSeen = useRef(args.resync ?? 0);
+  const resync = args.resync ?? 0;
   useEffect(() => {
-    const key = JSON.stringify({ schedule, cipWindows, holdingArea });
-    if (key !== lastPushed.current) {
-      lastPushed.current = key;
-      setComponentValue({ schedule, cipWindows, holdingArea, lastAction });
-    }
-  }, [schedule, cipWindows, holdingArea, lastAction]);
+    const timer = window.setTimeout(() => {
+      const next: SandboxLists = { schedule, cipWindows, holdingArea };
+      const prev = lastSent.current;
+      const ops = prev && resync === resyncSeen.current ? diffLists(prev, next) : null;
+      if (ops && ops.length === 0) return;
+      const base = pushSeq.current;
+      pushSeq.current += 1;
+      lastSent.current = next;
+      resyncSeen.current = resync;
+      const versionKpis = toVersionKpis(schedule, kpis);
+      if (ops && ops.length <= blockCount(next) * FULL_PUSH_RATIO) {
+        setComponentValue({ ops, base, kpis: versionKpis, lastAction, seq: pushSeq.current });
+      } else {
+        setComponentValue({ full: true, ...next, kpis: versionKpis, lastAction, seq: pushSeq.current });
+      }
+    }, PUSH_DEBOUNCE_MS);
+    return () => window.clearTimeout(timer);
+  }, [schedule, cipWindows, holdingArea, kpis, lastAction, resync]);
 
   // ── Auto-size iframe ──
   useEffect(() => {
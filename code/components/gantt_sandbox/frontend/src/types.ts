@@ -43,14 +43,27 @@ export interface SandboxArgs {
   lines: LineInfo[];
   holdingArea: ScheduleBlock[];
   config: SandboxConfig;
+  resync?: number; // bumped by Python when it needs a full snapshot
 }
 
-/** State sent from React back to Python */
+export type SandboxListName = "schedule" | "cipWindows" | "holdingArea";
+
+/** One block-level change, applied by id on the Python side */
+export type SandboxOp =
+  | { type: "upsert"; list: SandboxListName; block: ScheduleBlock }
+  | { type: "remove"; list: SandboxListName; id: string };
+
+/** State sent from React back to Python: a full snapshot or ops since `base` */
 export interface SandboxState {
-  schedule: ScheduleBlock[];
-  cipWindows: ScheduleBlock[];
-  holdingArea: ScheduleBlock[];
+  full?: boolean;
+  schedule?: ScheduleBlock[];
+  cipWindows?: ScheduleBlock[];
+  holdingArea?: ScheduleBlock[];
+  ops?: SandboxOp[];
+  base?: number; // seq of the push the ops apply on top of
+  kpis: VersionKpis; // KPIs for the pushed state, as shown in the KPI bar
   lastAction: string;
+  seq: number; // increments on every push; lets Python skip repeats
 }
 
 export interface AdherenceRow {
@@ -71,3 +84,12 @@ export interface KpiData {
   perLineChangeovers: Record<string, number>;
   overlaps: string[];
 }
+
+/** KPI summary stored with a saved version (keys match sandbox_engine.version_kpis) */
+export interface VersionKpis {
+  changeovers: number;
+  makespan_h: number;
+  orders_met: number;
+  orders_total: number;
+  adherence_pct: number;
+}
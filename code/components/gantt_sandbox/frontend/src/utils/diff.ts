@@ -0,0 +1,27 @@
+// diff.ts — Block-level diff between two pushed sandbox states.
+
+import type { ScheduleBlock, SandboxListName, SandboxOp } from "../types";
+
+export type SandboxLists = Record<SandboxListName, ScheduleBlock[]>;
+
+const LIST_NAMES: SandboxListName[] = ["schedule", "cipWindows", "holdingArea"];
+
+/** Upsert/remove ops that turn *prev* into *next*, matched by block id. */
+export function diffLists(prev: SandboxLists, next: SandboxLists): SandboxOp[] {
+  const ops: SandboxOp[] = [];
+  for (const list of LIST_NAMES) {
+    const before = new Map(prev[list].map((b) => [b.id, b]));
+    for (const b of next[list]) {
+      const old = before.get(b.id);
+      before.delete(b.id);
+      if (old === b || (old && JSON.stringify(old) === JSON.stringify(b))) continue;
+      ops.push({ type: "upsert", list, block: b });
+    }
+    for (const id of before.keys()) ops.push({ type: "remove", list, id });
+  }
+  return ops;
+}
+
+export function blockCount(lists: SandboxLists): number {
+  return lists.schedule.length + lists.cipWindows.length + lists.holdingArea.length;
+}
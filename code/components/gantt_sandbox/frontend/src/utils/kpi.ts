@@ -1,6 +1,6 @@
 // kpi.ts — Client-side KPI computation (mirrors sandbox_engine.py).
 
-import type { ScheduleBlock, DemandTarget, AdherenceRow, KpiData } from "../types";
+import type { ScheduleBlock, DemandTarget, AdherenceRow, KpiData, VersionKpis } from "../types";
 
 export function computeAdherence(
   schedule: ScheduleBlock[],
@@ -83,6 +83,24 @@ export function computeKpis(
   };
 }
 
+/** The live KPIs in the shape Python stores with a saved version. */
+export function toVersionKpis(schedule: ScheduleBlock[], kpis: KpiData): VersionKpis {
+  let first = Infinity;
+  let last = -Infinity;
+  for (const b of schedule) {
+    if (b.block_type === "cip") continue;
+    first = Math.min(first, b.start_hour);
+    last = Math.max(last, b.end_hour);
+  }
+  return {
+    changeovers: kpis.totalChangeovers,
+    makespan_h: first <= last ? Math.round((last - first) * 10) / 10 : 0,
+    orders_met: kpis.ordersMet,
+    orders_total: kpis.ordersTotal,
+    adherence_pct: kpis.pctAdherence,
+  };
+}
+
 function checkOverlapsSimple(blocks: ScheduleBlock[]): string[] {
   const byLine: Record<string, ScheduleBlock[]> = {};
   for (const b of blocks) (byLine[b.line_name] ??= []).push(b);
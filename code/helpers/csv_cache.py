@@ -0,0 +1,126 @@
+# helpers/csv_cache.py — Parquet sidecar cache for CSV inputs.
+#
+# The CSV stays the canonical file that users (and the solver) edit.
+# load_csv() keeps a sibling ``<name>.parquet`` next to it and reads that
+# instead while the CSV is unchanged, skipping the text parse entirely.
+# The sidecar records the CSV's (mtime, size) it was built from and is only
+# reused on an exact match -- a newer-than check would trust it after the
+# CSV is replaced by an older file (cp -p, a restored backup).  Any problem with the sidecar (pyarrow missing, read-only
+# directory, a column Arrow cannot encode) silently falls back to a plain
+# pd.read_csv().
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Mapping, Optional, Sequence
+
+import pandas as pd
+
+_SIDECAR_SUFFIX = ".parquet"
+_SOURCE_KEY = b"flowstate.csv_source"  # Parquet schema metadata key
+
+
+def sidecar_path(path: Path | str) -> Path:
+    """Return the Parquet sidecar location for the CSV at *path*."""
+    return Path(path).with_suffix(_SIDECAR_SUFFIX)
+
+
+def invalidate(path: Path | str) -> None:
+    """Drop the sidecar for *path* so the next load re-parses the CSV."""
+    try:
+        sidecar_path(path).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def drop_unnamed(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop the ``Unnamed: N`` columns pandas creates for trailing commas."""
+    keep = [c for c in df.columns if not str(c).startswith("Unnamed")]
+    return df if len(keep) == len(df.columns) else df[keep]
+
+
+def _source_tag(src: os.stat_result) -> bytes:
+    """The CSV identity stored in, and checked against, the sidecar."""
+    return f"{src.st_mtime_ns}:{src.st_size}".encode()
+
+
+def _read_sidecar(pq_path: Path, tag: bytes, cols: Optional[list[str]]) -> Optional[pd.DataFrame]:
+    """The sidecar's frame if it was built from the CSV identified by *tag*."""
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(pq_path, columns=cols)
+    if (table.schema.metadata or {}).get(_SOURCE_KEY) != tag:
+        return None
+    return table.to_pandas()
+
+
+def _write_sidecar(df: pd.DataFrame, pq_path: Path, tag: bytes) -> None:
+    """Write *df* to *pq_path* atomically via temp-file + os.replace()."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), _SOURCE_KEY: tag})
+    fd, tmp = tempfile.mkstemp(dir=str(pq_path.parent), suffix=".tmp")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, str(pq_path))
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _parse_csv(path: Path, engine: str) -> pd.DataFrame:
+    """Parse *path* with *engine*, falling back to the default C parser."""
+    if engine == "pyarrow":
+        try:
+            return pd.read_csv(path, engine="pyarrow")
+        except (ImportError, ValueError):
+            pass
+    return pd.read_csv(path)
+
+
+def load_csv(
+    path: Path | str,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[Mapping[str, Any]] = None,
+    engine: str = "c",
+) -> pd.DataFrame:
+    """Read the CSV at *path*, hydrating from its Parquet sidecar when current.
+
+    *columns* optionally projects the result; with a current sidecar only
+    those columns are read from disk.  *dtype* maps column names to final
+    dtypes; the sidecar always stores the untyped parse so callers with
+    different *dtype* maps can share it.  *engine* picks the pandas CSV
+    parser used on a sidecar miss; ``"pyarrow"`` falls back to the C
+    engine when pyarrow is unavailable or rejects the file.
+    """
+    path = Path(path)
+    pq_path = sidecar_path(path)
+    cols = list(columns) if columns is not None else None
+    # Stat before parsing: if the CSV changes mid-read the recorded tag is
+    # stale and the next load re-parses, never the other way round.
+    tag = _source_tag(path.stat())
+    df = None
+    try:
+        df = _read_sidecar(pq_path, tag, cols)
+    except (ImportError, OSError, ValueError, KeyError):
+        pass
+
+    if df is None:
+        df = _parse_csv(path, engine)
+        try:
+            _write_sidecar(df, pq_path, tag)
+        except (ImportError, OSError, ValueError, TypeError):
+            pass
+        if cols is not None:
+            df = df[cols]
+    if dtype:
+        df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+    return df
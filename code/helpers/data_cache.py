@@ -0,0 +1,514 @@
+# helpers/data_cache.py — st.cache_data-backed loaders shared across pages.
+#
+# Every cached function takes the file's mtime as part of its key, so a
+# rewrite from any page (or from the solver subprocess) invalidates the
+# entry on the next rerun without any explicit clearing.  The small scalar
+# results (row and line counts) also persist to disk, so they survive a
+# server restart.
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+import pandas as pd
+import streamlit as st
+
+from helpers.csv_cache import load_csv
+from helpers.paths import config_path
+from helpers.sandbox_engine import (
+    load_capabilities,
+    load_changeovers,
+    load_demand_targets,
+    nest_pairs,
+)
+
+try:
+    import tomllib
+except ModuleNotFoundError:
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ModuleNotFoundError:
+        tomllib = None  # type: ignore[assignment]
+
+_COUNT_CHUNK = 1 << 20  # bytes per read when counting rows
+
+
+def _mtime_ns(path: Path) -> int:
+    """Return *path*'s mtime in ns, or 0 when the file is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _stat_mtime_ns(path: Path, stats: Optional[Mapping[str, os.stat_result]]) -> int:
+    """_mtime_ns(), read from a dir_stats() result instead when given one."""
+    if stats is None:
+        return _mtime_ns(path)
+    st_res = stats.get(path.name)
+    return st_res.st_mtime_ns if st_res is not None else 0
+
+
+def _count_rows(path_str: str, size: int) -> int | None:
+    # Count newline bytes rather than parsing: no dtype inference and no
+    # per-cell objects.  Quoted multi-line cells would over-count, but none
+    # of the app's inputs use them.
+    if not size:
+        return None
+    newlines = 0
+    last = b""
+    try:
+        with open(path_str, "rb") as f:
+            while chunk := f.read(_COUNT_CHUNK):
+                newlines += chunk.count(b"\n")
+                last = chunk[-1:]
+    except OSError:
+        return None
+    lines = newlines + (last != b"\n")
+    return max(0, lines - 1)  # minus the header
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _row_count(path_str: str, mtime_ns: int, size: int) -> int | None:
+    return _count_rows(path_str, size)
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _row_counts(keys: tuple[tuple[str, int, int], ...]) -> list[int | None]:
+    # Plain worker threads (no Streamlit calls inside); file reads release
+    # the GIL, so cold counts overlap instead of running back to back.
+    with ThreadPoolExecutor(max_workers=len(keys)) as ex:
+        return list(ex.map(lambda k: _count_rows(k[0], k[2]), keys))
+
+
+@st.cache_data(show_spinner=False)
+def _csv(
+    path_str: str,
+    mtime_ns: int,
+    columns: Optional[tuple[str, ...]],
+    dtype: Optional[Mapping[str, Any]],
+    engine: str,
+) -> pd.DataFrame:
+    return load_csv(path_str, columns=columns, dtype=dtype, engine=engine)
+
+
+@st.cache_data(show_spinner=False)
+def _toml(path_str: str, mtime_ns: int) -> dict:
+    if not mtime_ns or tomllib is None:
+        return {}
+    with open(path_str, "rb") as f:
+        return tomllib.load(f)
+
+
+@st.cache_data(show_spinner=False)
+def _capabilities(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    if not mtime_ns:
+        return pd.DataFrame(columns=["line_id", "sku", "line_name", "capable"])
+    df = load_csv(path_str, engine="pyarrow")
+    df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype("int16")
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _line_name_map(path_str: str, mtime_ns: int) -> dict[str, int]:
+    caps = _capabilities(path_str, mtime_ns)
+    u = caps.drop_duplicates("line_name")
+    return {
+        ln: int(lid)
+        for ln, lid in zip(u["line_name"].astype(str).str.strip(), u["line_id"])
+        if ln
+    }
+
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _line_count(path_str: str, mtime_ns: int, size: int) -> int:
+    if not mtime_ns:
+        return 0
+    # Only line_id is needed: with a fresh sidecar that is a one-column read
+    return int(load_csv(path_str, columns=["line_id"], engine="pyarrow")["line_id"].nunique())
+
+
+@st.cache_data(show_spinner=False)
+def _sku_list(path_str: str, mtime_ns: int) -> list[str]:
+    if not mtime_ns:
+        return []
+    caps = load_csv(path_str, columns=["sku"], engine="pyarrow")
+    return sorted(caps["sku"].dropna().astype(str).unique().tolist())
+
+
+def _column(df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    """*df*'s column *name*, or a column of *default* when it is absent."""
+    return df[name] if name in df.columns else pd.Series(default, index=df.index)
+
+
+def _text(df: pd.DataFrame, name: str) -> pd.Series:
+    """*df*'s column *name* as str, blanks as "" (never NaN) on any pandas."""
+    return _column(df, name, "").fillna("").astype(str)
+
+
+# Final dtypes for the sandbox block loaders.  The files are read through
+# load_csv(), so after the first parse each rewrite is reloaded from its
+# Parquet sidecar as typed columns rather than re-parsed as text.
+_SCHED_DTYPES = {
+    "line_id": "int64",
+    "line_name": "str",
+    "order_id": "str",
+    "sku": "str",
+    "sku_description": "str",
+    "start_hour": "float64",
+    "end_hour": "float64",
+    "run_hours": "float64",
+    "is_trial": "boolean",
+}
+_CIP_DTYPES = {
+    "line_id": "int64",
+    "line_name": "str",
+    "start_hour": "float64",
+    "end_hour": "float64",
+}
+
+
+# The block builders cast whole columns and emit records in one pass;
+# to_dict("records") yields native Python scalars, so the lists go to the
+# sandbox component as-is.
+@st.cache_data(show_spinner=False)
+def _schedule_blocks(path_str: str, mtime_ns: int) -> list[dict]:
+    if not mtime_ns:
+        return []
+    df = load_csv(path_str, dtype=_SCHED_DTYPES)
+    is_trial = _column(df, "is_trial", False).fillna(False).astype(bool)
+    return pd.DataFrame({
+        "id": [f"sched_{i}" for i in range(len(df))],
+        "line_id": _column(df, "line_id", 0).astype("int64"),
+        "line_name": _text(df, "line_name"),
+        "order_id": _text(df, "order_id"),
+        "sku": _text(df, "sku"),
+        "sku_description": _text(df, "sku_description"),
+        "start_hour": _column(df, "start_hour", 0).astype("float64"),
+        "end_hour": _column(df, "end_hour", 0).astype("float64"),
+        "run_hours": _column(df, "run_hours", 0).astype("float64"),
+        "is_trial": is_trial,
+        "block_type": is_trial.map({True: "trial", False: "sku"}),
+    }).to_dict("records")
+
+
+@st.cache_data(show_spinner=False)
+def _cip_blocks(path_str: str, mtime_ns: int) -> list[dict]:
+    if not mtime_ns:
+        return []
+    df = load_csv(path_str, dtype=_CIP_DTYPES)
+    start = _column(df, "start_hour", 0).astype("float64")
+    end = _column(df, "end_hour", 0).astype("float64")
+    return pd.DataFrame({
+        "id": [f"cip_{i}" for i in range(len(df))],
+        "line_id": _column(df, "line_id", 0).astype("int64"),
+        "line_name": _text(df, "line_name"),
+        "order_id": "CIP",
+        "sku": "CIP",
+        "start_hour": start,
+        "end_hour": end,
+        "run_hours": end - start,
+        "is_trial": False,
+        "block_type": "cip",
+    }).to_dict("records")
+
+
+@st.cache_data(show_spinner=False)
+def _line_list(path_str: str, mtime_ns: int) -> list[dict]:
+    if not mtime_ns:
+        return []
+    df = _capabilities(path_str, mtime_ns).drop_duplicates("line_name").sort_values("line_id")
+    return [
+        {"line_id": int(lid), "line_name": str(ln)}
+        for lid, ln in zip(df["line_id"], df["line_name"])
+    ]
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _sandbox_reference(
+    dd_str: str, mtimes: tuple[int, ...],
+) -> tuple[dict, pd.DataFrame, dict, dict, list]:
+    dd = Path(dd_str)
+    caps = load_capabilities(dd)
+    rates = pd.DataFrame(
+        [(ln, sku, rate) for (ln, sku), rate in caps.items()],
+        columns=["line_name", "sku", "rate"],
+    )
+    return caps, rates, nest_pairs(caps), nest_pairs(load_changeovers(dd)), load_demand_targets(dd)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _version_figure(
+    vdir_str: str, mtime_ns: int, anchor: str, title: str,
+    _schedule_df: pd.DataFrame, _cip_df: Optional[pd.DataFrame],
+):
+    # The frames are derived from the version files plus the anchor, so
+    # they are left out of the key (leading underscore) instead of hashed.
+    from gantt_viewer import build_gantt_figure
+
+    return build_gantt_figure(_schedule_df, cip_df=_cip_df, title=title)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _changeover_details(
+    chg_str: str, mtime_ns: int, sig: int, _schedule: list[dict],
+) -> pd.DataFrame:
+    # *sig* fingerprints every block field read below, so the block list
+    # itself is left out of the key (leading underscore) instead of hashed.
+    from gantt_viewer import compute_changeover_details
+
+    co_rows = []
+    cip_rows = []
+    for b in _schedule:
+        if b.get("block_type") == "cip":
+            cip_rows.append({
+                "line_id": b.get("line_id", 0),
+                "start_hour": b.get("start_hour", 0),
+                "end_hour": b.get("end_hour", 0),
+            })
+            continue
+        co_rows.append({
+            "line_id": b.get("line_id", 0),
+            "Task": b.get("line_name", ""),
+            "Resource": str(b.get("sku", "")),
+            "Start": b.get("start_hour", 0),
+            "end_hour": b.get("end_hour", 0),
+        })
+    if not co_rows:
+        return pd.DataFrame()
+    cip_df = pd.DataFrame(cip_rows) if cip_rows else None
+    return compute_changeover_details(pd.DataFrame(co_rows), changeovers_path=Path(chg_str), cip_df=cip_df)
+
+
+def csv_row_count(path: Path | str) -> int | None:
+    """Return the data-row count of a CSV, or None if missing / unreadable.
+
+    Cached on ``(path, mtime, size)`` so repeat renders skip the parse.
+    """
+    try:
+        st_res = Path(path).stat()
+    except OSError:
+        return None
+    return _row_count(str(path), st_res.st_mtime_ns, st_res.st_size)
+
+
+def read_csv_cached(
+    path: Path | str,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[Mapping[str, Any]] = None,
+    engine: str = "c",
+) -> pd.DataFrame:
+    """load_csv() behind st.cache_data, keyed on the file's mtime.
+
+    Each call returns a fresh copy of the cached frame, so callers may
+    mutate the result freely.
+    """
+    path = Path(path)
+    cols = tuple(columns) if columns is not None else None
+    return _csv(str(path), _mtime_ns(path), cols, dict(dtype) if dtype else None, engine)
+
+
+def dir_stats(dd: Path | str, names: Iterable[str]) -> dict[str, os.stat_result]:
+    """Stat results for the *names* present in *dd*, from one scandir sweep.
+
+    Keys are the requested names (matched case-insensitively on Windows);
+    missing files are simply absent.  On Windows the directory listing
+    already carries the stat data, so no per-file call is made.  Names the
+    sweep misses are stat'ed directly, so a case-insensitive filesystem
+    (macOS) still finds ``Changeovers.csv`` for ``changeovers.csv``.
+    """
+    wanted = {os.path.normcase(n): n for n in names}
+    found: dict[str, os.stat_result] = {}
+    try:
+        with os.scandir(dd) as it:
+            for e in it:
+                name = wanted.get(os.path.normcase(e.name))
+                if name is None:
+                    continue
+                try:
+                    found[name] = e.stat()
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    for name in wanted.values():
+        if name not in found:
+            try:
+                found[name] = os.stat(os.path.join(dd, name))
+            except OSError:
+                continue
+    return found
+
+
+def csv_row_counts(
+    paths: Iterable[Path | str],
+    stats: Optional[Mapping[str, os.stat_result]] = None,
+) -> list[int | None]:
+    """csv_row_count() for several files, counted concurrently on a miss.
+
+    The cache key is every file's ``(path, mtime, size)``, so touching any
+    one of them recounts the batch.  *stats* (from dir_stats(), keyed by
+    file name) replaces the per-file stat calls.
+    """
+    keys = []
+    for p in paths:
+        if stats is not None:
+            st_res = stats.get(Path(p).name)
+        else:
+            try:
+                st_res = Path(p).stat()
+            except OSError:
+                st_res = None
+        if st_res is None:
+            keys.append((str(p), 0, 0))
+        else:
+            keys.append((str(p), st_res.st_mtime_ns, st_res.st_size))
+    if not keys:
+        return []
+    return _row_counts(tuple(keys))
+
+
+def load_toml(path: Path | str) -> dict:
+    """Parsed TOML at *path*, or ``{}`` when the file is missing.
+
+    Malformed files raise (tomllib.TOMLDecodeError is a ValueError) and
+    are not cached, so a fix on disk is picked up on the next rerun.
+    """
+    path = Path(path)
+    return _toml(str(path), _mtime_ns(path))
+
+
+def load_capabilities_df(dd: Path) -> pd.DataFrame:
+    """Raw capabilities_rates.csv with ``line_id`` coerced to int16.
+
+    Returns an empty frame when the file is missing.
+    """
+    path = Path(dd) / "capabilities_rates.csv"
+    return _capabilities(str(path), _mtime_ns(path))
+
+
+def line_name_map(dd: Path) -> dict[str, int]:
+    """Return ``{line_name: line_id}`` from capabilities_rates.csv."""
+    path = Path(dd) / "capabilities_rates.csv"
+    return _line_name_map(str(path), _mtime_ns(path))
+
+
+def line_count(dd: Path, stats: Optional[Mapping[str, os.stat_result]] = None) -> int:
+    """Distinct ``line_id`` count in capabilities_rates.csv (0 when missing).
+
+    *stats* is an optional dir_stats() result to reuse instead of a stat.
+    """
+    path = Path(dd) / "capabilities_rates.csv"
+    if stats is not None:
+        st_res = stats.get(path.name)
+        if st_res is None:
+            return 0
+    else:
+        try:
+            st_res = path.stat()
+        except OSError:
+            return 0
+    return _line_count(str(path), st_res.st_mtime_ns, st_res.st_size)
+
+
+def capability_skus(dd: Path) -> list[str]:
+    """Sorted unique SKUs in capabilities_rates.csv (empty when missing)."""
+    path = Path(dd) / "capabilities_rates.csv"
+    return _sku_list(str(path), _mtime_ns(path))
+
+
+def schedule_blocks(dd: Path, stats: Optional[Mapping[str, os.stat_result]] = None) -> list[dict]:
+    """schedule_phase2.csv as sandbox block dicts (empty when missing).
+
+    *stats* is an optional dir_stats() result to reuse instead of a stat.
+    """
+    path = Path(dd) / "schedule_phase2.csv"
+    return _schedule_blocks(str(path), _stat_mtime_ns(path, stats))
+
+
+def cip_blocks(dd: Path, stats: Optional[Mapping[str, os.stat_result]] = None) -> list[dict]:
+    """cip_windows.csv as sandbox CIP block dicts (empty when missing).
+
+    *stats* is an optional dir_stats() result to reuse instead of a stat.
+    """
+    path = Path(dd) / "cip_windows.csv"
+    return _cip_blocks(str(path), _stat_mtime_ns(path, stats))
+
+
+def line_list(dd: Path, stats: Optional[Mapping[str, os.stat_result]] = None) -> list[dict]:
+    """``[{line_id, line_name}]`` per line in capabilities_rates.csv, by line_id.
+
+    *stats* is an optional dir_stats() result to reuse instead of a stat.
+    """
+    path = Path(dd) / "capabilities_rates.csv"
+    return _line_list(str(path), _stat_mtime_ns(path, stats))
+
+
+def sandbox_reference(
+    dd: Path,
+    stats: Optional[Mapping[str, os.stat_result]] = None,
+) -> tuple[dict, pd.DataFrame, dict, dict, list]:
+    """``(caps_tuples, rates_df, caps_nested, co_nested, demand)`` for the sandbox.
+
+    ``rates_df`` is caps_tuples as a ``line_name, sku, rate`` frame, for
+    vectorized joins against schedule blocks.
+
+    Built once per combination of input mtimes (capabilities, line rates,
+    changeovers, demand plan and flowstate.toml, which picks the rate
+    month) and shared as live objects across reruns and sessions --
+    callers must treat them as read-only.  *stats* is an optional
+    dir_stats() result for *dd* to reuse instead of stat calls.
+    """
+    dd = Path(dd)
+    mtimes = tuple(
+        _stat_mtime_ns(dd / name, stats)
+        for name in ("capabilities_rates.csv", "line_rates.csv", "changeovers.csv", "demand_plan.csv")
+    ) + (_mtime_ns(config_path(dd)),)
+    return _sandbox_reference(str(dd), mtimes)
+
+
+def version_gantt_figure(
+    dd: Path,
+    slug: str,
+    planning_anchor: str,
+    title: str,
+    schedule_df: pd.DataFrame,
+    cip_df: Optional[pd.DataFrame],
+):
+    """build_gantt_figure() for a saved version, cached per version.
+
+    The key is the version directory, its files' mtimes, the planning
+    anchor and the title; *schedule_df* / *cip_df* must be the Gantt
+    frames built from that version with that anchor.
+    """
+    vdir = Path(dd) / "versions" / slug
+    mtime_ns = max(_mtime_ns(vdir / "schedule.csv"), _mtime_ns(vdir / "cip_windows.csv"))
+    return _version_figure(str(vdir), mtime_ns, planning_anchor, title, schedule_df, cip_df)
+
+
+def changeover_details(
+    dd: Path,
+    schedule: list[dict],
+    stats: Optional[Mapping[str, os.stat_result]] = None,
+) -> pd.DataFrame:
+    """compute_changeover_details() for sandbox *schedule* blocks, cached.
+
+    Keyed on changeovers.csv's mtime plus a fingerprint of each block's
+    type, line, SKU and hours, so reruns that leave the schedule alone
+    skip the rebuild.  Empty when changeovers.csv is missing or there are
+    no production blocks.  *stats* is an optional dir_stats() result to
+    reuse instead of a stat.
+    """
+    path = Path(dd) / "changeovers.csv"
+    mtime_ns = _stat_mtime_ns(path, stats)
+    if not mtime_ns or not schedule:
+        return pd.DataFrame()
+    sig = hash(tuple(
+        (b.get("block_type"), b.get("line_id", 0), b.get("line_name", ""), b.get("sku", ""),
+         b.get("start_hour", 0), b.get("end_hour", 0))
+        for b in schedule
+    ))
+    return _changeover_details(str(path), mtime_ns, sig, schedule)
@@ -15,6 +15,21 @@ def data_dir() -> Path:
     return Path(st.session_state.get("data_dir", str(_DEFAULT_DATA)))
 
 
+@st.cache_resource(show_spinner=False)
+def _resolve_config(dd_str: str) -> Path:
+    dd = Path(dd_str)
+    beside = dd.parent / "flowstate.toml"
+    return beside if beside.exists() else dd / "flowstate.toml"
+
+
+def config_path(dd: Optional[Path] = None) -> Path:
+    """Return flowstate.toml's location: next to the data dir, else inside it.
+
+    Resolved once per data directory for the life of the server process.
+    """
+    return _resolve_config(str(dd or data_dir()))
+
+
 def load_schedule_meta(dd: Optional[Path] = None) -> dict:
     """Read schedule_meta.json.  Returns ``{"solver_ran_at": str|None, "edited": bool}``."""
     dd = dd or data_dir()
@@ -1,17 +1,26 @@
 # helpers/safe_io.py — Atomic file-write helpers for CSV and TOML.
 #
-# Every write goes to a temp file in the same directory, then os.replace()
-# swaps it into place.  os.replace() is atomic on both POSIX and Windows,
-# so a crash mid-write never corrupts the target file.
+# Every write goes to a temp file in the same directory, is flushed and
+# fsync'd once, then os.replace() swaps it into place.  os.replace() is
+# atomic on both POSIX and Windows, so a crash mid-write never corrupts the
+# target file.
 
 from __future__ import annotations
 
 import os
+import shutil
 import tempfile
 from pathlib import Path
 
 import pandas as pd
 
+try:  # only needed by safe_write_toml(); keep CSV helpers usable without it
+    import tomli_w
+except ImportError:
+    tomli_w = None  # type: ignore[assignment]
+
+from helpers.csv_cache import invalidate as _invalidate_sidecar
+
 _FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
 
 
@@ -39,7 +48,8 @@ def safe_write_csv(
     path.parent.mkdir(parents=True, exist_ok=True)
     to_csv_kwargs.setdefault("index", False)
     if sanitize:
-        obj_cols = df.select_dtypes(include=["object"]).columns
+        # category too: pages load SKU/line columns as categoricals
+        obj_cols = df.select_dtypes(include=["object", "string", "category"]).columns
         if len(obj_cols):
             df = df.copy()
             df[obj_cols] = df[obj_cols].map(_sanitize_csv_value)
@@ -47,7 +57,10 @@ def safe_write_csv(
     try:
         with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
             df.to_csv(f, **to_csv_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, str(path))
+        _invalidate_sidecar(path)
     except BaseException:
         try:
             os.unlink(tmp)
@@ -56,16 +69,53 @@ def safe_write_csv(
         raise
 
 
-def safe_write_toml(cfg: dict, path: Path | str) -> None:
-    """Write *cfg* to *path* atomically via temp-file + os.replace()."""
-    import tomli_w
+def safe_copy_file(src: Path | str, dst: Path | str) -> None:
+    """Copy *src* over *dst* atomically via temp-file + os.replace().
 
+    shutil.copyfile() uses a kernel-side copy (sendfile / fcopyfile) where
+    available and skips the metadata copy2() does.  *dst* is deliberately
+    not hard-linked to *src*: the solver rewrites its outputs in place,
+    which would then silently modify the source too.
+    """
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(dst.parent), suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, str(dst))
+        _invalidate_sidecar(dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def safe_write_toml(cfg: dict, path: Path | str) -> bool:
+    """Write *cfg* to *path* atomically via temp-file + os.replace().
+
+    Skips the write (and keeps the file's mtime, so mtime-keyed caches stay
+    warm) when the serialized bytes match what is already on disk.
+    Returns True if the file was written.
+    """
+    if tomli_w is None:
+        raise ImportError("safe_write_toml() requires tomli-w (pip install tomli-w)")
     path = Path(path)
+    data = tomli_w.dumps(cfg).encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
     try:
         with os.fdopen(fd, "wb") as f:
-            tomli_w.dump(cfg, f)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, str(path))
     except BaseException:
         try:
@@ -73,3 +123,4 @@ def safe_write_toml(cfg: dict, path: Path | str) -> None:
         except OSError:
             pass
         raise
+    return True
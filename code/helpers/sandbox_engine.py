@@ -9,11 +9,25 @@ import math
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 
+from helpers.csv_cache import drop_unnamed
+
 
 # ── Data loading helpers ────────────────────────────────────────────────
 
+def _column(df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    """*df*'s column *name*, or a column of *default* when it is absent."""
+    return df[name] if name in df.columns else pd.Series(default, index=df.index)
+
+
+def _numeric(df: pd.DataFrame, name: str, default: Any = 0) -> pd.Series:
+    """Column *name* as floats; blanks (and a missing column) become *default*."""
+    col = pd.to_numeric(_column(df, name, default), errors="coerce").astype(float)
+    return col if default is None else col.fillna(default)
+
+
 def _get_planning_month(data_dir: Path) -> int:
     """Return the planning month integer from flowstate.toml, or current month."""
     import datetime as _dt
@@ -48,18 +62,15 @@ def load_capabilities(data_dir: Path) -> Dict[Tuple[str, str], float]:
     df = pd.read_csv(path)
     df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype(int)
     rate_col = "calc_rate_kgph" if "calc_rate_kgph" in df.columns else "rate_uph"
-    # Build base capability map and track line_id per line_name
-    out: Dict[Tuple[str, str], float] = {}
-    line_name_to_id: Dict[str, int] = {}
-    for _, r in df.iterrows():
-        if int(r.get("capable", 0)) == 1:
-            rate = float(r.get(rate_col, 0))
-            if rate > 0:
-                ln = str(r["line_name"])
-                out[(ln, str(r["sku"]))] = rate
-                line_name_to_id[ln] = int(r["line_id"])
-
-    # Apply monthly line-rate override from line_rates.csv
+    capable = _numeric(df, "capable").fillna(0).astype(int) == 1
+    rate = _numeric(df, rate_col)
+    cap = df[capable & (rate > 0)]
+    rate = rate[cap.index]
+    line_names = cap["line_name"].astype(str)
+    keys = list(zip(line_names, cap["sku"].astype(str)))
+
+    # Apply monthly line-rate override from line_rates.csv: every capable
+    # pair on a line takes that line's positive rate for the planning month
     lr_path = data_dir / "line_rates.csv"
     if lr_path.exists():
         plan_month = _get_planning_month(data_dir)
@@ -67,17 +78,14 @@ def load_capabilities(data_dir: Path) -> Dict[Tuple[str, str], float]:
         lr["line_id"] = pd.to_numeric(lr["line_id"], errors="coerce").fillna(0).astype(int)
         lr["Month"] = pd.to_numeric(lr["Month"], errors="coerce").fillna(0).astype(int)
         lr["rate_kgph"] = pd.to_numeric(lr["rate_kgph"], errors="coerce").fillna(0.0)
-        lr_month = lr[lr["Month"] == plan_month]
-        line_rate_map: Dict[int, float] = {}
-        for _, r in lr_month.iterrows():
-            line_rate_map[int(r["line_id"])] = float(r["rate_kgph"])
-        # Override rates for all capable (line_name, sku) pairs where the line has a monthly rate
-        for (ln, sku) in list(out.keys()):
-            lid = line_name_to_id.get(ln)
-            if lid is not None and lid in line_rate_map and line_rate_map[lid] > 0:
-                out[(ln, sku)] = line_rate_map[lid]
+        lr_month = lr[lr["Month"] == plan_month].drop_duplicates("line_id", keep="last")
+        line_rate = lr_month.set_index("line_id")["rate_kgph"]
+        # A line name's id is the one on its last capable row
+        line_ids = cap["line_id"].groupby(line_names, sort=False).last()
+        monthly = line_names.map(line_ids).map(line_rate)
+        rate = rate.where(~(monthly > 0), monthly)
 
-    return out
+    return dict(zip(keys, rate.astype(float).tolist()))
 
 
 def load_changeovers(data_dir: Path) -> Dict[Tuple[str, str], int]:
@@ -85,13 +93,10 @@ def load_changeovers(data_dir: Path) -> Dict[Tuple[str, str], int]:
     path = data_dir / "changeovers.csv"
     if not path.exists():
         return {}
-    df = pd.read_csv(path)
-    df = df.loc[:, ~df.columns.str.startswith("Unnamed")]
-    out: Dict[Tuple[str, str], int] = {}
-    for _, r in df.iterrows():
-        h = int(round(float(r.get("setup_hours", 0))))
-        out[(str(r["from_sku"]), str(r["to_sku"]))] = h
-    return out
+    df = drop_unnamed(pd.read_csv(path))
+    hours = _numeric(df, "setup_hours").round().astype(int)
+    keys = zip(df["from_sku"].astype(str), df["to_sku"].astype(str))
+    return dict(zip(keys, hours.tolist()))
 
 
 def load_demand_targets(data_dir: Path) -> List[Dict[str, Any]]:
@@ -100,26 +105,38 @@ def load_demand_targets(data_dir: Path) -> List[Dict[str, Any]]:
     if not path.exists():
         return []
     df = pd.read_csv(path)
-    out = []
-    for _, r in df.iterrows():
-        qt = float(r.get("qty_target", 0))
-        lp = r.get("lower_pct")
-        up = r.get("upper_pct")
-        qmin = r.get("qty_min")
-        qmax = r.get("qty_max")
-        if pd.notna(lp) and pd.notna(up):
-            qmin = int(math.floor(qt * float(lp)))
-            qmax = int(math.ceil(qt * float(up)))
-        else:
-            qmin = int(qmin) if pd.notna(qmin) else 0
-            qmax = int(qmax) if pd.notna(qmax) else 0
-        out.append({
-            "order_id": str(r.get("order_id", "")),
-            "sku": str(r.get("sku", "")),
-            "qty_min": qmin,
-            "qty_max": qmax,
-        })
-    return out
+    qt = _numeric(df, "qty_target")
+    lp = _numeric(df, "lower_pct", None)
+    up = _numeric(df, "upper_pct", None)
+    # Percent bands win over explicit qty_min / qty_max columns
+    has_pct = lp.notna() & up.notna()
+    qmin = np.floor(qt * lp).where(has_pct, np.trunc(_numeric(df, "qty_min")))
+    qmax = np.ceil(qt * up).where(has_pct, np.trunc(_numeric(df, "qty_max")))
+    return pd.DataFrame({
+        "order_id": _column(df, "order_id", "").astype(str),
+        "sku": _column(df, "sku", "").astype(str),
+        "qty_min": qmin.astype(int),
+        "qty_max": qmax.astype(int),
+    }).to_dict("records")
+
+
+def nest_pairs(pairs: Dict[Tuple[str, str], float]) -> Dict[str, Dict[str, float]]:
+    """Regroup ``{(outer, inner): value}`` as ``{outer: {inner: float(value)}}``.
+
+    Used for the React component's capability and changeover lookups.
+    Key order follows first appearance, as with a setdefault loop.
+    """
+    if not pairs:
+        return {}
+    s = pd.Series(
+        list(pairs.values()),
+        index=pd.MultiIndex.from_tuples(list(pairs.keys())),
+        dtype="float64",
+    )
+    return {
+        outer: dict(zip(grp.index.get_level_values(1), grp.to_numpy().tolist()))
+        for outer, grp in s.groupby(level=0, sort=False)
+    }
 
 
 # ── Validation / KPI functions ──────────────────────────────────────────
@@ -237,6 +254,50 @@ def count_changeovers(
     return total, per_line
 
 
+# Block fields version_kpis() reads, as the columns of its working frame
+_KPI_COLUMNS = ["line_name", "sku", "order_id", "start_hour", "end_hour", "run_hours", "block_type"]
+
+
+def version_kpis(
+    schedule: List[Dict[str, Any]],
+    demand: List[Dict[str, Any]],
+    rates: pd.DataFrame,
+) -> Dict[str, Any]:
+    """KPIs stored with a saved version (CIP blocks are ignored).
+
+    *rates* holds one ``line_name, sku, rate`` row per capable pair.
+    Returns {changeovers, makespan_h, orders_met, orders_total,
+    adherence_pct}; an order is met within [qty_min, qty_max] (qty_max 0 =
+    no cap) and adherence is 100 with no demand.  The blocks are read once into columns; makespan is a
+    column min/max, changeovers are shifted-array comparisons over the
+    columns sorted by (line_name, start_hour), and produced quantity per
+    order is a merge against *rates* and a groupby sum.
+    """
+    sched = pd.DataFrame(schedule, columns=_KPI_COLUMNS)
+    sched = sched[sched["block_type"] != "cip"]
+    sched = sched.sort_values(["line_name", "start_hour"], kind="stable")
+    # A changeover is a neighbouring pair on the same line with a new SKU
+    lines = sched["line_name"].to_numpy()
+    skus = sched["sku"].to_numpy()
+    changeovers = int(((lines[1:] == lines[:-1]) & (skus[1:] != skus[:-1])).sum())
+
+    merged = sched.merge(rates, on=["line_name", "sku"], how="left")
+    produced = (merged["rate"].fillna(0) * merged["run_hours"]).groupby(merged["order_id"]).sum()
+    dem = pd.DataFrame(demand, columns=["order_id", "qty_min", "qty_max"])
+    qty = produced.reindex(dem["order_id"]).fillna(0).to_numpy()
+    qty_max = dem["qty_max"].fillna(0).to_numpy()
+    # Same rule as the component's KPI bar: under qty_min or over a set qty_max is not met
+    met = int(((qty >= dem["qty_min"].to_numpy()) & ~((qty_max > 0) & (qty > qty_max))).sum())
+    total = len(dem)
+    return {
+        "changeovers": changeovers,
+        "makespan_h": round(float(sched["end_hour"].max() - sched["start_hour"].min()), 1) if len(sched) else 0,
+        "orders_met": met,
+        "orders_total": total,
+        "adherence_pct": round(100 * met / total, 1) if total else 100,
+    }
+
+
 def check_overlaps(schedule: List[Dict[str, Any]]) -> List[str]:
     """Return list of overlap descriptions (empty = OK)."""
     by_line: Dict[str, List[Dict[str, Any]]] = {}
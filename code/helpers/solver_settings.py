@@ -0,0 +1,85 @@
+# helpers/solver_settings.py — Defaults for the flowstate.toml solver settings.
+#
+# One place for every widget default on the Run Solver page, read from the
+# parsed TOML with the same fallbacks the page used inline, and written back
+# through the same table so the load and save paths cannot drift apart.
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True)
+class SolverSettings:
+    # [scheduler]
+    time_limit: int = 120
+    min_run_hours: int = 4
+    max_lines_per_order: int = 3
+    planning_start_date: str = "2026-02-15 00:00:00"
+    validate: bool = True
+    use_sku_rates: bool = False
+    # [cip]
+    interval_h: int = 120
+    duration_h: int = 6
+    # [objective]
+    makespan_weight: int = 1
+    changeover_weight: int = 100
+    cip_defer_weight: int = 10
+    # Special changeover penalties: [objective] co_*_weight, else [changeover]
+    conv_org_weight: int = 30
+    cinn_weight: int = 20
+    flavor_weight: int = 5
+    # [changeover]
+    base_changeover_weight: int = 5
+    topload_weight: int = 50
+    ttp_weight: int = 10
+    ffs_weight: int = 10
+    casepacker_weight: int = 10
+
+    @classmethod
+    def from_cfg(cls, cfg: dict) -> "SolverSettings":
+        """Build settings from parsed flowstate.toml, defaulting missing keys."""
+        values = {}
+        for field, locations in _CFG_KEYS.items():
+            for section, key in locations:
+                sec = cfg.get(section, {})
+                if key in sec:
+                    values[field] = sec[key]
+                    break
+        return cls(**values)
+
+    def to_cfg(self) -> dict[str, dict]:
+        """The ``{section: {key: value}}`` tables these settings are saved as.
+
+        Fields stored in more than one place (the special changeover
+        penalties) are written to every location.
+        """
+        out: dict[str, dict] = {}
+        for field, value in asdict(self).items():
+            for section, key in _CFG_KEYS[field]:
+                out.setdefault(section, {})[key] = value
+        return out
+
+
+# field -> (section, key) locations, in lookup order for from_cfg()
+_CFG_KEYS: dict[str, tuple[tuple[str, str], ...]] = {
+    "time_limit": (("scheduler", "time_limit"),),
+    "min_run_hours": (("scheduler", "min_run_hours"),),
+    "max_lines_per_order": (("scheduler", "max_lines_per_order"),),
+    "planning_start_date": (("scheduler", "planning_start_date"),),
+    "validate": (("scheduler", "validate"),),
+    "use_sku_rates": (("scheduler", "use_sku_rates"),),
+    "interval_h": (("cip", "interval_h"),),
+    "duration_h": (("cip", "duration_h"),),
+    "makespan_weight": (("objective", "makespan_weight"),),
+    "changeover_weight": (("objective", "changeover_weight"),),
+    "cip_defer_weight": (("objective", "cip_defer_weight"),),
+    "conv_org_weight": (("objective", "co_conv_org_weight"), ("changeover", "conv_org_weight")),
+    "cinn_weight": (("objective", "co_cinn_weight"), ("changeover", "cinn_weight")),
+    "flavor_weight": (("objective", "co_flavor_weight"), ("changeover", "flavor_weight")),
+    "base_changeover_weight": (("changeover", "base_changeover_weight"),),
+    "topload_weight": (("changeover", "topload_weight"),),
+    "ttp_weight": (("changeover", "ttp_weight"),),
+    "ffs_weight": (("changeover", "ffs_weight"),),
+    "casepacker_weight": (("changeover", "casepacker_weight"),),
+}
@@ -16,7 +16,7 @@ from typing import Any
 
 import pandas as pd
 
-from helpers.safe_io import safe_write_csv
+from helpers.safe_io import safe_copy_file, safe_write_csv
 
 MAX_VERSIONS = 5
 _SLUG_RE = re.compile(r"^[a-z0-9_]{1,64}$")
@@ -161,9 +161,9 @@ def promote_version(slug: str, data_dir: Path) -> None:
     sched_src = vdir / "schedule.csv"
     cip_src = vdir / "cip_windows.csv"
     if sched_src.exists():
-        shutil.copy2(sched_src, dd / "schedule_phase2.csv")
+        safe_copy_file(sched_src, dd / "schedule_phase2.csv")
     if cip_src.exists():
-        shutil.copy2(cip_src, dd / "cip_windows.csv")
+        safe_copy_file(cip_src, dd / "cip_windows.csv")
 
 
 def export_version_excel(slug: str, data_dir: Path) -> bytes:
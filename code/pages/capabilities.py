@@ -4,6 +4,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -11,8 +12,15 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.csv_cache import load_csv
+from helpers.data_cache import load_capabilities_df
 from helpers.safe_io import safe_write_csv
 
+try:  # optional: client-side grid that keeps its row data between reruns
+    from st_aggrid import AgGrid, GridUpdateMode
+except ImportError:
+    AgGrid = None
+
 st.header("Capabilities")
 st.caption("Line-SKU capability matrix and production rates (kg/h). **Rate** and **Capable** columns are editable — line IDs, names, and SKUs are locked.")
 
@@ -22,44 +30,104 @@ if not csv_path.exists():
     st.warning(f"File not found: `{csv_path}`")
     st.stop()
 
-df = pd.read_csv(csv_path)
-df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype(int)
-df["sku"] = df["sku"].astype(str)
-df["capable"] = pd.to_numeric(df["capable"], errors="coerce").fillna(0).astype(int)
-# Support both old (rate_uph) and new (calc_rate_kgph) column names
-if "calc_rate_kgph" not in df.columns and "rate_uph" in df.columns:
-    df = df.rename(columns={"rate_uph": "calc_rate_kgph"})
-
-# Join SKU descriptions from sku_info.csv
 sku_info_path = dd / "sku_info.csv"
-if sku_info_path.exists():
-    si = pd.read_csv(sku_info_path)
-    si["sku"] = si["sku"].astype(str)
-    desc_map = dict(zip(si["sku"], si["ediact_sku_description"].fillna("")))
-    df.insert(df.columns.get_loc("sku") + 1, "sku_description", df["sku"].map(desc_map).fillna(""))
+
+
+def _load_caps() -> pd.DataFrame:
+    df = load_capabilities_df(dd)
+    df["sku"] = df["sku"].astype(str)
+    df["capable"] = pd.to_numeric(df["capable"], errors="coerce").fillna(0).astype("int8")
+    # Support both old (rate_uph) and new (calc_rate_kgph) column names
+    if "calc_rate_kgph" not in df.columns and "rate_uph" in df.columns:
+        df = df.rename(columns={"rate_uph": "calc_rate_kgph"})
+
+    # Join SKU descriptions from sku_info.csv
+    if sku_info_path.exists():
+        si = load_csv(sku_info_path)
+        si["sku"] = si["sku"].astype(str)
+        desc_map = dict(zip(si["sku"], si["ediact_sku_description"].fillna("")))
+        df.insert(df.columns.get_loc("sku") + 1, "sku_description", df["sku"].map(desc_map).fillna(""))
+
+    # Low-cardinality keys as categoricals so isin / pivot hash int codes
+    df["sku"] = df["sku"].astype("category")
+    df["line_name"] = df["line_name"].astype("category")
+    return df
+
+
+def _rate_pivot(frame: pd.DataFrame) -> pd.DataFrame:
+    """Lines x SKUs rate grid, scattered from categorical codes.
+
+    Only the non-zero cells are written, so the work is O(nnz) rather than a
+    full pivot_table groupby over every (line, sku) row.
+    """
+    line_cat = frame["line_name"].cat.remove_unused_categories()
+    sku_cat = frame["sku"].cat.remove_unused_categories()
+    rows = line_cat.cat.codes.to_numpy()
+    cols = sku_cat.cat.codes.to_numpy()
+    rates = pd.to_numeric(frame["calc_rate_kgph"], errors="coerce").fillna(0).to_numpy(dtype=float)
+    nz = (rates != 0) & (rows >= 0) & (cols >= 0)
+    grid = np.zeros((len(line_cat.cat.categories), len(sku_cat.cat.categories)))
+    grid[rows[nz], cols[nz]] = rates[nz]
+    return pd.DataFrame(
+        grid,
+        index=pd.Index(line_cat.cat.categories, name="line_name"),
+        columns=pd.Index(sku_cat.cat.categories, name="sku"),
+    )
+
+
+# Reruns triggered by unrelated widgets reuse the session copies; the
+# fingerprints change only when a file is rewritten or a filter changes.
+data_fp = (
+    str(csv_path),
+    csv_path.stat().st_mtime_ns,
+    sku_info_path.stat().st_mtime_ns if sku_info_path.exists() else 0,
+)
+if st.session_state.get("caps_data_fp") != data_fp:
+    st.session_state["caps_df"] = _load_caps()
+    st.session_state["caps_key_idx"] = pd.MultiIndex.from_arrays(
+        [st.session_state["caps_df"]["line_id"], st.session_state["caps_df"]["sku"].astype(str)],
+    )
+    st.session_state["caps_data_fp"] = data_fp
+df = st.session_state["caps_df"]
 
 # Filters to manage the large table
 col_f1, col_f2 = st.columns(2)
 with col_f1:
-    lines = sorted(df["line_name"].dropna().unique().tolist())
+    lines = sorted(df["line_name"].cat.categories.tolist())
     sel_lines = st.multiselect("Filter by line", options=lines, default=[], placeholder="All lines")
 with col_f2:
-    skus = sorted(df["sku"].astype(str).unique().tolist())
+    skus = sorted(df["sku"].cat.categories.tolist())
     sel_skus = st.multiselect("Filter by SKU", options=skus, default=[], placeholder="All SKUs")
 
-view = df.copy()
-if sel_lines:
-    view = view[view["line_name"].isin(sel_lines)]
-if sel_skus:
-    view = view[view["sku"].astype(str).isin(sel_skus)]
+view_fp = (data_fp, tuple(sel_lines), tuple(sel_skus))
+if st.session_state.get("caps_view_fp") != view_fp:
+    view = df
+    if sel_lines:
+        view = view.loc[view["line_name"].isin(sel_lines)]
+    if sel_skus:
+        view = view.loc[view["sku"].isin(sel_skus)]
+    st.session_state["caps_view"] = view
+    st.session_state["caps_view_fp"] = view_fp
+    st.session_state.pop("caps_pivot", None)
+view = st.session_state["caps_view"]
 
 # Pivot view
 with st.expander("Pivot view (lines x SKUs)", expanded=False):
     if not view.empty and "calc_rate_kgph" in view.columns:
-        pivot = view.pivot_table(
-            index="line_name", columns="sku", values="calc_rate_kgph", fill_value=0,
-        )
-        st.dataframe(pivot, use_container_width=True, height=min(400, 35 * len(pivot) + 50))
+        if "caps_pivot" not in st.session_state:
+            st.session_state["caps_pivot"] = _rate_pivot(view)
+        pivot = st.session_state["caps_pivot"]
+        if AgGrid is not None:
+            # Read-only grid: NO_UPDATE never posts back, and the key only
+            # changes with the data/filter fingerprint.
+            AgGrid(
+                pivot.reset_index(),
+                height=min(400, 35 * len(pivot) + 50),
+                update_mode=GridUpdateMode.NO_UPDATE,
+                key=f"caps_pivot_{abs(hash(view_fp))}",
+            )
+        else:
+            st.dataframe(pivot, use_container_width=True, height=min(400, 35 * len(pivot) + 50))
 
 st.divider()
 st.caption(f"Showing {len(view)} of {len(df)} rows")
@@ -102,14 +170,22 @@ edited = st.data_editor(
 if st.button("Save changes", type="primary"):
     to_save = edited.drop(columns=["sku_description"], errors="ignore")
     if sel_lines or sel_skus:
-        full = pd.read_csv(csv_path)
-        full["line_id"] = pd.to_numeric(full["line_id"], errors="coerce").fillna(0).astype(int)
-        if "calc_rate_kgph" not in full.columns and "rate_uph" in full.columns:
-            full = full.rename(columns={"rate_uph": "calc_rate_kgph"})
-        full.set_index(["line_id", "sku"], inplace=True)
-        edited_idx = to_save.set_index(["line_id", "sku"])
-        full.update(edited_idx)
-        full.reset_index(inplace=True)
+        # Write only the edited rows back into the session copy of the full
+        # table, located by (line_id, sku) position — no re-read or update().
+        full = df.drop(columns=["sku_description"], errors="ignore")
+        key_idx = st.session_state["caps_key_idx"]
+        pos = key_idx.get_indexer(
+            pd.MultiIndex.from_arrays([to_save["line_id"], to_save["sku"].astype(str)])
+        )
+        hit = pos >= 0
+        for col in (c for c in to_save.columns if c not in disabled_cols and c in full.columns):
+            new_vals = to_save[col].to_numpy()[hit]
+            keep = pd.notna(new_vals)
+            arr = full[col].to_numpy(copy=True)
+            if arr.dtype != new_vals.dtype:
+                arr = arr.astype(np.result_type(arr, new_vals))
+            arr[pos[hit][keep]] = new_vals[keep]
+            full[col] = arr
         safe_write_csv(full, csv_path)
     else:
         safe_write_csv(to_save, csv_path)
@@ -11,6 +11,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.csv_cache import drop_unnamed, load_csv
 from helpers.safe_io import safe_write_csv
 
 st.header("Changeovers")
@@ -21,11 +22,17 @@ if not csv_path.exists():
     st.warning(f"File not found: `{csv_path}`")
     st.stop()
 
-df = pd.read_csv(csv_path)
+df = load_csv(csv_path)
 # Clean trailing empty columns
-df = df.loc[:, ~df.columns.str.startswith("Unnamed")]
+df = drop_unnamed(df)
 
-all_skus = sorted(set(df["from_sku"].astype(str).unique()) | set(df["to_sku"].astype(str).unique()))
+df["from_sku"] = df["from_sku"].astype(str)
+df["to_sku"] = df["to_sku"].astype(str)
+all_skus = sorted(set(df["from_sku"].unique()) | set(df["to_sku"].unique()))
+# Shared categorical dtype so filters and the save-path MultiIndex use int codes
+sku_dtype = pd.CategoricalDtype(categories=all_skus)
+df["from_sku"] = df["from_sku"].astype(sku_dtype)
+df["to_sku"] = df["to_sku"].astype(sku_dtype)
 
 col1, col2 = st.columns(2)
 with col1:
@@ -33,11 +40,11 @@ with col1:
 with col2:
     to_filter = st.multiselect("Filter to_sku", options=all_skus, default=[], placeholder="All")
 
-view = df.copy()
+view = df
 if from_filter:
-    view = view[view["from_sku"].astype(str).isin(from_filter)]
+    view = view.loc[view["from_sku"].isin(from_filter)]
 if to_filter:
-    view = view[view["to_sku"].astype(str).isin(to_filter)]
+    view = view.loc[view["to_sku"].isin(to_filter)]
 
 st.caption(f"Showing {len(view)} of {len(df)} rows")
 
@@ -59,10 +66,11 @@ edited = st.data_editor(
 
 if st.button("Save changes", type="primary"):
     if from_filter or to_filter:
-        full = pd.read_csv(csv_path)
-        full = full.loc[:, ~full.columns.str.startswith("Unnamed")]
+        full = drop_unnamed(load_csv(csv_path))
+        full["from_sku"] = full["from_sku"].astype(str).astype(sku_dtype)
+        full["to_sku"] = full["to_sku"].astype(str).astype(sku_dtype)
         full.set_index(["from_sku", "to_sku"], inplace=True)
-        edited_idx = edited.set_index(["from_sku", "to_sku"])
+        edited_idx = edited.astype({"from_sku": sku_dtype, "to_sku": sku_dtype}).set_index(["from_sku", "to_sku"])
         full.update(edited_idx)
         full.reset_index(inplace=True)
         safe_write_csv(full, csv_path)
@@ -11,6 +11,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.csv_cache import load_csv
 from helpers.safe_io import safe_write_csv
 
 st.header("CIP Intervals")
@@ -27,10 +28,10 @@ if not csv_path.exists():
     st.warning(f"File not found: `{csv_path}`")
     st.stop()
 
-df = pd.read_csv(csv_path)
-df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype(int)
+df = load_csv(csv_path)
+df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype("int16")
 df["line_name"] = df["line_name"].astype(str)
-df["max_cip_hrs"] = pd.to_numeric(df["max_cip_hrs"], errors="coerce").fillna(120).astype(int)
+df["max_cip_hrs"] = pd.to_numeric(df["max_cip_hrs"], errors="coerce").fillna(120).astype("int16")
 
 edited = st.data_editor(
     df,
@@ -4,6 +4,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -11,6 +12,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.csv_cache import load_csv
 from helpers.safe_io import safe_write_csv
 
 st.header("Demand Plan")
@@ -21,19 +23,24 @@ if not csv_path.exists():
     st.warning(f"File not found: `{csv_path}`")
     st.stop()
 
-df = pd.read_csv(csv_path)
+df = load_csv(csv_path)
 
 # Cast sku to str so TextColumn config works (pandas may infer as int)
 if "sku" in df.columns:
     df["sku"] = df["sku"].astype(str)
 
 # Summary metrics
-w0 = df[df.get("due_end_hour", pd.Series(dtype=float)).fillna(999).astype(int) <= 167] if "due_end_hour" in df.columns else df[df.get("week_index", pd.Series(dtype=float)).fillna(0).astype(int) == 0]
-w1 = df.drop(w0.index)
+if "due_end_hour" in df.columns:
+    week0_mask = pd.to_numeric(df["due_end_hour"], errors="coerce").fillna(999).astype(int).to_numpy() <= 167
+elif "week_index" in df.columns:
+    week0_mask = pd.to_numeric(df["week_index"], errors="coerce").fillna(0).astype(int).to_numpy() == 0
+else:
+    week0_mask = np.ones(len(df), dtype=bool)
+w0_count = int(week0_mask.sum())
 col1, col2, col3 = st.columns(3)
 col1.metric("Total orders", len(df))
-col2.metric("Week-0", len(w0))
-col3.metric("Week-1", len(w1))
+col2.metric("Week-0", w0_count)
+col3.metric("Week-1", len(df) - w0_count)
 
 st.divider()
 
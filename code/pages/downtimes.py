@@ -11,36 +11,27 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.csv_cache import load_csv
+from helpers.data_cache import line_name_map
 from helpers.safe_io import safe_write_csv
 
 st.header("Downtimes")
 st.caption("Scheduled maintenance windows that block production on a line.")
 
 csv_path = data_dir() / "downtimes.csv"
-caps_path = data_dir() / "capabilities_rates.csv"
 
-line_names: list[str] = []
-name_to_id: dict[str, int] = {}
-if caps_path.exists():
-    caps = pd.read_csv(caps_path)
-    caps["line_id"] = pd.to_numeric(caps["line_id"], errors="coerce").fillna(0).astype(int)
-    for _, r in caps.drop_duplicates("line_name").iterrows():
-        lid = int(r["line_id"])
-        ln = str(r["line_name"]).strip()
-        if ln:
-            line_names.append(ln)
-            name_to_id[ln] = lid
-    line_names = sorted(set(line_names))
+name_to_id = line_name_map(data_dir())
+line_names = sorted(name_to_id)
 
 if csv_path.exists():
-    df = pd.read_csv(csv_path)
+    df = load_csv(csv_path)
     # Coerce numeric columns to prevent type mismatch in st.data_editor
     if "start_hour" in df.columns:
         df["start_hour"] = pd.to_numeric(df["start_hour"], errors="coerce")
     if "end_hour" in df.columns:
         df["end_hour"] = pd.to_numeric(df["end_hour"], errors="coerce")
     if "line_id" in df.columns:
-        df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype(int)
+        df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype("int16")
     # Ensure line_name column exists (backfill from line_id if needed)
     if "line_name" not in df.columns:
         id_to_name = {v: k for k, v in name_to_id.items()}
@@ -55,7 +46,7 @@ else:
 
 # Show only user-facing columns (hide line_id)
 display_cols = ["line_name", "start_hour", "end_hour", "reason"]
-display_df = df[[c for c in display_cols if c in df.columns]].copy()
+display_df = df[[c for c in display_cols if c in df.columns]]
 
 edited = st.data_editor(
     display_df,
@@ -85,8 +76,11 @@ if not edited.empty and len(edited.dropna(subset=["line_name", "start_hour", "en
         import plotly.express as px
         preview = edited.dropna(subset=["line_name", "start_hour", "end_hour"]).copy()
         anchor = pd.Timestamp("2026-02-15 00:00:00")
-        preview["Start"] = anchor + pd.to_timedelta(preview["start_hour"].astype(float), unit="h")
-        preview["End"] = anchor + pd.to_timedelta(preview["end_hour"].astype(float), unit="h")
+        # Both hour columns -> epoch nanoseconds in one array pass
+        ns = (preview[["start_hour", "end_hour"]].to_numpy(dtype=float) * 3_600_000_000_000).astype("int64")
+        ns += anchor.value
+        preview["Start"] = pd.to_datetime(ns[:, 0])
+        preview["End"] = pd.to_datetime(ns[:, 1])
         preview["label"] = preview["reason"].fillna("Downtime")
         fig = px.timeline(
             preview, x_start="Start", x_end="End", y="line_name",
@@ -100,7 +94,7 @@ if not edited.empty and len(edited.dropna(subset=["line_name", "start_hour", "en
 if st.button("Save downtimes", type="primary"):
     save_df = edited.copy()
     # Derive line_id from line_name for the CSV
-    save_df["line_id"] = save_df["line_name"].map(name_to_id)
+    save_df["line_id"] = save_df["line_name"].map(name_to_id).astype("Int16")
     # Reorder columns: line_id first for backward compat with scheduler
     out_cols = ["line_id", "line_name", "start_hour", "end_hour", "reason"]
     save_df = save_df[[c for c in out_cols if c in save_df.columns]]
@@ -4,6 +4,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 from datetime import datetime
+from itertools import accumulate
+from operator import and_
 
 import streamlit as st
 
@@ -12,7 +14,8 @@ if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
 from helpers.paths import data_dir
-from theme import metric_card, action_card, workflow_step, info_card
+from helpers.data_cache import csv_row_count, dir_stats, load_toml
+from theme import metric_card, action_card, workflow_step, info_card, grid
 
 # ── Data helpers ─────────────────────────────────────────────────────────
 
@@ -30,55 +33,50 @@ _REQUIRED_FILES = {
 }
 
 
-def _count_rows(path: Path) -> int | None:
-    """Return row count or None if file is missing / unreadable."""
-    if not path.exists():
-        return None
-    try:
-        import pandas as pd
-        return len(pd.read_csv(path))
-    except (OSError, pd.errors.ParserError, ValueError):
-        return None
+def _fmt_size(n: int) -> str:
+    if n < 1024:
+        return f"{n} B"
+    if n < 1024 ** 2:
+        return f"{n / 1024:.1f} KB"
+    return f"{n / 1024 ** 2:.1f} MB"
+
 
+_present = dir_stats(dd, (*_REQUIRED_FILES, "schedule_phase2.csv"))
 
-def _file_ready(name: str) -> bool:
-    return (dd / name).exists()
+
+# Readiness of every file the page checks, resolved once per render and
+# shared by the KPI cards, the file-details grid and the workflow steps.
+_ready_map: dict[str, bool] = {
+    name: name in _present
+    for name in (*_REQUIRED_FILES, "schedule_phase2.csv")
+}
 
 
 def _files_loaded() -> tuple[int, int]:
-    ready = sum(1 for f in _REQUIRED_FILES if _file_ready(f))
+    ready = sum(_ready_map[f] for f in _REQUIRED_FILES)
     return ready, len(_REQUIRED_FILES)
 
 
 def _schedule_status() -> str:
-    if (dd / "schedule_phase2.csv").exists():
+    if _ready_map["schedule_phase2.csv"]:
         return "Ready"
     return "Not generated"
 
 
 def _active_lines() -> str:
-    rows = _count_rows(dd / "initial_states.csv")
+    rows = csv_row_count(dd / "initial_states.csv")
     return str(rows) if rows is not None else "—"
 
 
 def _planning_horizon() -> str:
-    toml_path = dd.parent / "flowstate.toml"
-    if toml_path.exists():
-        try:
-            import tomllib
-        except ModuleNotFoundError:
-            try:
-                import tomli as tomllib  # type: ignore[no-redef]
-            except ModuleNotFoundError:
-                return "2 weeks"
-        try:
-            cfg = tomllib.loads(toml_path.read_text())
-            raw = cfg.get("scheduler", {}).get("planning_start_date", "")
-            if raw:
-                dt = datetime.strptime(str(raw).strip(), "%Y-%m-%d %H:%M:%S")
-                return dt.strftime("%b %d, %Y")
-        except (ValueError, KeyError, OSError):
-            pass
+    try:
+        cfg = load_toml(dd.parent / "flowstate.toml")
+        raw = cfg.get("scheduler", {}).get("planning_start_date", "")
+        if raw:
+            dt = datetime.strptime(str(raw).strip(), "%Y-%m-%d %H:%M:%S")
+            return dt.strftime("%b %d, %Y")
+    except (ValueError, KeyError, OSError):
+        pass
     return "2 weeks"
 
 
@@ -105,77 +103,65 @@ sched_detail = (
     "View in Schedule Viewer" if sched == "Ready" else "Run the solver to generate"
 )
 
-c1, c2, c3, c4 = st.columns(4)
-
-with c1:
-    st.markdown(
-        metric_card(
-            icon="📂",
-            value=f"{loaded} / {total}",
-            label="Data Files Loaded",
-            detail="All required inputs" if loaded == total else f"{total - loaded} files missing",
-            accent="green",
-        ),
-        unsafe_allow_html=True,
-    )
-with c2:
-    st.markdown(
-        metric_card(
-            icon="📊",
-            value=sched,
-            label="Schedule Status",
-            detail=sched_detail,
-            accent="blue",
-        ),
-        unsafe_allow_html=True,
-    )
-with c3:
-    st.markdown(
-        metric_card(
-            icon="🏭",
-            value=lines,
-            label="Active Lines",
-            detail="From initial states",
-            accent="pink",
-        ),
-        unsafe_allow_html=True,
-    )
-with c4:
-    st.markdown(
-        metric_card(
-            icon="📅",
-            value=horizon,
-            label="Planning Start",
-            detail="336 hours · 2-week horizon",
-            accent="coral",
-        ),
-        unsafe_allow_html=True,
-    )
+kpi_cards = [
+    metric_card(
+        icon="📂",
+        value=f"{loaded} / {total}",
+        label="Data Files Loaded",
+        detail="All required inputs" if loaded == total else f"{total - loaded} files missing",
+        accent="green",
+    ),
+    metric_card(
+        icon="📊",
+        value=sched,
+        label="Schedule Status",
+        detail=sched_detail,
+        accent="blue",
+    ),
+    metric_card(
+        icon="🏭",
+        value=lines,
+        label="Active Lines",
+        detail="From initial states",
+        accent="pink",
+    ),
+    metric_card(
+        icon="📅",
+        value=horizon,
+        label="Planning Start",
+        detail="336 hours · 2-week horizon",
+        accent="coral",
+    ),
+]
+# One element for the whole row rather than one delta per column
+st.markdown(grid(kpi_cards), unsafe_allow_html=True)
 
 st.markdown("<div style='height: 0.5rem'></div>", unsafe_allow_html=True)
 
 # ── File Status Detail ───────────────────────────────────────────────────
 
 with st.expander("Data file details", expanded=False):
-    cols = st.columns(4)
-    file_items = list(_REQUIRED_FILES.items())
-    for i, (fname, label) in enumerate(file_items):
-        with cols[i % 4]:
-            exists = _file_ready(fname)
-            rows = _count_rows(dd / fname) if exists else None
-            if exists:
+    # Sizes come free with the directory snapshot; exact row counts read
+    # every file, so they are only computed on request.
+    exact_counts = st.toggle("Compute exact row counts", value=False, key="home_exact_counts")
+    file_parts: list[str] = []
+    for fname, label in _REQUIRED_FILES.items():
+        if _ready_map[fname]:
+            if exact_counts:
+                rows = csv_row_count(dd / fname)
                 badge_text = f"{rows} rows" if rows is not None else "found"
-                st.markdown(
-                    f"<span style='color:#00f2c3'>●</span>&ensp;**{label}**&ensp;"
-                    f"<span style='color:#9a9a9a;font-size:0.8rem'>{badge_text}</span>",
-                    unsafe_allow_html=True,
-                )
             else:
-                st.markdown(
-                    f"<span style='color:#6c6c8a'>○</span>&ensp;**{label}**&ensp;"
-                    f"<span style='color:#6c6c8a;font-size:0.8rem'>not found</span>",
-                    unsafe_allow_html=True,
-                )
+                badge_text = _fmt_size(_present[fname].st_size)
+            file_parts.append(
+                f"<div><span style='color:#00f2c3'>●</span>&ensp;<strong>{label}</strong>&ensp;"
+                f"<span style='color:#9a9a9a;font-size:0.8rem'>{badge_text}</span></div>"
+            )
+        else:
+            file_parts.append(
+                f"<div><span style='color:#6c6c8a'>○</span>&ensp;<strong>{label}</strong>&ensp;"
+                f"<span style='color:#6c6c8a;font-size:0.8rem'>not found</span></div>"
+            )
+    st.markdown(grid(file_parts), unsafe_allow_html=True)
 
 # ── Quick Actions ────────────────────────────────────────────────────────
 
@@ -232,23 +218,22 @@ _step_defs = [
      None),
 ]
 
-schedule_exists = (dd / "schedule_phase2.csv").exists()
+schedule_exists = _ready_map["schedule_phase2.csv"]
+
+# Steps without a file count as done; prev_done[i] is "every step before i".
+_step_ready = [check_file is None or _ready_map[check_file] for _, _, check_file in _step_defs]
+prev_done = list(accumulate(_step_ready, and_, initial=True))
 
 step_html_parts: list[str] = []
 for i, (title, desc, check_file) in enumerate(_step_defs, start=1):
-    if check_file and _file_ready(check_file):
+    if check_file and _step_ready[i - 1]:
         state = "completed"
     elif check_file is None and i == 5 and schedule_exists:
         state = "completed"
     elif check_file is None and i == 7 and schedule_exists:
         state = "active"
     else:
-        prev_done = True
-        for _, _, pf in _step_defs[: i - 1]:
-            if pf and not _file_ready(pf):
-                prev_done = False
-                break
-        state = "active" if prev_done and not (check_file and _file_ready(check_file)) else "pending"
+        state = "active" if prev_done[i - 1] else "pending"
     step_html_parts.append(workflow_step(i, title, desc, state))
 
 st.markdown("".join(step_html_parts), unsafe_allow_html=True)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import sys
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
@@ -11,6 +12,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.csv_cache import load_csv
+from helpers.data_cache import capability_skus, load_toml, read_csv_cached
 from helpers.safe_io import safe_write_csv
 
 st.header("Initial States")
@@ -30,18 +33,14 @@ if not csv_path.exists():
 # ── Load Week-1 initial states selectively ───────────────────────────
 if w1_path.exists():
     if st.button("Load Week-1 Initial States as starting point"):
-        from datetime import datetime, timedelta
-
-        current = pd.read_csv(csv_path)
-        w1 = pd.read_csv(w1_path)
-        w1["line_id"] = pd.to_numeric(w1["line_id"], errors="coerce").fillna(0).astype(int)
+        current = load_csv(csv_path)
+        w1 = load_csv(w1_path)
+        w1["line_id"] = pd.to_numeric(w1["line_id"], errors="coerce").fillna(0).astype("int16")
         w1_map = {int(r["line_id"]): r for _, r in w1.iterrows()}
 
         # Read planning anchor for CIP carryover recalculation
         try:
-            import tomli
-            with open(Path(BASE_DIR).parent / "flowstate.toml", "rb") as f:
-                toml_cfg = tomli.load(f)
+            toml_cfg = load_toml(Path(BASE_DIR).parent / "flowstate.toml")
             anchor = datetime.strptime(
                 toml_cfg.get("scheduler", {}).get("planning_start_date", "2026-02-15 00:00:00"),
                 "%Y-%m-%d %H:%M:%S",
@@ -86,27 +85,27 @@ if w1_path.exists():
         )
         st.rerun()
 
-df = pd.read_csv(csv_path)
+df = read_csv_cached(csv_path)
+
+# Cast columns that pandas may read as float/int to str for TextColumn compat.
+# One assign; Arrow-backed strings avoid boxing every cell as a PyObject.
+str_cols = [c for c in ("last_cip_end_datetime", "comment", "initial_sku") if c in df.columns]
+df = df.assign(**{c: df[c].fillna("").astype("string[pyarrow]") for c in str_cols})
 
-# Cast columns that pandas may read as float/int to str for TextColumn compat
-if "last_cip_end_datetime" in df.columns:
-    df["last_cip_end_datetime"] = df["last_cip_end_datetime"].fillna("").astype(str)
-if "comment" in df.columns:
-    df["comment"] = df["comment"].fillna("").astype(str)
-if "initial_sku" in df.columns:
-    df["initial_sku"] = df["initial_sku"].astype(str)
+# data_editor ships every row to the browser; keep the payload bounded.
+MAX_EDIT_ROWS = 500
+view = df
+if len(df) > MAX_EDIT_ROWS:
+    view = df.head(MAX_EDIT_ROWS)
+    st.info(f"Showing first {MAX_EDIT_ROWS} of {len(df)} rows — the rest are saved unchanged.")
 
 # Collect known SKUs for dropdown
-caps_path = dd / "capabilities_rates.csv"
-sku_options = ["CLEAN"]
-if caps_path.exists():
-    caps = pd.read_csv(caps_path)
-    sku_options += sorted(caps["sku"].astype(str).unique().tolist())
+sku_options = ["CLEAN", *capability_skus(dd)]
 
 edited = st.data_editor(
-    df,
+    view,
     use_container_width=True,
-    height=min(600, 35 * len(df) + 50),
+    height=min(600, 35 * len(view) + 50),
     disabled=["line_id", "line_name"],
     column_config={
         "line_id": st.column_config.NumberColumn("Line ID"),
@@ -141,5 +140,8 @@ edited = st.data_editor(
 )
 
 if st.button("Save initial states", type="primary"):
+    if len(view) < len(df):
+        # Rows past the cap were not shown, so carry them over unchanged
+        edited = pd.concat([edited, df.iloc[len(view):]])
     safe_write_csv(edited, csv_path)
     st.success(f"Saved to `{csv_path.name}`")
@@ -11,6 +11,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.data_cache import read_csv_cached
 from helpers.safe_io import safe_write_csv
 
 st.header("Inventory Check")
@@ -29,7 +30,7 @@ tab_bom, tab_oh, tab_ib, tab_check = st.tabs(["BOM", "On-Hand", "Inbound", "Run
 # ── BOM tab ─────────────────────────────────────────────────────────────
 with tab_bom:
     if bom_path.exists():
-        bom_df = pd.read_csv(bom_path)
+        bom_df = read_csv_cached(bom_path, engine="pyarrow")
     else:
         bom_df = pd.DataFrame(columns=["sku", "material_id", "qty_per_unit", "material_description"])
         st.info("No BOM file found. Add rows below to create one.")
@@ -53,7 +54,7 @@ with tab_bom:
 # ── On-Hand tab ─────────────────────────────────────────────────────────
 with tab_oh:
     if onhand_path.exists():
-        oh_df = pd.read_csv(onhand_path)
+        oh_df = read_csv_cached(onhand_path)
     else:
         oh_df = pd.DataFrame(columns=["material_id", "quantity", "location", "uom", "as_of_date"])
         st.info("No On-Hand file found. Add rows below to create one.")
@@ -75,7 +76,7 @@ with tab_oh:
 # ── Inbound tab ─────────────────────────────────────────────────────────
 with tab_ib:
     if inbound_path.exists():
-        ib_df = pd.read_csv(inbound_path)
+        ib_df = read_csv_cached(inbound_path)
     else:
         ib_df = pd.DataFrame(columns=["material_id", "quantity", "arrival_hour", "arrival_date", "shipment_id", "notes"])
         st.info("No Inbound file found. Add rows below to create one.")
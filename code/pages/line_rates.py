@@ -4,6 +4,7 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -11,6 +12,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.data_cache import read_csv_cached
 from helpers.safe_io import safe_write_csv
 
 st.header("Demand Planning Line Rates")
@@ -28,11 +30,45 @@ if not csv_path.exists():
     st.warning(f"File not found: `{csv_path}`")
     st.stop()
 
-df = pd.read_csv(csv_path)
-df["line_id"] = pd.to_numeric(df["line_id"], errors="coerce").fillna(0).astype(int)
-df["line_name"] = df["line_name"].astype(str)
-df["Month"] = pd.to_numeric(df["Month"], errors="coerce").fillna(0).astype(int)
-df["rate_kgph"] = pd.to_numeric(df["rate_kgph"], errors="coerce").fillna(0.0)
+# line_name is typed at load; the numeric columns keep errors="coerce"
+# because a blank or stray cell in this hand-edited file must become 0
+# rather than fail a typed parse.
+_DTYPES = {"line_name": "str"}
+
+MAX_EDIT_ROWS = 500
+
+
+def _as_numeric(col: pd.Series, dtype: str) -> np.ndarray:
+    """Coerce *col* to *dtype* with blanks/garbage as 0, staying in ndarrays."""
+    arr = pd.to_numeric(col.to_numpy(), errors="coerce")
+    return np.nan_to_num(arr, nan=0).astype(dtype, copy=False)
+
+
+def _load_rates() -> pd.DataFrame:
+    df = read_csv_cached(csv_path, dtype=_DTYPES, engine="pyarrow")
+    df["line_id"] = _as_numeric(df["line_id"], "int16")
+    df["Month"] = _as_numeric(df["Month"], "int8")
+    df["rate_kgph"] = _as_numeric(df["rate_kgph"], "float64")
+    return df
+
+
+_KEY_COLS = ("line_id", "line_name", "Month")
+
+
+def _rate_keys(frame: pd.DataFrame) -> np.ndarray:
+    """Pack (line_id, Month) into one sortable key; NaN where either is blank."""
+    line_id = pd.to_numeric(frame["line_id"], errors="coerce").to_numpy(dtype=float)
+    month = pd.to_numeric(frame["Month"], errors="coerce").to_numpy(dtype=float)
+    return line_id * 13 + month
+
+
+# The parsed, typed table lives in session state until the file changes,
+# so reruns and filtered saves reuse it instead of re-parsing.
+data_fp = (str(csv_path), csv_path.stat().st_mtime_ns)
+if st.session_state.get("line_rates_data_fp") != data_fp:
+    st.session_state["line_rates_df"] = _load_rates()
+    st.session_state["line_rates_data_fp"] = data_fp
+df = st.session_state["line_rates_df"]
 
 # Filters
 col_f1, col_f2 = st.columns(2)
@@ -43,11 +79,20 @@ with col_f2:
     months = sorted(df["Month"].unique().tolist())
     sel_months = st.multiselect("Filter by month", options=months, default=[], placeholder="All months")
 
-view = df.copy()
-if sel_lines:
-    view = view[view["line_name"].isin(sel_lines)]
-if sel_months:
-    view = view[view["Month"].isin(sel_months)]
+view = df
+if sel_lines or sel_months:
+    mask = np.ones(len(df), dtype=bool)
+    if sel_lines:
+        mask &= df["line_name"].isin(sel_lines).to_numpy()
+    if sel_months:
+        mask &= df["Month"].isin(sel_months).to_numpy()
+    view = df.loc[mask]
+
+# data_editor ships every row to the browser; keep the payload bounded.
+truncated = len(view) > MAX_EDIT_ROWS
+if truncated:
+    view = view.head(MAX_EDIT_ROWS)
+    st.info(f"Showing first {MAX_EDIT_ROWS} rows — apply a filter to edit more.")
 
 st.caption(f"Showing {len(view)} of {len(df)} rows")
 
@@ -69,13 +114,25 @@ edited = st.data_editor(
 )
 
 if st.button("Save changes", type="primary"):
-    if sel_lines or sel_months:
-        full = pd.read_csv(csv_path)
-        full["line_id"] = pd.to_numeric(full["line_id"], errors="coerce").fillna(0).astype(int)
-        full.set_index(["line_id", "Month"], inplace=True)
-        edited_idx = edited.set_index(["line_id", "Month"])
-        full.update(edited_idx)
-        full.reset_index(inplace=True)
+    if sel_lines or sel_months or truncated:
+        # Locate the edited rows in the full table by binary search on the
+        # packed (line_id, Month) key, then write the rate columns in place.
+        full = df.copy()
+        full_keys = _rate_keys(full)
+        order = np.argsort(full_keys, kind="stable")
+        sorted_keys = full_keys[order]
+        edit_keys = _rate_keys(edited)
+        pos = np.minimum(np.searchsorted(sorted_keys, edit_keys), max(len(sorted_keys) - 1, 0))
+        hit = (sorted_keys[pos] == edit_keys) if len(sorted_keys) else np.zeros(len(edit_keys), dtype=bool)
+        rows = order[pos[hit]]
+        for col in (c for c in edited.columns if c not in _KEY_COLS and c in full.columns):
+            new_vals = edited[col].to_numpy()[hit]
+            keep = pd.notna(new_vals)
+            arr = full[col].to_numpy(copy=True)
+            if arr.dtype != new_vals.dtype:
+                arr = arr.astype(np.result_type(arr, new_vals))
+            arr[rows[keep]] = new_vals[keep]
+            full[col] = arr
         safe_write_csv(full, csv_path)
     else:
         safe_write_csv(edited, csv_path)
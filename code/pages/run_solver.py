@@ -1,10 +1,16 @@
 # pages/run_solver.py — Configure settings and launch the scheduling optimizer.
 
 from __future__ import annotations
+import io
 import json
+import os
+import shlex
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
@@ -13,8 +19,41 @@ import streamlit as st
 BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
-from helpers.paths import data_dir, load_schedule_meta
+from helpers.paths import config_path, data_dir, load_schedule_meta
+from helpers.data_cache import csv_row_counts, dir_stats, line_count as _line_count, load_toml
 from helpers.safe_io import safe_write_toml
+from helpers.solver_settings import SolverSettings
+
+try:  # optional: wake the poll loop on file events rather than the interval
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+try:  # optional: faster parse of the polled progress JSON
+    import orjson
+except ImportError:
+    orjson = None
+
+_CHANGEOVER_COST_MD = (
+    "```\n"
+    "Per-changeover cost =\n"
+    "  base_changeover_weight\n"
+    "  + topload_weight  x  topload_change\n"
+    "  + ttp_weight      x  ttp_change\n"
+    "  + ffs_weight      x  ffs_change\n"
+    "  + casepacker_weight x casepacker_change\n"
+    "  + conv_org_weight x  conv_to_org_change\n"
+    "  + cinn_weight     x  cinn_to_non\n"
+    "  + flavor_weight   x  added_flavors\n"
+    "\n"
+    "Total objective cost =\n"
+    "  changeover_weight  x  SUM(all per-changeover costs)\n"
+    "```\n\n"
+    "Set **base_changeover_weight = 0** to only penalize transitions "
+    "that involve an actual machine component change (topload, TTP, FFS, "
+    "or casepacker). Leave it > 0 to add a flat cost for every SKU-to-SKU switch."
+)
 
 st.header("Run Solver")
 
@@ -32,47 +71,28 @@ dd = data_dir()
 scheduler_py = BASE_DIR / "phase2_scheduler.py"
 python_exe = sys.executable
 
-# ── TOML helpers ─────────────────────────────────────────────────────────
-def _load_toml(path: Path) -> dict:
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib  # type: ignore
-    if not path.exists():
-        return {}
-    with open(path, "rb") as f:
-        return tomllib.load(f)
-
-
-toml_path = dd.parent / "flowstate.toml"
-if not toml_path.exists():
-    toml_path = dd / "flowstate.toml"
+toml_path = config_path()
 
-cfg = _load_toml(toml_path)
-sched = cfg.get("scheduler", {})
-cip_cfg = cfg.get("cip", {})
-obj = cfg.get("objective", {})
-co_cfg = cfg.get("changeover", {})
+cfg = load_toml(toml_path)  # cached on mtime; returns a fresh copy
+defaults = SolverSettings.from_cfg(cfg)
 
 # ── Input summary ─────────────────────────────────────────────────────────
-def _count_csv(path: Path) -> int:
-    if not path.exists():
-        return 0
-    try:
-        return max(0, len(pd.read_csv(path)))
-    except (OSError, pd.errors.ParserError, ValueError):
-        return 0
-
-dem_count = _count_csv(dd / "demand_plan.csv")
-trial_count = _count_csv(dd / "trials.csv")
-dt_count = _count_csv(dd / "downtimes.csv")
-caps_path = dd / "capabilities_rates.csv"
-line_count = 0
-if caps_path.exists():
-    try:
-        line_count = pd.read_csv(caps_path)["line_id"].nunique()
-    except (OSError, pd.errors.ParserError, KeyError):
-        pass
+# Cached on each file's mtime, so widget reruns skip the reads entirely;
+# a cold cache counts the three files concurrently.  The four files are
+# stat'ed in one directory sweep.
+_summary_stats = dir_stats(
+    dd, ("demand_plan.csv", "trials.csv", "downtimes.csv", "capabilities_rates.csv"),
+)
+dem_count, trial_count, dt_count = (
+    n or 0
+    for n in csv_row_counts(
+        [dd / "demand_plan.csv", dd / "trials.csv", dd / "downtimes.csv"], stats=_summary_stats,
+    )
+)
+try:
+    line_count = _line_count(dd, stats=_summary_stats)
+except (OSError, ValueError, KeyError):
+    line_count = 0
 
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Orders", dem_count)
@@ -82,317 +102,301 @@ col4.metric("Downtimes", dt_count)
 
 st.divider()
 
-# ── Settings form (inline) ────────────────────────────────────────────────
-with st.expander("Scheduler settings", expanded=True):
-    st.caption("Changes are saved to `flowstate.toml` when you click **Run Solver**.")
-
-    st.subheader("Solver")
-    c1, c2, c3 = st.columns(3)
-    with c1:
-        time_limit = st.number_input(
-            "Time limit (s)",
-            value=sched.get("time_limit", 120),
-            min_value=10, max_value=3600, step=10,
-            help=(
-                "How long the solver searches before returning the best solution found. "
-                "**120 s** is a good default for most problems. "
-                "Increase to **300–600 s** for large or complex schedules where solution quality matters. "
-                "Longer runs rarely improve a solution that has already found the global optimum."
-            ),
-        )
-        min_run = st.number_input(
-            "Min run hours",
-            value=sched.get("min_run_hours", 4),
-            min_value=1, max_value=24, step=1,
-            help=(
-                "Minimum consecutive production hours the solver will assign to a line/order pair. "
-                "**Suggested: 4 h.** Lower values (e.g. 2 h) allow more flexibility but produce more "
-                "changeovers. Higher values (e.g. 8 h) consolidate runs but may leave some demand unmet "
-                "if capacity is tight."
-            ),
-        )
-    with c2:
-        max_lines = st.number_input(
-            "Max lines per order",
-            value=sched.get("max_lines_per_order", 3),
-            min_value=1, max_value=14, step=1,
-            help=(
-                "Maximum number of lines that can simultaneously produce the same SKU. "
-                "**Suggested: 2–3.** Higher values spread load across lines but generate more changeovers. "
-                "Set to 1 to force each SKU onto a single line."
-            ),
-        )
-        planning_start = st.text_input(
-            "Planning start date",
-            value=sched.get("planning_start_date", "2026-02-15 00:00:00"),
-            help=(
-                "Anchor timestamp for hour 0 of the planning horizon (format: YYYY-MM-DD HH:MM:SS). "
-                "All start/end hours in every CSV are offsets from this point. "
-                "The line rates table is also filtered by the month of this date."
-            ),
-        )
-    with c3:
-        validate_after = st.checkbox(
-            "Validate after solve",
-            value=sched.get("validate", True),
-            help=(
-                "Run post-solve checks (demand bounds, no overlaps, CIP spacing, changeover timing) "
-                "and write a `validation_report.txt`. Recommended — adds only a few seconds."
-            ),
-        )
-
-    st.subheader("Rate source")
-    use_sku_rates = st.toggle(
-        "Enable SKU-specific rates",
-        value=sched.get("use_sku_rates", False),
+# ── Rate source ───────────────────────────────────────────────────────────
+# Outside the form below: its explanation depends on the toggle's value,
+# which a form would only report after submission.
+st.subheader("Rate source")
+use_sku_rates = st.toggle(
+    "Enable SKU-specific rates",
+    value=defaults.use_sku_rates,
+)
+if use_sku_rates:
+    st.warning(
+        "SKU-specific rates are based on the historical running rate for each line "
+        "and each SKU. This may affect the feasibility of meeting the demand plan, "
+        "but it may also be more accurate to 'real life'."
     )
-    if use_sku_rates:
-        st.warning(
-            "SKU-specific rates are based on the historical running rate for each line "
-            "and each SKU. This may affect the feasibility of meeting the demand plan, "
-            "but it may also be more accurate to 'real life'."
-        )
-    else:
-        st.caption(
-            "Using Demand Planning line rates (`line_rates.csv`) by default. "
-            "Enable the toggle above to use per-SKU rates from `capabilities_rates.csv`."
-        )
-
-    st.subheader("CIP")
-    c4, c5 = st.columns(2)
-    with c4:
-        cip_interval = st.number_input(
-            "CIP interval — global fallback (hours)",
-            value=cip_cfg.get("interval_h", 120),
-            min_value=24, max_value=336, step=1,
-            help=(
-                "Maximum consecutive production hours before a CIP is required, used for any line "
-                "not listed in `line_cip_hrs.csv`. "
-                "**Typical range: 96–144 h.** Per-line intervals in `line_cip_hrs.csv` take priority. "
-                "Shorter intervals mean more CIPs and less available production time."
-            ),
-        )
-    with c5:
-        cip_duration = st.number_input(
-            "CIP duration (hours)",
-            value=cip_cfg.get("duration_h", 6),
-            min_value=1, max_value=24, step=1,
-            help=(
-                "Length of each CIP block. **Typical: 4–8 h.** "
-                "Every scheduled CIP removes this many hours from a line's available production time. "
-                "This setting applies to all lines — adjust per-line cleaning needs in `line_cip_hrs.csv`."
-            ),
-        )
-
-    st.subheader("Objective weights")
-    st.caption(
-        "Weights control the trade-offs in the solver's optimization. "
-        "All weights are unit-less scalars — only their ratios matter. "
-        "Doubling one weight is equivalent to halving all others."
-    )
-    c6, c7, c8 = st.columns(3)
-    with c6:
-        w_makespan = st.number_input(
-            "Makespan weight",
-            value=obj.get("makespan_weight", 1),
-            min_value=0, max_value=10000, step=1,
-            help=(
-                "Penalty (per hour) on the time from the first start to the last end across all lines. "
-                "**Suggested: 1–5.** Raise this to compress the schedule and finish all production sooner. "
-                "Setting to 0 ignores makespan entirely (useful when changeover reduction is the sole goal)."
-            ),
-        )
-    with c7:
-        w_changeover = st.number_input(
-            "Changeover weight",
-            value=obj.get("changeover_weight", 100),
-            min_value=0, max_value=10000, step=10,
-            help=(
-                "Multiplier on the total weighted changeover cost across all lines. "
-                "**Suggested: 50–200.** Higher values strongly discourage SKU switches. "
-                "At 100 a single changeover costs as much as 100 extra hours of makespan — "
-                "increase to 500+ if reducing changeovers is the primary goal."
-            ),
-        )
-    with c8:
-        w_cip_defer = st.number_input(
-            "CIP defer weight",
-            value=obj.get("cip_defer_weight", 10),
-            min_value=0, max_value=10000, step=1,
-            help=(
-                "Reward (per hour of CIP start time) for pushing CIPs as late as the interval allows. "
-                "**Suggested: 5–20.** Higher values bunch CIPs near their deadline so production runs "
-                "are longer. Set to 0 if CIP placement doesn't matter."
-            ),
-        )
-
-    st.subheader("Machine changeover weights")
+else:
     st.caption(
-        "Per-changeover cost is built from these weights based on which machine components "
-        "change between two consecutive SKUs. The **Changeover weight** above is a global "
-        "multiplier on the sum of all per-changeover costs."
+        "Using Demand Planning line rates (`line_rates.csv`) by default. "
+        "Enable the toggle above to use per-SKU rates from `capabilities_rates.csv`."
     )
-    with st.expander("How the changeover cost is calculated"):
-        st.markdown(
-            "```\n"
-            "Per-changeover cost =\n"
-            "  base_changeover_weight\n"
-            "  + topload_weight  x  topload_change\n"
-            "  + ttp_weight      x  ttp_change\n"
-            "  + ffs_weight      x  ffs_change\n"
-            "  + casepacker_weight x casepacker_change\n"
-            "  + conv_org_weight x  conv_to_org_change\n"
-            "  + cinn_weight     x  cinn_to_non\n"
-            "  + flavor_weight   x  added_flavors\n"
-            "\n"
-            "Total objective cost =\n"
-            "  changeover_weight  x  SUM(all per-changeover costs)\n"
-            "```\n\n"
-            "Set **base_changeover_weight = 0** to only penalize transitions "
-            "that involve an actual machine component change (topload, TTP, FFS, "
-            "or casepacker). Leave it > 0 to add a flat cost for every SKU-to-SKU switch."
-        )
 
-    cm1, cm2, cm3, cm4, cm5 = st.columns(5)
-    with cm1:
-        w_base_co = st.number_input(
-            "Base changeover",
-            value=co_cfg.get("base_changeover_weight", 5),
-            min_value=0, max_value=10000, step=1,
-            help=(
-                "Flat cost added to every SKU-to-SKU transition regardless of type. "
-                "Set to 0 to only penalize machine-specific changes."
-            ),
-        )
-    with cm2:
-        w_topload = st.number_input(
-            "Topload weight",
-            value=co_cfg.get("topload_weight", 50),
-            min_value=0, max_value=10000, step=5,
-            help="Penalty for topload format changes (heaviest mechanical change).",
-        )
-    with cm3:
-        w_ttp = st.number_input(
-            "TTP weight",
-            value=co_cfg.get("ttp_weight", 10),
-            min_value=0, max_value=10000, step=5,
-            help="Penalty for TTP station changes.",
-        )
-    with cm4:
-        w_ffs = st.number_input(
-            "FFS weight",
-            value=co_cfg.get("ffs_weight", 10),
-            min_value=0, max_value=10000, step=5,
-            help="Penalty for form-fill-seal changes.",
+# ── Settings form (inline) ────────────────────────────────────────────────
+# A form, so editing a setting does not rerun the page (and re-read the
+# inputs) on every keystroke; everything is submitted with Run Solver.
+with st.form("solver_settings"):
+    with st.expander("Scheduler settings", expanded=True):
+        st.caption("Changes are saved to `flowstate.toml` when you click **Run Solver**.")
+
+        st.subheader("Solver")
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            time_limit = st.number_input(
+                "Time limit (s)",
+                value=defaults.time_limit,
+                min_value=10, max_value=3600, step=10,
+                help=(
+                    "How long the solver searches before returning the best solution found. "
+                    "**120 s** is a good default for most problems. "
+                    "Increase to **300–600 s** for large or complex schedules where solution quality matters. "
+                    "Longer runs rarely improve a solution that has already found the global optimum."
+                ),
+            )
+            min_run = st.number_input(
+                "Min run hours",
+                value=defaults.min_run_hours,
+                min_value=1, max_value=24, step=1,
+                help=(
+                    "Minimum consecutive production hours the solver will assign to a line/order pair. "
+                    "**Suggested: 4 h.** Lower values (e.g. 2 h) allow more flexibility but produce more "
+                    "changeovers. Higher values (e.g. 8 h) consolidate runs but may leave some demand unmet "
+                    "if capacity is tight."
+                ),
+            )
+        with c2:
+            max_lines = st.number_input(
+                "Max lines per order",
+                value=defaults.max_lines_per_order,
+                min_value=1, max_value=14, step=1,
+                help=(
+                    "Maximum number of lines that can simultaneously produce the same SKU. "
+                    "**Suggested: 2–3.** Higher values spread load across lines but generate more changeovers. "
+                    "Set to 1 to force each SKU onto a single line."
+                ),
+            )
+            planning_start = st.text_input(
+                "Planning start date",
+                value=defaults.planning_start_date,
+                help=(
+                    "Anchor timestamp for hour 0 of the planning horizon (format: YYYY-MM-DD HH:MM:SS). "
+                    "All start/end hours in every CSV are offsets from this point. "
+                    "The line rates table is also filtered by the month of this date."
+                ),
+            )
+        with c3:
+            validate_after = st.checkbox(
+                "Validate after solve",
+                value=defaults.validate,
+                help=(
+                    "Run post-solve checks (demand bounds, no overlaps, CIP spacing, changeover timing) "
+                    "and write a `validation_report.txt`. Recommended — adds only a few seconds."
+                ),
+            )
+
+        st.subheader("CIP")
+        c4, c5 = st.columns(2)
+        with c4:
+            cip_interval = st.number_input(
+                "CIP interval — global fallback (hours)",
+                value=defaults.interval_h,
+                min_value=24, max_value=336, step=1,
+                help=(
+                    "Maximum consecutive production hours before a CIP is required, used for any line "
+                    "not listed in `line_cip_hrs.csv`. "
+                    "**Typical range: 96–144 h.** Per-line intervals in `line_cip_hrs.csv` take priority. "
+                    "Shorter intervals mean more CIPs and less available production time."
+                ),
+            )
+        with c5:
+            cip_duration = st.number_input(
+                "CIP duration (hours)",
+                value=defaults.duration_h,
+                min_value=1, max_value=24, step=1,
+                help=(
+                    "Length of each CIP block. **Typical: 4–8 h.** "
+                    "Every scheduled CIP removes this many hours from a line's available production time. "
+                    "This setting applies to all lines — adjust per-line cleaning needs in `line_cip_hrs.csv`."
+                ),
+            )
+
+        st.subheader("Objective weights")
+        st.caption(
+            "Weights control the trade-offs in the solver's optimization. "
+            "All weights are unit-less scalars — only their ratios matter. "
+            "Doubling one weight is equivalent to halving all others."
         )
-    with cm5:
-        w_casepacker = st.number_input(
-            "Casepacker weight",
-            value=co_cfg.get("casepacker_weight", 10),
-            min_value=0, max_value=10000, step=5,
-            help="Penalty for casepacker changes.",
+        c6, c7, c8 = st.columns(3)
+        with c6:
+            w_makespan = st.number_input(
+                "Makespan weight",
+                value=defaults.makespan_weight,
+                min_value=0, max_value=10000, step=1,
+                help=(
+                    "Penalty (per hour) on the time from the first start to the last end across all lines. "
+                    "**Suggested: 1–5.** Raise this to compress the schedule and finish all production sooner. "
+                    "Setting to 0 ignores makespan entirely (useful when changeover reduction is the sole goal)."
+                ),
+            )
+        with c7:
+            w_changeover = st.number_input(
+                "Changeover weight",
+                value=defaults.changeover_weight,
+                min_value=0, max_value=10000, step=10,
+                help=(
+                    "Multiplier on the total weighted changeover cost across all lines. "
+                    "**Suggested: 50–200.** Higher values strongly discourage SKU switches. "
+                    "At 100 a single changeover costs as much as 100 extra hours of makespan — "
+                    "increase to 500+ if reducing changeovers is the primary goal."
+                ),
+            )
+        with c8:
+            w_cip_defer = st.number_input(
+                "CIP defer weight",
+                value=defaults.cip_defer_weight,
+                min_value=0, max_value=10000, step=1,
+                help=(
+                    "Reward (per hour of CIP start time) for pushing CIPs as late as the interval allows. "
+                    "**Suggested: 5–20.** Higher values bunch CIPs near their deadline so production runs "
+                    "are longer. Set to 0 if CIP placement doesn't matter."
+                ),
+            )
+
+        st.subheader("Machine changeover weights")
+        st.caption(
+            "Per-changeover cost is built from these weights based on which machine components "
+            "change between two consecutive SKUs. The **Changeover weight** above is a global "
+            "multiplier on the sum of all per-changeover costs."
         )
-
-    st.subheader("Special changeover penalties")
-    st.caption(
-        "Additional penalties for specific product transitions "
-        "flagged in `changeovers.csv`."
-    )
-    c9, c10, c11 = st.columns(3)
-    with c9:
-        w_conv_org = st.number_input(
-            "Conv → Organic penalty",
-            value=obj.get("co_conv_org_weight", co_cfg.get("conv_org_weight", 30)),
-            min_value=0, max_value=10000, step=5,
-            help=(
-                "Extra penalty when `conv_to_org_change = 1` in `changeovers.csv` "
-                "(conventional → organic recipe, requires flush & rinse, typically 1–2 h). "
-                "**Suggested: 20–50.**"
-            ),
+        with st.expander("How the changeover cost is calculated"):
+            st.markdown(_CHANGEOVER_COST_MD)
+
+        cm1, cm2, cm3, cm4, cm5 = st.columns(5)
+        with cm1:
+            w_base_co = st.number_input(
+                "Base changeover",
+                value=defaults.base_changeover_weight,
+                min_value=0, max_value=10000, step=1,
+                help=(
+                    "Flat cost added to every SKU-to-SKU transition regardless of type. "
+                    "Set to 0 to only penalize machine-specific changes."
+                ),
+            )
+        with cm2:
+            w_topload = st.number_input(
+                "Topload weight",
+                value=defaults.topload_weight,
+                min_value=0, max_value=10000, step=5,
+                help="Penalty for topload format changes (heaviest mechanical change).",
+            )
+        with cm3:
+            w_ttp = st.number_input(
+                "TTP weight",
+                value=defaults.ttp_weight,
+                min_value=0, max_value=10000, step=5,
+                help="Penalty for TTP station changes.",
+            )
+        with cm4:
+            w_ffs = st.number_input(
+                "FFS weight",
+                value=defaults.ffs_weight,
+                min_value=0, max_value=10000, step=5,
+                help="Penalty for form-fill-seal changes.",
+            )
+        with cm5:
+            w_casepacker = st.number_input(
+                "Casepacker weight",
+                value=defaults.casepacker_weight,
+                min_value=0, max_value=10000, step=5,
+                help="Penalty for casepacker changes.",
+            )
+
+        st.subheader("Special changeover penalties")
+        st.caption(
+            "Additional penalties for specific product transitions "
+            "flagged in `changeovers.csv`."
         )
-    with c10:
-        w_cinn = st.number_input(
-            "Cinnamon → Non-Cinn penalty",
-            value=obj.get("co_cinn_weight", co_cfg.get("cinn_weight", 20)),
-            min_value=0, max_value=10000, step=5,
-            help=(
-                "Extra penalty when `cinn_to_non = 1` in `changeovers.csv` "
-                "(cinnamon → non-cinnamon flavor, requires flush, typically ~1 h). "
-                "**Suggested: 15–30.**"
-            ),
+        c9, c10, c11 = st.columns(3)
+        with c9:
+            w_conv_org = st.number_input(
+                "Conv → Organic penalty",
+                value=defaults.conv_org_weight,
+                min_value=0, max_value=10000, step=5,
+                help=(
+                    "Extra penalty when `conv_to_org_change = 1` in `changeovers.csv` "
+                    "(conventional → organic recipe, requires flush & rinse, typically 1–2 h). "
+                    "**Suggested: 20–50.**"
+                ),
+            )
+        with c10:
+            w_cinn = st.number_input(
+                "Cinnamon → Non-Cinn penalty",
+                value=defaults.cinn_weight,
+                min_value=0, max_value=10000, step=5,
+                help=(
+                    "Extra penalty when `cinn_to_non = 1` in `changeovers.csv` "
+                    "(cinnamon → non-cinnamon flavor, requires flush, typically ~1 h). "
+                    "**Suggested: 15–30.**"
+                ),
+            )
+        with c11:
+            w_flavor = st.number_input(
+                "Added-flavor penalty (per flavor)",
+                value=defaults.flavor_weight,
+                min_value=0, max_value=1000, step=1,
+                help=(
+                    "Penalty per unit of `added_flavors` in `changeovers.csv`. "
+                    "**Suggested: 3–10.** At 5, going from 1 to 4 flavors adds 15 penalty "
+                    "(3 additional flavors x 5)."
+                ),
+            )
+
+    # ── Solve options ─────────────────────────────────────────────────────
+    st.divider()
+    col_a, col_b = st.columns(2)
+    with col_a:
+        two_phase = st.checkbox(
+            "Two-phase solve (Week-0 then Week-1)",
+            value=True,
+            help="Solve Week-0 first, then use the resulting line states as the starting point for Week-1. Recommended — produces tighter schedules than solving both weeks at once.",
         )
-    with c11:
-        w_flavor = st.number_input(
-            "Added-flavor penalty (per flavor)",
-            value=obj.get("co_flavor_weight", co_cfg.get("flavor_weight", 5)),
-            min_value=0, max_value=1000, step=1,
+    with col_b:
+        objective = st.selectbox(
+            "Objective mode",
+            ["balanced", "min-changeovers", "spread-load"],
+            index=0,
             help=(
-                "Penalty per unit of `added_flavors` in `changeovers.csv`. "
-                "**Suggested: 3–10.** At 5, going from 1 to 4 flavors adds 15 penalty "
-                "(3 additional flavors x 5)."
+                "**balanced** — minimize makespan + weighted changeovers (recommended). "
+                "**min-changeovers** — minimize SKU switches above all else. "
+                "**spread-load** — equalize production hours across lines."
             ),
         )
 
-# ── Solve options ─────────────────────────────────────────────────────────
-st.divider()
-col_a, col_b = st.columns(2)
-with col_a:
-    two_phase = st.checkbox(
-        "Two-phase solve (Week-0 then Week-1)",
-        value=True,
-        help="Solve Week-0 first, then use the resulting line states as the starting point for Week-1. Recommended — produces tighter schedules than solving both weeks at once.",
-    )
-with col_b:
-    objective = st.selectbox(
-        "Objective mode",
-        ["balanced", "min-changeovers", "spread-load"],
-        index=0,
-        help=(
-            "**balanced** — minimize makespan + weighted changeovers (recommended). "
-            "**min-changeovers** — minimize SKU switches above all else. "
-            "**spread-load** — equalize production hours across lines."
-        ),
-    )
+    submitted = st.form_submit_button("Run Solver", type="primary", use_container_width=True)
 
 # ── Run button ────────────────────────────────────────────────────────────
-if st.button("Run Solver", type="primary", use_container_width=True):
-    from datetime import datetime as _dt
+if submitted:
     try:
-        _dt.strptime(planning_start, "%Y-%m-%d %H:%M:%S")
+        datetime.strptime(planning_start, "%Y-%m-%d %H:%M:%S")
     except ValueError:
         st.error("Invalid **Planning start date** — must be `YYYY-MM-DD HH:MM:SS`.")
         st.stop()
-    # Save settings to TOML before launching
-    cfg["scheduler"] = {
-        "time_limit": int(time_limit),
-        "min_run_hours": int(min_run),
-        "max_lines_per_order": int(max_lines),
-        "planning_start_date": planning_start,
-        "validate": validate_after,
-        "use_sku_rates": use_sku_rates,
-    }
-    cfg["cip"] = {
-        "interval_h": int(cip_interval),
-        "duration_h": int(cip_duration),
-    }
-    cfg["objective"] = {
-        "makespan_weight": int(w_makespan),
-        "changeover_weight": int(w_changeover),
-        "cip_defer_weight": int(w_cip_defer),
-        "co_conv_org_weight": int(w_conv_org),
-        "co_cinn_weight": int(w_cinn),
-        "co_flavor_weight": int(w_flavor),
-    }
-    cfg["changeover"] = {
-        "base_changeover_weight": int(w_base_co),
-        "topload_weight": int(w_topload),
-        "ttp_weight": int(w_ttp),
-        "ffs_weight": int(w_ffs),
-        "casepacker_weight": int(w_casepacker),
-        "conv_org_weight": int(w_conv_org),
-        "cinn_weight": int(w_cinn),
-        "flavor_weight": int(w_flavor),
-    }
+    # Save settings to TOML before launching.  The number_inputs all have
+    # int value/min/max/step, so they already return ints (Streamlit
+    # rejects mixed int/float arguments); to_cfg() lays the values out in
+    # the same sections/keys from_cfg() reads them from.
+    settings = SolverSettings(
+        time_limit=time_limit,
+        min_run_hours=min_run,
+        max_lines_per_order=max_lines,
+        planning_start_date=planning_start,
+        validate=validate_after,
+        use_sku_rates=use_sku_rates,
+        interval_h=cip_interval,
+        duration_h=cip_duration,
+        makespan_weight=w_makespan,
+        changeover_weight=w_changeover,
+        cip_defer_weight=w_cip_defer,
+        conv_org_weight=w_conv_org,
+        cinn_weight=w_cinn,
+        flavor_weight=w_flavor,
+        base_changeover_weight=w_base_co,
+        topload_weight=w_topload,
+        ttp_weight=w_ttp,
+        ffs_weight=w_ffs,
+        casepacker_weight=w_casepacker,
+    )
+    cfg.update(settings.to_cfg())
     safe_write_toml(cfg, toml_path)
 
     cmd = [
@@ -406,20 +410,20 @@ if st.button("Run Solver", type="primary", use_container_width=True):
     if validate_after:
         cmd.append("--validate")
 
-    import json as _json
-
     err_file = dd / "solver_error.txt"
     kpi_file = dd / "solver_kpis.txt"
     progress_file = dd / "solver_progress.json"
 
-    for f in [err_file, kpi_file, progress_file]:
-        if f.exists():
-            f.unlink()
+    for f in (err_file, kpi_file, progress_file):
+        f.unlink(missing_ok=True)
 
     st.session_state["schedule_source"] = "solver"
     for key in ["sb_schedule", "sb_cips", "sb_holding"]:
         st.session_state.pop(key, None)
 
+    _POLL_S = 1.5       # longest wait between progress checks
+    _MIN_TICK_S = 0.25  # shortest, when the solver is printing
+
     # ── Status icons for the pipeline graphic ────────────────────────────
     _STAGE_ICON = {
         "pending": "\u23F3",   # hourglass
@@ -428,12 +432,22 @@ if st.button("Run Solver", type="primary", use_container_width=True):
         "error":   "\u274C",   # red X
     }
 
+    def _progress_sig() -> tuple[int, int, int] | None:
+        # solver_progress writes via os.replace(), so every update is a new
+        # inode; (inode, mtime, size) changes whenever the content can have.
+        try:
+            st_res = os.stat(progress_file)
+        except OSError:
+            return None
+        return st_res.st_ino, st_res.st_mtime_ns, st_res.st_size
+
     def _read_progress() -> dict:
-        if not progress_file.exists():
-            return {}
+        # Both parsers take the raw UTF-8 bytes; their decode errors are
+        # ValueErrors.  A missing file is just an OSError here.
         try:
-            return _json.loads(progress_file.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError, ValueError):
+            data = progress_file.read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
             return {}
 
     def _render_pipeline(container, stages: list[dict]) -> None:
@@ -484,22 +498,84 @@ if st.button("Run Solver", type="primary", use_container_width=True):
         if not solutions:
             return
         container.markdown("**Solutions found**")
-        rows = []
-        for s in solutions:
-            rows.append({
-                "Time (s)": s.get("wall_time", 0),
-                "Objective": f"{s.get('objective', 0):,.0f}",
-                "Note": s.get("label", ""),
-            })
+        # Built column-wise: one typed list per column instead of a dict per
+        # row that pandas has to re-infer cell by cell.
         container.dataframe(
-            pd.DataFrame(rows),
+            pd.DataFrame({
+                "Time (s)": [s.get("wall_time", 0) for s in solutions],
+                "Objective": [f"{s.get('objective', 0):,.0f}" for s in solutions],
+                "Note": [s.get("label", "") for s in solutions],
+            }),
             use_container_width=True,
             hide_index=True,
         )
 
+    def _tail_log(offset: int, final: bool = False) -> tuple[str, int, bool]:
+        """Text appended to err_file past *offset*, the new offset, and
+        whether the file was replaced (shrank) since the last read.
+
+        A trailing partial line is left for the next call unless *final*.
+        """
+        try:
+            with open(err_file, "rb") as f:
+                replaced = os.fstat(f.fileno()).st_size < offset
+                f.seek(0 if replaced else offset)
+                start = f.tell()
+                chunk = f.read()
+        except OSError:
+            return "", offset, False
+        end = len(chunk) if final else chunk.rfind(b"\n") + 1
+        text = chunk[:end].decode("utf-8", errors="replace").replace("\r\n", "\n")
+        return text, start + end, replaced
+
+    def _render_log(container, log_buf: io.StringIO) -> None:
+        with container.expander("Raw solver log", expanded=False):
+            st.code(log_buf.getvalue().rstrip("\n"), language="text")
+
+    def _pump_output(stream, sink: deque, seq: list[int], wake: threading.Event) -> None:
+        # Drain the child's stdout so it can never block on a full pipe.
+        # seq[0] counts lines ever received: the poll loop compares that one
+        # int instead of the whole (bounded, so length-capped) deque.  *wake*
+        # is set per line and on EOF, so the loop reacts without waiting out
+        # its poll interval.
+        for line in iter(stream.readline, ""):
+            sink.append(line.rstrip("\n"))
+            seq[0] += 1
+            wake.set()
+        stream.close()
+        wake.set()
+
+    def _watch_outputs(wake: threading.Event):
+        """Start a watchdog observer that sets *wake* when the progress file
+        or the log changes; None when watchdog is unavailable or fails."""
+        if Observer is None:
+            return None
+        names = {progress_file.name, err_file.name}
+
+        class _Wake(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # solver_progress lands via os.replace(): a move onto dest_path
+                paths = (event.src_path, getattr(event, "dest_path", ""))
+                if any(os.path.basename(p) in names for p in paths):
+                    wake.set()
+
+        observer = Observer()
+        try:
+            observer.schedule(_Wake(), str(dd), recursive=False)
+            observer.start()
+        except (OSError, RuntimeError):
+            return None
+        return observer
+
+    def _render_console(container, lines: list[str]) -> None:
+        if not lines:
+            return
+        with container.expander("Console output", expanded=False):
+            st.code("\n".join(lines), language="text")
+
     # ── Launch subprocess and poll ───────────────────────────────────────
     with st.status("Solving...", expanded=True) as status:
-        st.caption(f"`{' '.join(cmd)}`")
+        st.caption(f"`{shlex.join(cmd)}`")
         proc = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
@@ -512,9 +588,27 @@ if st.button("Run Solver", type="primary", use_container_width=True):
         metrics_ph = st.empty()
         solutions_ph = st.empty()
         raw_ph = st.empty()
-
-        log_lines: list[str] = []
-        prev_progress: dict = {}
+        console_ph = st.empty()
+
+        # Tracebacks and anything else the solver prints (stderr is merged
+        # into stdout), most recent lines only
+        out_lines: deque[str] = deque(maxlen=500)
+        out_seq = [0]
+        wake = threading.Event()
+        reader = threading.Thread(
+            target=_pump_output, args=(proc.stdout, out_lines, out_seq, wake), daemon=True,
+        )
+        reader.start()
+        observer = _watch_outputs(wake)
+        out_shown = 0
+
+        # Appended to as the log grows; only materialized when redrawn
+        log_buf = io.StringIO()
+        log_offset = 0
+        prev_stages: list[dict] = []
+        prev_stats: tuple[dict, dict] = ({}, {})
+        prev_sol_sig: tuple[int, float | None] = (0, None)
+        prog_sig: tuple[int, int, int] | None = None
         wall_deadline = time.monotonic() + int(time_limit) * 3 + 60
 
         while proc.poll() is None:
@@ -527,30 +621,58 @@ if st.button("Run Solver", type="primary", use_container_width=True):
                     f"(3x the time limit + 60s buffer). The process was killed."
                 )
                 break
-            time.sleep(1.5)
-
-            # Read structured progress
-            prog = _read_progress()
-            if prog and prog != prev_progress:
-                prev_progress = prog
-                with pipeline_ph.container():
-                    _render_pipeline(st, prog.get("stages", []))
-                with metrics_ph.container():
-                    _render_metrics(st, prog.get("solver_stats", {}), prog.get("data_summary", {}))
-                with solutions_ph.container():
-                    _render_solutions(st, prog.get("solutions", []))
-
-            # Read raw log
-            if err_file.exists():
-                try:
-                    lines = err_file.read_text(encoding="utf-8").strip().split("\n")
-                    if lines != log_lines:
-                        log_lines = lines
-                        with raw_ph.container():
-                            with st.expander("Raw solver log", expanded=False):
-                                st.code("\n".join(log_lines), language="text")
-                except OSError:
-                    pass
+            # Sleep until the solver prints, exits (EOF sets the event) or,
+            # with watchdog, touches its progress/log file -- at most
+            # _POLL_S; the short floor batches a burst of output into one
+            # redraw instead of one per line.
+            wake.wait(_POLL_S)
+            if reader.is_alive():
+                wake.clear()
+            time.sleep(_MIN_TICK_S)
+
+            # Read structured progress, skipping the parse when unchanged
+            sig = _progress_sig()
+            prog = _read_progress() if sig is not None and sig != prog_sig else {}
+            if prog:
+                prog_sig = sig
+            if prog:
+                # Redraw only the panels whose slice of the progress changed
+                stages = prog.get("stages", [])
+                if stages != prev_stages:
+                    prev_stages = stages
+                    with pipeline_ph.container():
+                        _render_pipeline(st, stages)
+                stats = (prog.get("solver_stats", {}), prog.get("data_summary", {}))
+                if stats != prev_stats:
+                    prev_stats = stats
+                    with metrics_ph.container():
+                        _render_metrics(st, *stats)
+                solutions = prog.get("solutions", [])
+                # Solutions are only ever appended: count + last objective
+                # identifies the list without comparing every entry
+                sol_sig = (len(solutions), solutions[-1].get("objective") if solutions else None)
+                if sol_sig != prev_sol_sig:
+                    prev_sol_sig = sol_sig
+                    with solutions_ph.container():
+                        _render_solutions(st, solutions)
+
+            # Read only what the solver appended since the last tick
+            new_text, log_offset, replaced = _tail_log(log_offset)
+            if replaced:
+                log_buf = io.StringIO()
+            if new_text or replaced:
+                log_buf.write(new_text)
+                with raw_ph.container():
+                    _render_log(st, log_buf)
+
+            if out_seq[0] != out_shown:
+                out_shown = out_seq[0]
+                with console_ph.container():
+                    _render_console(st, list(out_lines))
+
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
 
         # Final read after process exits
         rc = proc.returncode
@@ -563,11 +685,17 @@ if st.button("Run Solver", type="primary", use_container_width=True):
             with solutions_ph.container():
                 _render_solutions(st, prog.get("solutions", []))
 
-        if err_file.exists():
-            log_lines = err_file.read_text(encoding="utf-8").strip().split("\n")
+        new_text, log_offset, replaced = _tail_log(log_offset, final=True)
+        if replaced:
+            log_buf = io.StringIO()
+        log_buf.write(new_text)
+        if log_buf.tell():
             with raw_ph.container():
-                with st.expander("Raw solver log", expanded=False):
-                    st.code("\n".join(log_lines), language="text")
+                _render_log(st, log_buf)
+
+        reader.join(timeout=5)
+        with console_ph.container():
+            _render_console(st, list(out_lines))
 
         if rc == 0:
             status.update(label="Solver finished", state="complete")
@@ -17,12 +17,17 @@ if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
 from helpers.paths import data_dir
-from helpers.sandbox_engine import (
-    load_capabilities,
-    load_changeovers,
-    load_demand_targets,
-    save_sandbox_to_files,
+from helpers.data_cache import (
+    changeover_details,
+    cip_blocks as _load_cip_blocks,
+    dir_stats,
+    line_list,
+    load_toml,
+    sandbox_reference,
+    schedule_blocks as _load_schedule_blocks,
+    version_gantt_figure,
 )
+from helpers.sandbox_engine import save_sandbox_to_files, version_kpis
 from gantt_viewer import compute_changeover_details
 from components.gantt_sandbox import gantt_sandbox
 
@@ -37,11 +42,8 @@ dd = data_dir()
 
 # ── Load TOML config ────────────────────────────────────────────────────
 try:
-    import tomli
-
-    with open(Path(BASE_DIR).parent / "flowstate.toml", "rb") as f:
-        toml_cfg = tomli.load(f)
-except (ImportError, OSError, ValueError):
+    toml_cfg = load_toml(Path(BASE_DIR).parent / "flowstate.toml")
+except (OSError, ValueError):
     toml_cfg = {}
 
 planning_anchor = toml_cfg.get("scheduler", {}).get("planning_start_date", "2026-02-15 00:00:00")
@@ -50,146 +52,115 @@ min_run_hours = toml_cfg.get("scheduler", {}).get("min_run_hours", 4)
 horizon_hours = 336
 
 # ── Load reference data ─────────────────────────────────────────────────
-caps_tuples = load_capabilities(dd)  # {(line_name, sku): rate}
-changeovers_tuples = load_changeovers(dd)  # {(from_sku, to_sku): hours}
-demand = load_demand_targets(dd)  # [{order_id, sku, qty_min, qty_max}]
-
-# Convert capabilities to nested dict for React: {line: {sku: rate}}
-caps_nested: dict[str, dict[str, float]] = {}
-for (ln, sku), rate in caps_tuples.items():
-    caps_nested.setdefault(ln, {})[sku] = rate
-
-# Convert changeovers to nested dict: {from_sku: {to_sku: hours}}
-co_nested: dict[str, dict[str, float]] = {}
-for (f_sku, t_sku), hrs in changeovers_tuples.items():
-    co_nested.setdefault(f_sku, {})[t_sku] = float(hrs)
-
-
-# ── Load schedule blocks from CSV ──────────────────────────────────────
-def _load_schedule_blocks() -> list[dict]:
-    path = dd / "schedule_phase2.csv"
-    if not path.exists():
-        return []
-    df = pd.read_csv(path)
-    blocks = []
-    for i, r in df.iterrows():
-        blocks.append({
-            "id": f"sched_{i}",
-            "line_id": int(r.get("line_id", 0)),
-            "line_name": str(r.get("line_name", "")),
-            "order_id": str(r.get("order_id", "")),
-            "sku": str(r.get("sku", "")),
-            "sku_description": str(r.get("sku_description", "") or ""),
-            "start_hour": float(r.get("start_hour", 0)),
-            "end_hour": float(r.get("end_hour", 0)),
-            "run_hours": float(r.get("run_hours", 0)),
-            "is_trial": bool(r.get("is_trial", False)),
-            "block_type": "trial" if bool(r.get("is_trial", False)) else "sku",
-        })
-    return blocks
-
-
-def _load_cip_blocks() -> list[dict]:
-    path = dd / "cip_windows.csv"
-    if not path.exists():
-        return []
-    df = pd.read_csv(path)
-    blocks = []
-    for i, r in df.iterrows():
-        blocks.append({
-            "id": f"cip_{i}",
-            "line_id": int(r.get("line_id", 0)),
-            "line_name": str(r.get("line_name", "")),
-            "order_id": "CIP",
-            "sku": "CIP",
-            "start_hour": float(r.get("start_hour", 0)),
-            "end_hour": float(r.get("end_hour", 0)),
-            "run_hours": float(r.get("end_hour", 0)) - float(r.get("start_hour", 0)),
-            "is_trial": False,
-            "block_type": "cip",
-        })
-    return blocks
-
-
-# Build line info list
-def _load_lines() -> list[dict]:
-    caps_path = dd / "capabilities_rates.csv"
-    if not caps_path.exists():
-        return []
-    df = pd.read_csv(caps_path).drop_duplicates("line_name").sort_values("line_id")
-    return [{"line_id": int(r["line_id"]), "line_name": str(r["line_name"])} for _, r in df.iterrows()]
+# One directory sweep stats every sandbox input for this rerun; the loaders
+# below take their cache keys from it instead of stat-ing file by file.
+_stats = dir_stats(dd, (
+    "schedule_phase2.csv", "cip_windows.csv", "capabilities_rates.csv",
+    "line_rates.csv", "changeovers.csv", "demand_plan.csv",
+))
+# Rebuilt only when one of the input files changes; shared, so read-only.
+#   caps_tuples  {(line_name, sku): rate}
+#   rates_df     the same as a line_name/sku/rate frame
+#   caps_nested  {line: {sku: rate}}            (for React)
+#   co_nested    {from_sku: {to_sku: hours}}    (for React)
+#   demand       [{order_id, sku, qty_min, qty_max}]
+caps_tuples, rates_df, caps_nested, co_nested, demand = sandbox_reference(dd, stats=_stats)
+
+# Component payload list name -> session-state key
+_STATE_KEYS = {"schedule": "sb_schedule", "cipWindows": "sb_cips", "holdingArea": "sb_holding"}
+
+
+def _apply_ops(lists: dict[str, list[dict]], ops: list[dict]) -> None:
+    """Apply the component's upsert/remove block ops to *lists* in place."""
+    for name, blocks in lists.items():
+        list_ops = [op for op in ops if op.get("list") == name]
+        if not list_ops:
+            continue
+        index = {b.get("id"): i for i, b in enumerate(blocks)}
+        removed = set()
+        for op in list_ops:
+            if op["type"] == "upsert":
+                blk = op["block"]
+                i = index.get(blk["id"])
+                if i is None:
+                    index[blk["id"]] = len(blocks)
+                    blocks.append(blk)
+                else:
+                    blocks[i] = blk
+                removed.discard(blk["id"])
+            elif op["type"] == "remove":
+                removed.add(op["id"])
+        if removed:
+            blocks[:] = [b for b in blocks if b.get("id") not in removed]
+
+
+def _version_frame(blocks: list[dict], defaults: dict) -> pd.DataFrame:
+    """The *defaults* columns of saved-version *blocks* as a DataFrame.
+
+    Missing columns and blank cells take that column's default; a default
+    of None leaves blanks as NaN.
+    """
+    df = pd.DataFrame(blocks).reindex(columns=list(defaults))
+    return df.fillna({c: d for c, d in defaults.items() if d is not None})
 
 
 # ── Initialize / refresh session state ──────────────────────────────────
 # Reload from CSV if: (a) first visit, or (b) CSV is newer than cached data
-_sched_path = dd / "schedule_phase2.csv"
-_csv_mtime = _sched_path.stat().st_mtime if _sched_path.exists() else 0
+_sched_stat = _stats.get("schedule_phase2.csv")
+_csv_mtime = _sched_stat.st_mtime if _sched_stat is not None else 0
 _cached_mtime = st.session_state.get("sb_csv_mtime", 0)
 
 if "sb_schedule" not in st.session_state or _csv_mtime > _cached_mtime:
-    st.session_state["sb_schedule"] = _load_schedule_blocks()
-    st.session_state["sb_cips"] = _load_cip_blocks()
+    st.session_state["sb_schedule"] = _load_schedule_blocks(dd, stats=_stats)
+    st.session_state["sb_cips"] = _load_cip_blocks(dd, stats=_stats)
     st.session_state["sb_holding"] = []
+    st.session_state.pop("sb_kpis", None)
     st.session_state["sb_csv_mtime"] = _csv_mtime
+    # Remount the component so it seeds from the lists just loaded; the old
+    # mount would otherwise keep pushing ops against its own stale blocks.
+    # Promote lands here too (it drops sb_schedule before rerunning).
+    st.session_state["sb_reset_gen"] = st.session_state.get("sb_reset_gen", 0) + 1
+    st.session_state.pop("sb_last_push", None)
+    st.session_state.pop("sb_skip_push", None)
 
 schedule = st.session_state["sb_schedule"]
 cip_blocks = st.session_state["sb_cips"]
 holding = st.session_state["sb_holding"]
-lines = _load_lines()
+lines = line_list(dd, stats=_stats)
 
 if not schedule and not cip_blocks:
     st.info("No schedule loaded. Run the solver first, then return here.")
     st.stop()
 
 # ── Changeover KPIs for current sandbox schedule ──────────────────────
-_chg_csv = dd / "changeovers.csv"
-if schedule and _chg_csv.exists():
-    _co_rows = []
-    _cip_rows = []
-    for b in schedule:
-        if b.get("block_type") == "cip":
-            _cip_rows.append({
-                "line_id": b.get("line_id", 0),
-                "start_hour": b.get("start_hour", 0),
-                "end_hour": b.get("end_hour", 0),
-            })
-            continue
-        _co_rows.append({
-            "line_id": b.get("line_id", 0),
-            "Task": b.get("line_name", ""),
-            "Resource": str(b.get("sku", "")),
-            "Start": b.get("start_hour", 0),
-            "end_hour": b.get("end_hour", 0),
-        })
-    if _co_rows:
-        _co_df = pd.DataFrame(_co_rows)
-        _cip_co_df = pd.DataFrame(_cip_rows) if _cip_rows else None
-        _co_detail = compute_changeover_details(_co_df, changeovers_path=_chg_csv, cip_df=_cip_co_df)
-        if not _co_detail.empty:
-            _co_totals = _co_detail[["changeovers", "ttp", "ffs", "topload", "casepacker", "conv_to_org", "cinn_to_non"]].sum()
-            _m0, _m1, _m2, _m3, _m4, _m5, _m6 = st.columns(7)
-            _m0.metric("CHANGEOVERS", int(_co_totals["changeovers"]))
-            _m1.metric("TTP", int(_co_totals["ttp"]))
-            _m2.metric("FFS", int(_co_totals["ffs"]))
-            _m3.metric("Topload", int(_co_totals["topload"]))
-            _m4.metric("Casepacker", int(_co_totals["casepacker"]))
-            _m5.metric("Conv→Org", int(_co_totals["conv_to_org"]))
-            _m6.metric("Cinn→Non", int(_co_totals["cinn_to_non"]))
-            with st.expander("Changeover breakdown by line"):
-                st.dataframe(
-                    _co_detail.rename(columns={
-                        "line_name": "Line", "changeovers": "Total CO",
-                        "ttp": "TTP", "ffs": "FFS", "topload": "Topload",
-                        "casepacker": "Casepacker", "conv_to_org": "Conv→Org",
-                        "cinn_to_non": "Cinn→Non",
-                    }),
-                    use_container_width=True, hide_index=True,
-                )
+# Cached on the block layout, so reruns that leave the schedule alone skip it
+_co_detail = changeover_details(dd, schedule, stats=_stats)
+if not _co_detail.empty:
+    _co_totals = _co_detail[["changeovers", "ttp", "ffs", "topload", "casepacker", "conv_to_org", "cinn_to_non"]].sum()
+    _m0, _m1, _m2, _m3, _m4, _m5, _m6 = st.columns(7)
+    _m0.metric("CHANGEOVERS", int(_co_totals["changeovers"]))
+    _m1.metric("TTP", int(_co_totals["ttp"]))
+    _m2.metric("FFS", int(_co_totals["ffs"]))
+    _m3.metric("Topload", int(_co_totals["topload"]))
+    _m4.metric("Casepacker", int(_co_totals["casepacker"]))
+    _m5.metric("Conv→Org", int(_co_totals["conv_to_org"]))
+    _m6.metric("Cinn→Non", int(_co_totals["cinn_to_non"]))
+    with st.expander("Changeover breakdown by line"):
+        st.dataframe(
+            _co_detail.rename(columns={
+                "line_name": "Line", "changeovers": "Total CO",
+                "ttp": "TTP", "ffs": "FFS", "topload": "Topload",
+                "casepacker": "Casepacker", "conv_to_org": "Conv→Org",
+                "cinn_to_non": "Cinn→Non",
+            }),
+            use_container_width=True, hide_index=True,
+        )
 
 # ── Mount React component ──────────────────────────────────────────────
 # A reset counter in the key forces a full remount after "Reset from solver",
 # ensuring the React component reinitializes with fresh data.
 _reset_gen = st.session_state.get("sb_reset_gen", 0)
+_resync = st.session_state.get("sb_resync", 0)
 component_state = gantt_sandbox(
     schedule=schedule,
     cip_windows=cip_blocks,
@@ -205,24 +176,49 @@ component_state = gantt_sandbox(
         "horizon_hours": horizon_hours,
     },
     height=800,
+    resync=_resync,
     key=f"gantt_sandbox_{_reset_gen}",
 )
 
 # ── Update state from React ────────────────────────────────────────────
 # Skip component_state processing right after a reset so the cached/stale
 # component return value doesn't overwrite freshly loaded CSV data.
+# The component stamps each push with a ``seq``; reruns triggered by other
+# widgets hand back the same value, which has already been applied.
+# A push is either a full snapshot or block ops on top of push ``base``.
+# Streamlit only reports the latest value, so if the push before it was
+# never seen the ops cannot be applied: bump ``sb_resync`` so the next
+# mount asks React for a full snapshot instead.
+_push_id = (
+    (_reset_gen, component_state.get("seq"))
+    if component_state is not None and component_state.get("seq") is not None
+    else None
+)
 if st.session_state.pop("sb_just_reset", False):
     pass  # consume the flag; ignore stale component_state this cycle
-elif component_state is not None:
-    if "schedule" in component_state:
-        st.session_state["sb_schedule"] = component_state["schedule"]
-        schedule = component_state["schedule"]
-    if "cipWindows" in component_state:
-        st.session_state["sb_cips"] = component_state["cipWindows"]
-        cip_blocks = component_state["cipWindows"]
-    if "holdingArea" in component_state:
-        st.session_state["sb_holding"] = component_state["holdingArea"]
-        holding = component_state["holdingArea"]
+elif component_state is not None and (
+    _push_id is None
+    or _push_id not in (st.session_state.get("sb_last_push"), st.session_state.get("sb_skip_push"))
+):
+    if "ops" in component_state:
+        if (_reset_gen, component_state.get("base")) != st.session_state.get("sb_last_push"):
+            st.session_state["sb_skip_push"] = _push_id
+            st.session_state["sb_resync"] = _resync + 1
+            st.rerun()
+        _apply_ops(
+            {name: st.session_state[key] for name, key in _STATE_KEYS.items()},
+            component_state["ops"],
+        )
+    else:
+        for name, key in _STATE_KEYS.items():
+            if name in component_state:
+                st.session_state[key] = component_state[name]
+    st.session_state["sb_last_push"] = _push_id
+    # KPIs the component computed for this exact state (absent on old builds)
+    st.session_state["sb_kpis"] = component_state.get("kpis")
+    schedule = st.session_state["sb_schedule"]
+    cip_blocks = st.session_state["sb_cips"]
+    holding = st.session_state["sb_holding"]
     if component_state.get("lastAction"):
         st.caption(f"_Last action: {component_state['lastAction']}_")
 
@@ -265,9 +261,10 @@ with col_save:
 
 with col_reset:
     if st.button("Reset from solver", use_container_width=True):
-        st.session_state["sb_schedule"] = _load_schedule_blocks()
-        st.session_state["sb_cips"] = _load_cip_blocks()
+        st.session_state["sb_schedule"] = _load_schedule_blocks(dd, stats=_stats)
+        st.session_state["sb_cips"] = _load_cip_blocks(dd, stats=_stats)
         st.session_state["sb_holding"] = []
+        st.session_state.pop("sb_kpis", None)
         st.session_state["sb_csv_mtime"] = _csv_mtime
         st.session_state["sb_just_reset"] = True
         st.session_state["sb_reset_gen"] = st.session_state.get("sb_reset_gen", 0) + 1
@@ -293,10 +290,17 @@ from helpers.version_manager import (
 )
 from gantt_viewer import (
     load_schedule as gv_load_schedule,
-    build_gantt_figure,
     compute_changeovers,
 )
 
+# Each version row and the save form run as fragments, so toggling a
+# version's details or typing a name reruns only that block, not the CSV
+# loads and component mount above.  Anything that changes the versions
+# calls st.rerun(), which still reruns the whole page.  Fragments need
+# Streamlit 1.33+ (st.experimental_fragment before 1.37); older versions
+# run the same functions inline.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
 st.divider()
 st.subheader("Schedule Versions")
 st.caption(
@@ -305,75 +309,50 @@ st.caption(
 )
 
 # ── Save as Version ──────────────────────────────────────────────────
+# Read once per rerun; every action that changes the versions reruns.
 saved_versions = list_versions(dd)
-next_num = len(saved_versions) + 1
-ver_col1, ver_col2 = st.columns([3, 1])
-with ver_col1:
-    ver_name = st.text_input(
-        "Version name",
-        value=f"Option {next_num}",
-        key="sb_ver_name",
-        label_visibility="collapsed",
-        placeholder="Enter version name...",
-    )
-with ver_col2:
-    save_ver_clicked = st.button(
-        "Save as Version",
-        type="primary",
-        use_container_width=True,
-        disabled=len(saved_versions) >= MAX_VERSIONS,
-    )
-
-if save_ver_clicked:
-    # Compute KPIs for the current sandbox state
-    ver_co_total = 0
-    ver_makespan = 0
-    sched_only = [b for b in schedule if b.get("block_type") != "cip"]
-    if sched_only:
-        ver_makespan = max(b.get("end_hour", 0) for b in sched_only) - min(b.get("start_hour", 0) for b in sched_only)
-        prev_by_line: dict[str, str] = {}
-        for b in sorted(sched_only, key=lambda x: (x.get("line_name", ""), x.get("start_hour", 0))):
-            ln = b.get("line_name", "")
-            sk = b.get("sku", "")
-            if ln in prev_by_line and prev_by_line[ln] != sk:
-                ver_co_total += 1
-            prev_by_line[ln] = sk
-
-    # Demand adherence
-    produced_by_order: dict[str, float] = {}
-    for b in sched_only:
-        oid = b.get("order_id", "")
-        sk = b.get("sku", "")
-        ln = b.get("line_name", "")
-        rate = caps_tuples.get((ln, sk), 0)
-        produced_by_order[oid] = produced_by_order.get(oid, 0) + rate * b.get("run_hours", 0)
-    orders_met = 0
-    orders_total = len(demand)
-    for d in demand:
-        qty = produced_by_order.get(d["order_id"], 0)
-        if qty >= d["qty_min"]:
-            orders_met += 1
-    adh_pct = round(100 * orders_met / orders_total, 1) if orders_total else 0
-
-    kpis = {
-        "changeovers": ver_co_total,
-        "makespan_h": round(ver_makespan, 1),
-        "orders_met": orders_met,
-        "orders_total": orders_total,
-        "adherence_pct": adh_pct,
-    }
-    try:
-        slug = save_version(ver_name, schedule, cip_blocks, kpis, dd)
-        st.success(f"Saved version **{ver_name}**.")
-        st.rerun()
-    except ValueError as exc:
-        st.error(str(exc))
 
-if len(saved_versions) >= MAX_VERSIONS:
-    st.warning(f"Maximum of {MAX_VERSIONS} versions reached. Delete a version to save a new one.")
+
+@_fragment
+def _save_version_ui(schedule: list[dict], cip_blocks: list[dict], saved_versions: list[dict]) -> None:
+    next_num = len(saved_versions) + 1
+    ver_col1, ver_col2 = st.columns([3, 1])
+    with ver_col1:
+        ver_name = st.text_input(
+            "Version name",
+            value=f"Option {next_num}",
+            key="sb_ver_name",
+            label_visibility="collapsed",
+            placeholder="Enter version name...",
+        )
+    with ver_col2:
+        save_ver_clicked = st.button(
+            "Save as Version",
+            type="primary",
+            use_container_width=True,
+            disabled=len(saved_versions) >= MAX_VERSIONS,
+        )
+
+    if save_ver_clicked:
+        # Store the figures the KPI bar showed; recompute only when the
+        # component has not reported any for the current state.
+        kpis = st.session_state.get("sb_kpis") or version_kpis(schedule, demand, rates_df)
+        try:
+            slug = save_version(ver_name, schedule, cip_blocks, kpis, dd)
+            st.success(f"Saved version **{ver_name}**.")
+            st.rerun()
+        except ValueError as exc:
+            st.error(str(exc))
+
+    if len(saved_versions) >= MAX_VERSIONS:
+        st.warning(f"Maximum of {MAX_VERSIONS} versions reached. Delete a version to save a new one.")
+
+
+_save_version_ui(schedule, cip_blocks, saved_versions)
 
 # ── Display saved versions ───────────────────────────────────────────
-for ver in list_versions(dd):
+@_fragment
+def _version_row(ver: dict) -> None:
     slug = ver["slug"]
     meta_name = ver.get("name", slug)
     kpis = ver.get("kpis", {})
@@ -387,38 +366,29 @@ for ver in list_versions(dd):
         k3.metric("Orders Met", f"{kpis.get('orders_met', '—')}/{kpis.get('orders_total', '—')}")
         k4.metric("Adherence", f"{kpis.get('adherence_pct', '—')}%")
 
-        # Load version data for Gantt and table
-        vdata = load_version(slug, dd)
+        # Expander bodies run even when collapsed, so the version files, the
+        # Gantt figure and the tables are only built once asked for.
+        show_details = st.toggle("Show schedule details", key=f"ver_details_{slug}")
+        vdata = load_version(slug, dd) if show_details else {}
         v_sched = vdata.get("schedule", [])
 
         if v_sched:
             # Build a DataFrame for Gantt rendering
-            from datetime import datetime as _dt, timedelta as _td
+            from datetime import datetime as _dt
             try:
-                anchor_dt = _dt.strptime(planning_anchor, "%Y-%m-%d %H:%M:%S")
+                anchor_ts = pd.Timestamp(_dt.strptime(planning_anchor, "%Y-%m-%d %H:%M:%S"))
             except ValueError:
-                anchor_dt = _dt(2026, 2, 15)
-            v_rows = []
-            for b in v_sched:
-                start_dt = anchor_dt + _td(hours=float(b.get("start_hour", 0)))
-                end_dt = anchor_dt + _td(hours=float(b.get("end_hour", 0)))
-                v_rows.append({
-                    "line_id": b.get("line_id", 0),
-                    "line_name": b.get("line_name", ""),
-                    "order_id": b.get("order_id", ""),
-                    "sku": b.get("sku", ""),
-                    "sku_description": b.get("sku_description", ""),
-                    "start_hour": b.get("start_hour", 0),
-                    "end_hour": b.get("end_hour", 0),
-                    "run_hours": b.get("run_hours", 0),
-                    "Task": b.get("line_name", ""),
-                    "Resource": str(b.get("sku", "")),
-                    "Start": start_dt,
-                    "Finish": end_dt,
-                    "start_dt": start_dt.strftime("%Y-%m-%d %H:%M"),
-                    "end_dt": end_dt.strftime("%Y-%m-%d %H:%M"),
-                })
-            v_df = pd.DataFrame(v_rows)
+                anchor_ts = pd.Timestamp(2026, 2, 15)
+            v_df = _version_frame(v_sched, {
+                "line_id": 0, "line_name": "", "order_id": "", "sku": "",
+                "sku_description": "", "start_hour": 0, "end_hour": 0, "run_hours": 0,
+            })
+            v_df["Task"] = v_df["line_name"]
+            v_df["Resource"] = v_df["sku"].astype(str)
+            v_df["Start"] = anchor_ts + pd.to_timedelta(v_df["start_hour"].astype(float), unit="h")
+            v_df["Finish"] = anchor_ts + pd.to_timedelta(v_df["end_hour"].astype(float), unit="h")
+            v_df["start_dt"] = v_df["Start"].dt.strftime("%Y-%m-%d %H:%M")
+            v_df["end_dt"] = v_df["Finish"].dt.strftime("%Y-%m-%d %H:%M")
 
             # Changeover breakdown by type
             chg_csv = dd / "changeovers.csv"
@@ -449,41 +419,35 @@ for ver in list_versions(dd):
             v_cip_gantt = None
             v_cip_list = vdata.get("cip_blocks", [])
             if v_cip_list:
-                _cip_rows = []
-                for cb in v_cip_list:
-                    _cs = anchor_dt + _td(hours=float(cb.get("start_hour", 0)))
-                    _ce = anchor_dt + _td(hours=float(cb.get("end_hour", 0)))
-                    _cip_rows.append({
-                        "line_id": cb.get("line_id", 0),
-                        "Start": _cs,
-                        "Finish": _ce,
-                        "Task": cb.get("line_name", str(cb.get("line_id", ""))),
-                        "Resource": "CIP",
-                    })
-                v_cip_gantt = pd.DataFrame(_cip_rows)
-            v_fig = build_gantt_figure(v_df, cip_df=v_cip_gantt, title=meta_name)
+                v_cip_times = _version_frame(
+                    v_cip_list, {"line_id": 0, "line_name": None, "start_hour": 0, "end_hour": 0},
+                )
+                v_cip_times["Start"] = anchor_ts + pd.to_timedelta(v_cip_times["start_hour"].astype(float), unit="h")
+                v_cip_times["Finish"] = anchor_ts + pd.to_timedelta(v_cip_times["end_hour"].astype(float), unit="h")
+                v_cip_gantt = pd.DataFrame({
+                    "line_id": v_cip_times["line_id"],
+                    "Start": v_cip_times["Start"],
+                    "Finish": v_cip_times["Finish"],
+                    "Task": v_cip_times["line_name"].fillna(v_cip_times["line_id"].astype(str)),
+                    "Resource": "CIP",
+                })
+            v_fig = version_gantt_figure(dd, slug, planning_anchor, meta_name, v_df, v_cip_gantt)
             st.plotly_chart(v_fig, use_container_width=True, key=f"ver_gantt_{slug}")
 
             # Schedule table with sku_description, sorted by line then start time
             display_cols = ["line_name", "order_id", "sku", "sku_description", "start_dt", "end_dt", "run_hours"]
             avail = [c for c in display_cols if c in v_df.columns]
             v_display = v_df[avail].copy()
-            v_cip_list = vdata.get("cip_blocks", [])
             if v_cip_list:
-                cip_rows = []
-                for cb in v_cip_list:
-                    cs = anchor_dt + _td(hours=float(cb.get("start_hour", 0)))
-                    ce = anchor_dt + _td(hours=float(cb.get("end_hour", 0)))
-                    cip_rows.append({
-                        "line_name": cb.get("line_name", ""),
-                        "order_id": "CIP",
-                        "sku": "CIP",
-                        "sku_description": "",
-                        "start_dt": cs.strftime("%Y-%m-%d %H:%M"),
-                        "end_dt": ce.strftime("%Y-%m-%d %H:%M"),
-                        "run_hours": round((ce - cs).total_seconds() / 3600, 1),
-                    })
-                cip_tbl = pd.DataFrame(cip_rows)
+                cip_tbl = pd.DataFrame({
+                    "line_name": v_cip_times["line_name"].fillna(""),
+                    "order_id": "CIP",
+                    "sku": "CIP",
+                    "sku_description": "",
+                    "start_dt": v_cip_times["Start"].dt.strftime("%Y-%m-%d %H:%M"),
+                    "end_dt": v_cip_times["Finish"].dt.strftime("%Y-%m-%d %H:%M"),
+                    "run_hours": (v_cip_times["end_hour"] - v_cip_times["start_hour"]).astype(float).round(1),
+                })
                 cip_avail = [c for c in avail if c in cip_tbl.columns]
                 v_display = pd.concat([v_display, cip_tbl[cip_avail]], ignore_index=True)
             sort_cols = [c for c in ["line_name", "start_dt"] if c in v_display.columns]
@@ -496,7 +460,7 @@ for ver in list_versions(dd):
             if st.button("Save as Official Schedule", key=f"promote_{slug}", type="primary", use_container_width=True):
                 promote_version(slug, dd)
                 st.session_state["schedule_source"] = "version"
-                for k in ["sb_schedule", "sb_cips", "sb_holding"]:
+                for k in ["sb_schedule", "sb_cips", "sb_holding", "sb_kpis"]:
                     st.session_state.pop(k, None)
                 st.success(f"**{meta_name}** is now the official schedule.")
                 st.rerun()
@@ -518,8 +482,12 @@ for ver in list_versions(dd):
             except (ImportError, OSError, ValueError) as exc:
                 st.caption(f"Export unavailable: {exc}")
 
+
+for ver in saved_versions:
+    _version_row(ver)
+
 # ── Delete all versions ──────────────────────────────────────────────
-if list_versions(dd):
+if saved_versions:
     st.divider()
     if st.button("Delete all schedule versions", type="secondary"):
         delete_all_versions(dd)
@@ -11,22 +11,11 @@ import streamlit as st
 BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
-from helpers.paths import data_dir
+from helpers.paths import config_path
+from helpers.data_cache import load_toml
 from helpers.safe_io import safe_write_toml
 
 
-# ── TOML helpers ────────────────────────────────────────────────────────
-def _load_toml(path: Path) -> dict:
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib  # type: ignore
-    if not path.exists():
-        return {}
-    with open(path, "rb") as f:
-        return tomllib.load(f)
-
-
 # ── Page ────────────────────────────────────────────────────────────────
 st.header("Settings")
 st.caption("Edit scheduler parameters stored in `flowstate.toml`.")
@@ -36,11 +25,9 @@ st.info(
     icon=":material/info:",
 )
 
-toml_path = data_dir().parent / "flowstate.toml"
-if not toml_path.exists():
-    toml_path = data_dir() / "flowstate.toml"
+toml_path = config_path()
 
-cfg = _load_toml(toml_path)
+cfg = load_toml(toml_path)  # cached on mtime; returns a fresh copy
 sched = cfg.get("scheduler", {})
 cip = cfg.get("cip", {})
 obj = cfg.get("objective", {})
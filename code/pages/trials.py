@@ -11,6 +11,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 from helpers.paths import data_dir
+from helpers.csv_cache import load_csv
 from helpers.safe_io import safe_write_csv
 
 st.header("Trials")
@@ -26,14 +27,14 @@ caps_path = data_dir() / "capabilities_rates.csv"
 line_names = []
 capable_skus: dict[str, list[str]] = {}
 if caps_path.exists():
-    caps = pd.read_csv(caps_path)
+    caps = load_csv(caps_path)
     line_names = sorted(caps["line_name"].dropna().unique().tolist())
     for ln in line_names:
         sub = caps[(caps["line_name"] == ln) & (caps["capable"] == 1)]
         capable_skus[ln] = sorted(sub["sku"].astype(str).unique().tolist())
 
 if csv_path.exists():
-    df = pd.read_csv(csv_path)
+    df = load_csv(csv_path)
     # Cast numeric-looking columns to str so TextColumn config works
     if "sku" in df.columns:
         df["sku"] = df["sku"].astype(str)
@@ -0,0 +1,7 @@
+# tests/conftest.py — Put code/ on sys.path so tests import modules the way
+# the Streamlit app does (``from helpers.x import ...``).
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,19 @@
+# tests/test_data_cache.py — Sandbox block loaders in helpers/data_cache.
+
+import json
+
+from helpers.data_cache import schedule_blocks
+
+
+def test_blank_text_cells_load_as_empty_strings(tmp_path):
+    (tmp_path / "schedule_phase2.csv").write_text(
+        "line_id,line_name,order_id,sku,sku_description,start_hour,end_hour,run_hours,is_trial\n"
+        "1,L1,,S1,,0,4,4,False\n"
+        "1,L1,O2,S2,Second,4,8,4,False\n"
+    )
+    blocks = schedule_blocks(tmp_path)
+    assert blocks[0]["order_id"] == ""
+    assert blocks[0]["sku_description"] == ""
+    assert blocks[1]["order_id"] == "O2"
+    # The component receives these as JSON: no float NaN may slip through
+    json.dumps(blocks, allow_nan=False)
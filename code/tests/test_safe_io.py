@@ -0,0 +1,18 @@
+# tests/test_safe_io.py — CSV formula-injection escaping in safe_write_csv.
+
+import pandas as pd
+
+from helpers.safe_io import safe_write_csv
+
+
+def test_object_cell_is_escaped(tmp_path):
+    path = tmp_path / "out.csv"
+    safe_write_csv(pd.DataFrame({"sku": ["=1+1", "A"]}), path)
+    assert pd.read_csv(path)["sku"].tolist() == ["'=1+1", "A"]
+
+
+def test_categorical_cell_is_escaped(tmp_path):
+    path = tmp_path / "out.csv"
+    df = pd.DataFrame({"sku": pd.Series(["=1+1", "A"], dtype="category")})
+    safe_write_csv(df, path)
+    assert pd.read_csv(path)["sku"].tolist() == ["'=1+1", "A"]
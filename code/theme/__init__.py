@@ -116,6 +116,19 @@ def badge(text: str, variant: str = "ready") -> str:
     return f'<span class="fs-badge fs-badge-{variant}">{text}</span>'
 
 
+def grid(items: list[str]) -> str:
+    """Return HTML laying *items* out in the four-column ``fs-grid``.
+
+    Each item is collapsed onto one line so the blank lines inside the card
+    templates cannot end the HTML block early (markdown would then render
+    the rest as an indented code block).
+    """
+    cells = "".join(
+        "".join(line.strip() for line in item.splitlines()) for item in items
+    )
+    return f'<div class="fs-grid">{cells}</div>'
+
+
 def section_heading(text: str) -> str:
     """Return HTML for a styled section heading."""
     return f'<div class="fs-section-heading">{text}</div>'
@@ -9,7 +9,7 @@ All values are derived from style_guide.py tokens.
 
 from __future__ import annotations
 
-from .style_guide import COLORS, FONTS, RADII, SHADOWS, TRANSITIONS, GRADIENTS
+from .style_guide import COLORS, FONTS, RADII, SHADOWS, SPACING, TRANSITIONS, GRADIENTS
 
 
 def get_css() -> str:
@@ -502,6 +502,17 @@ hr, [data-testid="stDivider"] {{
     border: 1px solid rgba(255, 141, 114, 0.3);
 }}
 
+/* ── Four-column grid (one markdown block instead of st.columns) ─ */
+.fs-grid {{
+    display: grid;
+    grid-template-columns: repeat(4, minmax(0, 1fr));
+    gap: {SPACING["md"]};
+}}
+
+@media (max-width: 640px) {{
+    .fs-grid {{ grid-template-columns: minmax(0, 1fr); }}
+}}
+
 /* ── Section Heading ─────────────────────────────────────────── */
 .fs-section-heading {{
     font-size: {FONTS["size_h3"]};